@@ -1,11 +1,26 @@
-from typing import Protocol, Self, TypeVar, runtime_checkable
+from typing import (
+    Protocol,
+    Self,
+    TypeVar,
+    runtime_checkable,
+    cast,
+    Tuple,
+    List,
+    Sequence,
+)
+import math
 from abstract_algebra.abstract_structures.monoid import additive_identity
 from abstract_algebra.abstract_structures.group import additive_inverse
-from abstract_algebra.abstract_structures.ring import RingProtocol
+from abstract_algebra.abstract_structures.ring import (
+    RingProtocol,
+    multiplicative_identity,
+)
 
 
 @runtime_checkable
 class EuclideanRingProtocol(RingProtocol, Protocol):
+    __slots__ = ()
+
     def __eq__(self, other) -> bool:
         raise NotImplementedError(f"'==' not implemented for {type(self)}")
 
@@ -41,14 +56,132 @@ E = TypeVar("E", bound=EuclideanRingProtocol)
 
 
 def generalized_gcd(numerator: E, denominator: E) -> E:
+    """
+    the greatest common divisor by the euclidean algorithm
+    (ints are handed to math.gcd)
+    """
+    if isinstance(numerator, int) and isinstance(denominator, int):
+        return cast(E, math.gcd(numerator, denominator))
     zero = additive_identity(denominator)
     if numerator < zero:
         numerator = additive_inverse(numerator)
     if denominator < zero:
         denominator = additive_inverse(denominator)
-    if denominator == zero:
-        return numerator
-    elif numerator < denominator:
-        return generalized_gcd(denominator, numerator)
-    else:
-        return generalized_gcd(numerator % denominator, denominator)
+    while not denominator == zero:
+        if numerator < denominator:
+            numerator, denominator = denominator, numerator
+        else:
+            numerator = numerator % denominator
+            if numerator < zero:
+                numerator = additive_inverse(numerator)
+    return numerator
+
+
+def extended_gcd(a: E, b: E) -> Tuple[E, E, E]:
+    """
+    the extended euclidean algorithm
+
+    :return: g, x, y with a * x + b * y = g where g is a greatest common divisor of a and b
+    """
+    zero = additive_identity(a)
+    one = multiplicative_identity(a)
+    old_r, r = a, b
+    old_x, x = one, zero
+    old_y, y = zero, one
+    while not r == zero:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < zero:
+        return (
+            additive_inverse(old_r),
+            additive_inverse(old_x),
+            additive_inverse(old_y),
+        )
+    return old_r, old_x, old_y
+
+
+def product_tree(values: Sequence[E]) -> List[List[E]]:
+    """
+    the levels of the product tree of the values:
+    level 0 are the values, every further level multiplies neighbouring pairs
+    and the last level holds the product of all values
+    """
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append(
+            [
+                level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+        )
+    return tree
+
+
+def remainder_tree(value: E, tree: List[List[E]], square: bool = False) -> List[E]:
+    """
+    reduce a value modulo every leaf of a product tree (modulo its square if square)
+    by reducing it down the tree, so large remainders are only computed near the root
+
+    :param value: the value to reduce
+    :param tree: a product tree (see product_tree)
+    :param square: reduce modulo the squares of the nodes
+    :return: value mod leaf (value mod leaf^2) for every leaf of the tree
+    """
+    remainders = [value]
+    for level in reversed(tree):
+        remainders = [
+            remainders[i // 2] % (node * node if square else node)
+            for i, node in enumerate(level)
+        ]
+    return remainders
+
+
+def batch_gcd(values: Sequence[E]) -> List[E]:
+    """
+    Bernstein's batch gcd: the gcd of every value with the product of all the other values,
+    i.e. which values share a factor with any other value
+
+    one product tree and one remainder tree replace the len(values)^2 pairwise gcds
+
+    :param values: nonzero values
+    :return: gcd(values[i], product of values[j] for j != i) for every i
+    """
+    if len(values) < 2:
+        return [multiplicative_identity(value) for value in values]
+    tree = product_tree(values)
+    remainders = remainder_tree(tree[-1][0], tree, square=True)
+    return [
+        generalized_gcd(remainder // value, value)
+        for remainder, value in zip(remainders, values)
+    ]
+
+
+def batch_reduce(
+    numerators: Sequence[E], denominators: Sequence[E]
+) -> Tuple[List[E], List[E]]:
+    """
+    divide every numerator / denominator pair by its greatest common divisor
+
+    :param numerators: the numerators
+    :param denominators: the denominators (same length as numerators)
+    :return: the reduced numerators, the reduced denominators
+    """
+    if len(numerators) != len(denominators):
+        raise TypeError(
+            f"Every numerator needs a denominator: "
+            f"Mismatched lengths: {len(numerators)} | {len(denominators)}"
+        )
+    reduced_numerators, reduced_denominators = [], []
+    gcd = generalized_gcd
+    q: E
+    for numerator, denominator in zip(numerators, denominators):
+        if isinstance(numerator, int) and isinstance(denominator, int):
+            q = cast(E, math.gcd(numerator, denominator))
+        else:
+            q = gcd(numerator, denominator)
+        reduced_numerators.append(numerator // q)
+        reduced_denominators.append(denominator // q)
+    return reduced_numerators, reduced_denominators
@@ -1,4 +1,13 @@
-from typing import Protocol, Self, runtime_checkable, TypeVar
+from typing import (
+    Protocol,
+    Self,
+    runtime_checkable,
+    TypeVar,
+    Dict,
+    Type,
+    Callable,
+    Any,
+)
 from abstract_algebra.abstract_structures.monoid import additive_identity
 from abstract_algebra.abstract_structures.ring import (
     RingProtocol,
@@ -8,6 +17,8 @@ from abstract_algebra.abstract_structures.ring import (
 
 @runtime_checkable
 class FieldProtocol(RingProtocol, Protocol):
+    __slots__ = ()
+
     def __eq__(self, other) -> bool:
         raise NotImplementedError(f"'==' not implemented for {type(self)}")
 
@@ -33,7 +44,32 @@ class FieldProtocol(RingProtocol, Protocol):
 F = TypeVar("F", bound=FieldProtocol)
 
 
+# how to invert the elements of every type seen so far (see register_multiplicative_inverse)
+_multiplicative_inverses: Dict[Type, Callable[[Any], Any]] = {}
+
+
+def register_multiplicative_inverse(cls: Type[F], inverse: Callable[[F], F]) -> None:
+    """
+    register how to invert the elements of a type,
+    by default an element f is inverted as multiplicative_identity(f) / f
+
+    :param cls: the type
+    :param inverse: maps a nonzero element to its inverse,
+        it has to raise a ZeroDivisionError for the additive identity
+    """
+    _multiplicative_inverses[cls] = inverse
+
+
 def multiplicative_inverse(f: F) -> F:
+    inverse = _multiplicative_inverses.get(type(f))
+    if inverse is None:
+        inverse = _multiplicative_inverses.setdefault(
+            type(f), _multiplicative_inverse_by_division
+        )
+    return inverse(f)
+
+
+def _multiplicative_inverse_by_division(f: F) -> F:
     if f == additive_identity(f):
         raise ZeroDivisionError(
             f"Cannot find the multiplicative inverse of the additive identity of the field: {f}"
@@ -7,6 +7,8 @@ from abstract_algebra.abstract_structures.monoid import (
 
 @runtime_checkable
 class GroupProtocol(MonoidProtocol, Protocol):
+    __slots__ = ()
+
     def __eq__(self, other) -> bool:
         raise NotImplementedError(f"'==' not implemented for {type(self)}")
 
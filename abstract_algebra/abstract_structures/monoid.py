@@ -1,8 +1,20 @@
-from typing import Protocol, Self, TypeVar, runtime_checkable, cast
+from typing import (
+    Protocol,
+    Self,
+    TypeVar,
+    runtime_checkable,
+    cast,
+    Dict,
+    Type,
+    Callable,
+    Any,
+)
 
 
 @runtime_checkable
 class MonoidProtocol(Protocol):
+    __slots__ = ()
+
     def __eq__(self, other) -> bool:
         raise NotImplementedError(f"'==' not implemented for {type(self)}")
 
@@ -12,26 +24,57 @@ class MonoidProtocol(Protocol):
 
 @runtime_checkable
 class MonoidExplicitIdentity(MonoidProtocol, Protocol):
+    __slots__ = ()
+
     def get_additive_identity(self) -> Self:
         raise NotImplementedError(f"Not Implemented")
 
 
 M = TypeVar("M", bound=MonoidProtocol)
 
+# how to find the additive identity of every type seen so far (see register_additive_identity)
+_additive_identities: Dict[Type, Callable[[Any], Any]] = {}
+
+
+def register_additive_identity(cls: Type[M], identity: Callable[[M], M]) -> None:
+    """
+    register how to find the additive identity of a type,
+    overriding the lookup through MonoidProtocol / MonoidExplicitIdentity
+
+    :param cls: the type
+    :param identity: maps an element of the type to the additive identity of its monoid
+    """
+    _additive_identities[cls] = identity
+
 
 def additive_identity(m: M) -> M:
+    identity = _additive_identities.get(type(m))
+    if identity is None:
+        identity = _resolve_additive_identity(m)
+        _additive_identities[type(m)] = identity
+    return cast(M, identity(m))
+
+
+def _resolve_additive_identity(m: Any) -> Callable[[Any], Any]:
+    """
+    find out (once per type) how to get the additive identity of its elements
+    """
     if isinstance(m, int):
-        return cast(M, 0)
+        return lambda m: 0
     elif isinstance(m, float):
-        return cast(M, 0.0)
+        return lambda m: 0.0
     elif isinstance(m, MonoidExplicitIdentity):
-        return cast(M, m.get_additive_identity())
+        return type(m).get_additive_identity
     else:
-        try:
-            return cast(M, getattr(m, "__sub__")(m))
-        except Exception as e:
-            raise TypeError(
-                f"Unable to find additive identity for Monoid of type '{type(m)}': {m}."
-                f"Monoid needs to be an int, float, or equipped with .get_additive_identity or -"
-                f"to find additive identity"
-            )
+        return _additive_identity_by_subtraction
+
+
+def _additive_identity_by_subtraction(m: M) -> M:
+    try:
+        return cast(M, getattr(m, "__sub__")(m))
+    except Exception as e:
+        raise TypeError(
+            f"Unable to find additive identity for Monoid of type '{type(m)}': {m}."
+            f"Monoid needs to be an int, float, or equipped with .get_additive_identity or -"
+            f"to find additive identity"
+        )
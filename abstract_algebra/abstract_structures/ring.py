@@ -1,9 +1,21 @@
-from typing import Protocol, Self, TypeVar, runtime_checkable, cast
+from typing import (
+    Protocol,
+    Self,
+    TypeVar,
+    runtime_checkable,
+    cast,
+    Dict,
+    Type,
+    Callable,
+    Any,
+)
 from abstract_algebra.abstract_structures.group import GroupProtocol
 
 
 @runtime_checkable
 class RingProtocol(GroupProtocol, Protocol):
+    __slots__ = ()
+
     def __eq__(self, other) -> bool:
         raise NotImplementedError(f"'==' not implemented for {type(self)}")
 
@@ -22,26 +34,57 @@ class RingProtocol(GroupProtocol, Protocol):
 
 @runtime_checkable
 class RingExplicitIdentity(RingProtocol, Protocol):
+    __slots__ = ()
+
     def get_multiplicative_identity(self) -> Self:
         raise NotImplementedError(f"Not Implemented")
 
 
 R = TypeVar("R", bound=RingProtocol)
 
+# how to find the multiplicative identity of every type seen so far (see register_multiplicative_identity)
+_multiplicative_identities: Dict[Type, Callable[[Any], Any]] = {}
+
+
+def register_multiplicative_identity(cls: Type[R], identity: Callable[[R], R]) -> None:
+    """
+    register how to find the multiplicative identity of a type,
+    overriding the lookup through RingExplicitIdentity
+
+    :param cls: the type
+    :param identity: maps an element of the type to the multiplicative identity of its ring
+    """
+    _multiplicative_identities[cls] = identity
+
 
 def multiplicative_identity(r: R) -> R:
+    identity = _multiplicative_identities.get(type(r))
+    if identity is None:
+        identity = _resolve_multiplicative_identity(r)
+        _multiplicative_identities[type(r)] = identity
+    return cast(R, identity(r))
+
+
+def _resolve_multiplicative_identity(r: Any) -> Callable[[Any], Any]:
+    """
+    find out (once per type) how to get the multiplicative identity of its elements
+    """
     if isinstance(r, int):
-        return cast(R, 1)
+        return lambda r: 1
     elif isinstance(r, float):
-        return cast(R, 1.0)
+        return lambda r: 1.0
     elif isinstance(r, RingExplicitIdentity):
-        return cast(R, r.get_multiplicative_identity())
+        return type(r).get_multiplicative_identity
     else:
-        try:
-            return cast(R, getattr(r, "__truediv__")(r))
-        except Exception as e:
-            raise TypeError(
-                f"Unable to find multiplicative identity for Ring of type '{type(r)}': {r}."
-                f"Ring needs to be an int, float, or equipped with .get_multiplicative_identity or /"
-                f"to find multiplicative identity"
-            )
+        return _multiplicative_identity_by_division
+
+
+def _multiplicative_identity_by_division(r: R) -> R:
+    try:
+        return cast(R, getattr(r, "__truediv__")(r))
+    except Exception as e:
+        raise TypeError(
+            f"Unable to find multiplicative identity for Ring of type '{type(r)}': {r}."
+            f"Ring needs to be an int, float, or equipped with .get_multiplicative_identity or /"
+            f"to find multiplicative identity"
+        )
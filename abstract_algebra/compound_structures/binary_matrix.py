@@ -0,0 +1,189 @@
+from typing import Tuple, Iterable, Iterator, Any, overload, Union
+from dataclasses import dataclass
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+
+
+@dataclass(init=True, frozen=True, eq=True)
+class BinaryMatrix:
+    """
+    a matrix over GF(2) with every row packed into a python int:
+    bit j of rows[i] is the entry (i, j)
+
+    adding two rows is a single XOR,
+    vectors over GF(2) are packed the same way (bit j is entry j)
+    """
+
+    shape: Tuple[int, int]
+    rows: Tuple[int, ...]
+
+    def __post_init__(self):
+        if len(self.rows) != self.shape[0]:
+            raise TypeError(
+                f"BinaryMatrix of shape {self.shape} needs {self.shape[0]} rows: "
+                f"Mismatched dims: {len(self.rows)} | {self.shape[0]}"
+            )
+        for row in self.rows:
+            if row < 0 or row.bit_length() > self.shape[1]:
+                raise TypeError(
+                    f"Row doesn't fit into BinaryMatrix of shape {self.shape}: {row:b}"
+                )
+
+    @classmethod
+    def new_binary_matrix(cls, entries: Iterable[Iterable[Any]]) -> "BinaryMatrix":
+        """
+        build a binary matrix out of rows of 0 / 1 (ints, bools or GF(2) elements)
+        """
+        rows = [list(row) for row in entries]
+        column_count = len(rows[0]) if rows else 0
+        for row in rows:
+            if len(row) != column_count:
+                raise TypeError(
+                    f"All rows of the matrix need to be of the same length: "
+                    f"Mismatched lengths: {len(row)} | {column_count}"
+                )
+        return cls(
+            shape=(len(rows), column_count),
+            rows=tuple(pack_vector(row) for row in rows),
+        )
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix[PrimeFieldElement]) -> "BinaryMatrix":
+        return cls(shape=matrix.shape, rows=tuple(pack_vector(row) for row in matrix))
+
+    def to_matrix(self) -> Matrix[PrimeFieldElement]:
+        return Matrix.new_matrix_unchecked(
+            [unpack_vector(row, self.shape[1]) for row in self.rows]
+        )
+
+    def __repr__(self) -> str:
+        return f"abstract_algebra.modules.BinaryMatrix(shape={self.shape})"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            " ".join(str((row >> j) & 1) for j in range(self.shape[1]))
+            for row in self.rows
+        )
+
+    def __getitem__(self, index: int) -> int:
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[int]:
+        for row in self.rows:
+            yield row
+
+    def entry(self, i: int, j: int) -> int:
+        return (self.rows[i] >> j) & 1
+
+    def transpose(self) -> "BinaryMatrix":
+        columns = [0] * self.shape[1]
+        for i, row in enumerate(self.rows):
+            for j in set_bits(row):
+                columns[j] |= 1 << i
+        return BinaryMatrix(shape=(self.shape[1], self.shape[0]), rows=tuple(columns))
+
+    def apply(self, bits: int) -> int:
+        """
+        multiply with a packed vector: bit i of the result is the parity of rows[i] & bits
+        """
+        result = 0
+        for i, row in enumerate(self.rows):
+            if (row & bits).bit_count() & 1:
+                result |= 1 << i
+        return result
+
+    def _validate_elementwise_operation(self, other: Any, operator: str) -> bool:
+        if self.shape != other.shape:
+            raise TypeError(
+                f"unsupported operand type(s) for {operator}: "
+                f"'BinaryMatrix' of size {self.shape} and 'BinaryMatrix' of size {other.shape}"
+            )
+        return True
+
+    def __add__(self, other: "BinaryMatrix") -> "BinaryMatrix":
+        if not isinstance(other, BinaryMatrix):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "+")
+        return BinaryMatrix(
+            shape=self.shape, rows=tuple(a ^ b for a, b in zip(self.rows, other.rows))
+        )
+
+    def __sub__(self, other: "BinaryMatrix") -> "BinaryMatrix":
+        if not isinstance(other, BinaryMatrix):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "-")
+        return self + other
+
+    def _validate_matmul(self, other_shape: Tuple[int, int], other_name: str) -> bool:
+        if self.shape[1] != other_shape[0]:
+            raise TypeError(
+                f"unsupported operand type(s) for @: "
+                f"'BinaryMatrix' of size {self.shape} incompatible with"
+                f"'{other_name}' of size {other_shape}"
+            )
+        return True
+
+    @overload
+    def __matmul__(self, other: "BinaryMatrix") -> "BinaryMatrix": ...
+
+    @overload
+    def __matmul__(
+        self, other: Vector[PrimeFieldElement]
+    ) -> Vector[PrimeFieldElement]: ...
+
+    def __matmul__(
+        self, other: Union["BinaryMatrix", Vector[PrimeFieldElement]]
+    ) -> Union["BinaryMatrix", Vector[PrimeFieldElement]]:
+        if isinstance(other, BinaryMatrix):
+            self._validate_matmul(other.shape, "BinaryMatrix")
+            rows = []
+            for row in self.rows:
+                result_row = 0
+                for k in set_bits(row):
+                    result_row ^= other.rows[k]
+                rows.append(result_row)
+            return BinaryMatrix(shape=(self.shape[0], other.shape[1]), rows=tuple(rows))
+        elif isinstance(other, Vector):
+            self._validate_matmul((len(other), 1), f"Vector[{other.field}]")
+            return unpack_vector(self.apply(pack_vector(other)), self.shape[0])
+        else:
+            return NotImplemented
+
+
+def set_bits(bits: int) -> Iterator[int]:
+    """
+    the indexes of the set bits of a packed row, in increasing order
+    """
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def pack_vector(entries: Iterable[Any]) -> int:
+    """
+    pack 0 / 1 entries (ints, bools or GF(2) elements) into an int, entry j becomes bit j
+    """
+    bits = 0
+    for j, entry in enumerate(entries):
+        if isinstance(entry, PrimeFieldElement):
+            if entry.modulus != 2:
+                raise TypeError(
+                    f"Only GF(2) entries can be packed: GF({entry.modulus})"
+                )
+            entry = entry.value
+        if entry not in (0, 1):
+            raise TypeError(f"Only 0 / 1 entries can be packed: {entry}")
+        if entry:
+            bits |= 1 << j
+    return bits
+
+
+def unpack_vector(bits: int, length: int) -> Vector[PrimeFieldElement]:
+    """
+    unpack the lowest "length" bits of an int into a vector over GF(2)
+    """
+    return Vector.new_vector_unchecked(
+        tuple(PrimeFieldElement((bits >> j) & 1, 2) for j in range(length))
+    )
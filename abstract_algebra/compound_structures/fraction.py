@@ -1,10 +1,29 @@
-from typing import Union, Generic, TypeVar, Type, Optional
-from abstract_algebra.abstract_structures.monoid import additive_identity
+from typing import (
+    Union,
+    Generic,
+    TypeVar,
+    Type,
+    Optional,
+    Sequence,
+    List,
+    Tuple,
+    cast,
+)
+import math
+from abstract_algebra.abstract_structures.monoid import (
+    additive_identity,
+    register_additive_identity,
+)
 from abstract_algebra.abstract_structures.group import additive_inverse
-from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.ring import (
+    multiplicative_identity,
+    register_multiplicative_identity,
+)
+from abstract_algebra.abstract_structures.field import register_multiplicative_inverse
 from abstract_algebra.abstract_structures.euclidean_ring import (
     EuclideanRingProtocol,
     generalized_gcd,
+    batch_reduce,
 )
 
 
@@ -12,10 +31,24 @@ E = TypeVar("E", bound=EuclideanRingProtocol)
 
 
 class Fraction(Generic[E]):
+    __slots__ = ("numerator", "denominator", "ring")
     numerator: E
     denominator: E
     ring: Type  # The type of E
 
+    def __new__(cls, numerator: E, denominator: Optional[E] = None) -> "Fraction[E]":
+        # fractions of python ints are Rationals (see below)
+        if (
+            cls is Fraction
+            and type(numerator) is int
+            and (denominator is None or type(denominator) is int)
+        ):
+            return cast(
+                Fraction[E],
+                Rational(cast(int, numerator), cast(Optional[int], denominator)),
+            )
+        return super().__new__(cls)
+
     def __init__(self, numerator: E, denominator: Optional[E] = None):
         zero = additive_identity(numerator)
         one = multiplicative_identity(numerator)
@@ -38,12 +71,76 @@ class Fraction(Generic[E]):
                 f"type(denominator)={type(denominator)}"
             )
 
+    @classmethod
+    def new_fractions(
+        cls, numerators: Sequence[E], denominators: Sequence[E]
+    ) -> List["Fraction[E]"]:
+        """
+        create many fractions at once (e.g. from parsed data)
+        the pairs are reduced by batch_reduce instead of one constructor call at a time
+
+        :param numerators: the numerators
+        :param denominators: the denominators (same length as numerators)
+        :return: Fraction(numerator, denominator) for every pair
+        """
+        if not numerators:
+            return []
+        zero = additive_identity(numerators[0])
+        one = multiplicative_identity(numerators[0])
+        ring = type(numerators[0])
+        signed_numerators, signed_denominators = [], []
+        for numerator, denominator in zip(numerators, denominators):
+            if not isinstance(numerator, ring) or not isinstance(denominator, ring):
+                raise TypeError(
+                    f"numerator and denominator have to be the same type: type(numerator)={type(numerator)} | "
+                    f"type(denominator)={type(denominator)}"
+                )
+            if denominator == zero:
+                raise ZeroDivisionError(
+                    f"Cannot set denominator to additive_identity: {zero}"
+                )
+            if numerator == zero:
+                denominator = one
+            elif numerator < zero and denominator < zero:
+                numerator = additive_inverse(numerator)
+                denominator = additive_inverse(denominator)
+            signed_numerators.append(numerator)
+            signed_denominators.append(denominator)
+        reduced_numerators, reduced_denominators = batch_reduce(
+            signed_numerators, signed_denominators
+        )
+        return [
+            cls._new_reduced(numerator, denominator, ring)
+            for numerator, denominator in zip(reduced_numerators, reduced_denominators)
+        ]
+
+    @classmethod
+    def _new_reduced(cls, numerator: E, denominator: E, ring: Type) -> "Fraction[E]":
+        """
+        create a fraction out of an already reduced numerator and denominator
+        """
+        if ring is int:
+            return cast(
+                Fraction[E],
+                Rational._new_reduced(cast(int, numerator), cast(int, denominator)),
+            )
+        fraction = object.__new__(cls)
+        fraction.numerator = numerator
+        fraction.denominator = denominator
+        fraction.ring = ring
+        return fraction
+
     def __str__(self) -> str:
         return f"({self.numerator})/({self.denominator})"
 
     def __repr__(self) -> str:
         return f"Fraction[{self.ring}]({self.numerator},{self.denominator})"
 
+    def __reduce__(self) -> Tuple[Type["Fraction[E]"], Tuple[E, E]]:
+        # there is no __dict__ and __new__ needs the terms, so copy and pickle rebuild
+        # the fraction through the constructor (Rationals come back interned)
+        return type(self), (self.numerator, self.denominator)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, Fraction):
             if self.ring != other.ring:
@@ -139,12 +236,239 @@ class Fraction(Generic[E]):
             return NotImplemented
 
     def get_additive_identity(self) -> "Fraction[E]":
-        return Fraction(
-            additive_identity(self.numerator), multiplicative_identity(self.numerator)
+        return Fraction._new_reduced(
+            additive_identity(self.numerator),
+            multiplicative_identity(self.numerator),
+            self.ring,
         )
 
     def get_multiplicative_identity(self) -> "Fraction":
-        return Fraction(
-            multiplicative_identity(self.numerator),
-            multiplicative_identity(self.numerator),
+        one = multiplicative_identity(self.numerator)
+        return Fraction._new_reduced(one, one, self.ring)
+
+
+def _fraction_inverse(fraction: Fraction[E]) -> Fraction[E]:
+    """
+    the inverse of a reduced fraction is reduced as well, it only needs its signs fixed
+    """
+    numerator, denominator = fraction.numerator, fraction.denominator
+    zero = additive_identity(numerator)
+    if numerator == zero:
+        raise ZeroDivisionError(
+            f"Cannot find the multiplicative inverse of the additive identity of the field: {fraction}"
+        )
+    if numerator < zero and denominator < zero:
+        numerator = additive_inverse(numerator)
+        denominator = additive_inverse(denominator)
+    return Fraction._new_reduced(denominator, numerator, fraction.ring)
+
+
+register_multiplicative_inverse(Fraction, _fraction_inverse)
+
+
+# Rationals with denominator 1 and a numerator in [-SMALL_INTEGER_BOUND, SMALL_INTEGER_BOUND] are interned
+SMALL_INTEGER_BOUND = 256
+
+
+class Rational(Fraction[int]):
+    """
+    Fraction[int] specialized to python ints
+
+    Fraction(numerator, denominator) with int arguments (e.g. Fraction[int](3)) creates a Rational,
+    it behaves like any other Fraction[int] but:
+        - it is always reduced with a positive denominator, so equality compares the terms directly
+        - arithmetic only uses ints and math.gcd, with the gcd tricks of Henrici (for +, -)
+          and Knuth (for *, /) that reduce smaller numbers and skip the final gcd
+        - it has no __dict__ (all Fractions use __slots__)
+        - small integers are interned
+        - it is hashable
+    """
+
+    __slots__ = ()
+    ring = int
+
+    def __new__(cls, numerator: int, denominator: Optional[int] = None) -> "Rational":
+        if type(numerator) is not int or not (
+            denominator is None or type(denominator) is int
+        ):
+            raise TypeError(
+                f"numerator and denominator have to be ints: type(numerator)={type(numerator)} | "
+                f"type(denominator)={type(denominator)}"
+            )
+        if denominator is None or denominator == 1:
+            return cls._new_reduced(numerator, 1, int)
+        if denominator == 0:
+            raise ZeroDivisionError("Cannot set denominator to additive_identity: 0")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        q = math.gcd(numerator, denominator)
+        if q != 1:
+            numerator, denominator = numerator // q, denominator // q
+        return cls._new_reduced(numerator, denominator, int)
+
+    def __init__(self, numerator: int, denominator: Optional[int] = None):
+        # everything is set up by __new__
+        pass
+
+    @classmethod
+    def _new_reduced(
+        cls, numerator: int, denominator: int, ring: Type = int
+    ) -> "Rational":
+        """
+        create a rational out of a numerator and denominator without common factors
+        """
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        if denominator == 1 or numerator == 0:
+            if -SMALL_INTEGER_BOUND <= numerator <= SMALL_INTEGER_BOUND:
+                return _small_integers[numerator + SMALL_INTEGER_BOUND]
+            denominator = 1
+        rational = object.__new__(Rational)
+        rational.numerator = numerator
+        rational.denominator = denominator
+        return rational
+
+    def __hash__(self) -> int:
+        return hash((self.numerator, self.denominator))
+
+    def __eq__(self, other) -> bool:
+        if type(other) is Rational:
+            return (
+                self.numerator == other.numerator
+                and self.denominator == other.denominator
+            )
+        return super().__eq__(other)
+
+    def __add__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        if type(other) is Rational:
+            return _add(
+                self.numerator, self.denominator, other.numerator, other.denominator
+            )
+        if type(other) is int:
+            return Rational._new_reduced(
+                self.numerator + self.denominator * other, self.denominator
+            )
+        return super().__add__(other)
+
+    def __sub__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        if type(other) is Rational:
+            return _add(
+                self.numerator, self.denominator, -other.numerator, other.denominator
+            )
+        if type(other) is int:
+            return Rational._new_reduced(
+                self.numerator - self.denominator * other, self.denominator
+            )
+        return super().__sub__(other)
+
+    def __rsub__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        if type(other) is int:
+            return Rational._new_reduced(
+                self.denominator * other - self.numerator, self.denominator
+            )
+        return super().__rsub__(other)
+
+    def __mul__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        if type(other) is Rational:
+            return _multiply(
+                self.numerator, self.denominator, other.numerator, other.denominator
+            )
+        if type(other) is int:
+            return _multiply(self.numerator, self.denominator, other, 1)
+        return super().__mul__(other)
+
+    def __rmul__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        return self * other
+
+    def __truediv__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        if type(other) is Rational:
+            return _divide(
+                self.numerator, self.denominator, other.numerator, other.denominator
+            )
+        if type(other) is int:
+            return _divide(self.numerator, self.denominator, other, 1)
+        return super().__truediv__(other)
+
+    def __rtruediv__(self, other: Union["Fraction[int]", int]) -> "Fraction[int]":
+        if type(other) is int:
+            return _divide(other, 1, self.numerator, self.denominator)
+        return super().__rtruediv__(other)
+
+    def get_additive_identity(self) -> "Rational":
+        return _small_integers[SMALL_INTEGER_BOUND]
+
+    def get_multiplicative_identity(self) -> "Rational":
+        return _small_integers[SMALL_INTEGER_BOUND + 1]
+
+
+def _new_interned(numerator: int) -> Rational:
+    rational = object.__new__(Rational)
+    rational.numerator = numerator
+    rational.denominator = 1
+    return rational
+
+
+_small_integers: Tuple[Rational, ...] = tuple(
+    _new_interned(numerator)
+    for numerator in range(-SMALL_INTEGER_BOUND, SMALL_INTEGER_BOUND + 1)
+)
+
+
+def _add(a: int, b: int, c: int, d: int) -> Rational:
+    """
+    a/b + c/d for reduced terms with positive denominators (Henrici):
+    with g = gcd(b, d) the sum is t / (b/g * d) for t = a * d/g + c * b/g
+    and the only factors t can share with the denominator are the factors of g
+    """
+    g = math.gcd(b, d)
+    if g == 1:
+        return Rational._new_reduced(a * d + b * c, b * d)
+    s = b // g
+    t = a * (d // g) + c * s
+    g2 = math.gcd(t, g)
+    if g2 == 1:
+        return Rational._new_reduced(t, s * d)
+    return Rational._new_reduced(t // g2, s * (d // g2))
+
+
+def _multiply(a: int, b: int, c: int, d: int) -> Rational:
+    """
+    a/b * c/d for reduced terms with positive denominators (Knuth):
+    cancelling gcd(a, d) and gcd(c, b) first leaves a reduced product of smaller numbers
+    """
+    g1 = math.gcd(a, d)
+    g2 = math.gcd(c, b)
+    return Rational._new_reduced((a // g1) * (c // g2), (b // g2) * (d // g1))
+
+
+def _divide(a: int, b: int, c: int, d: int) -> Rational:
+    if c == 0:
+        raise ZeroDivisionError(
+            f"Cannot divide by the additive identity: {Rational(c, d)}"
         )
+    if c < 0:
+        c, d = -c, -d
+    return _multiply(a, b, d, c)
+
+
+def _rational_additive_identity(rational: Fraction[int]) -> Fraction[int]:
+    return _small_integers[SMALL_INTEGER_BOUND]
+
+
+def _rational_multiplicative_identity(rational: Fraction[int]) -> Fraction[int]:
+    return _small_integers[SMALL_INTEGER_BOUND + 1]
+
+
+def _rational_inverse(rational: Fraction[int]) -> Fraction[int]:
+    if rational.numerator == 0:
+        raise ZeroDivisionError(
+            f"Cannot find the multiplicative inverse of the additive identity of the field: {rational}"
+        )
+    return Rational._new_reduced(rational.denominator, rational.numerator)
+
+
+# Rational arithmetic is declared with Fraction[int], so are its registered functions
+_rational_type: Type[Fraction[int]] = Rational
+register_additive_identity(_rational_type, _rational_additive_identity)
+register_multiplicative_identity(_rational_type, _rational_multiplicative_identity)
+register_multiplicative_inverse(_rational_type, _rational_inverse)
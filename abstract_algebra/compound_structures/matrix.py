@@ -10,45 +10,90 @@ from typing import (
     cast,
     overload,
     Optional,
+    List,
+    Sequence,
+    Union,
 )
 import functools
 from dataclasses import dataclass
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
 from abstract_algebra.abstract_structures.field import (
     FieldProtocol,
     multiplicative_inverse,
 )
 from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix_storage import MatrixStorage
+from abstract_algebra.compound_structures.validation import (
+    ValidationLevel,
+    get_validation_level,
+)
 from abstract_algebra.linear_algebra import vector_operations
+from abstract_algebra.linear_algebra import matrix_multiplication
+from abstract_algebra.linear_algebra import numpy_backend
+from abstract_algebra.linear_algebra.kernels import kernels_for
 
 F = TypeVar("F", bound=FieldProtocol)
 T = TypeVar("T", bound=FieldProtocol)
 MV = TypeVar("MV", "Matrix", Vector)
 
 
-@dataclass(init=True, frozen=True, eq=True)
+@dataclass(init=False, frozen=True, eq=False, repr=False)
 class Matrix(Generic[F]):
-    rows: Tuple[Vector[F], ...]
+    """
+    a matrix over a field
 
-    def __post_init__(self):
-        for row in self.rows:
-            if not row.field == self.field:
+    the entries live in a MatrixStorage (one flat buffer plus shape and strides),
+    so transpose(), column() and submatrix() read the buffer instead of copying rows.
+    The rows are only built as Vectors when they are asked for
+    """
+
+    storage: MatrixStorage[F]
+
+    def __init__(self, rows: Tuple[Vector[F], ...]):
+        rows = tuple(rows)
+        self._validate_rows(rows)
+        object.__setattr__(
+            self, "storage", MatrixStorage.from_rows([row.entries for row in rows])
+        )
+        self.__dict__["rows"] = rows
+
+    @staticmethod
+    def _validate_rows(rows: Tuple[Vector[F], ...]) -> None:
+        if get_validation_level() is ValidationLevel.OFF:
+            return
+        field = rows[0].field
+        column_count = len(rows[0])
+        for row in rows:
+            if not row.field == field:
                 raise TypeError(
                     f"All entries of the matrix need to be of the same type: "
-                    f"Mismatched types: {row.field} | {self.field}"
+                    f"Mismatched types: {row.field} | {field}"
                 )
-            if len(row) != self.shape[1]:
+            if len(row) != column_count:
                 raise TypeError(
                     f"All rows of the matrix need to be the same dimension: "
-                    f"Mismatched dims: {len(row)} | {self.shape[1]}"
+                    f"Mismatched dims: {len(row)} | {column_count}"
                 )
 
+    @classmethod
+    def _from_storage(cls, storage: MatrixStorage[F]) -> "Matrix[F]":
+        matrix = object.__new__(cls)
+        object.__setattr__(matrix, "storage", storage)
+        return matrix
+
     @functools.cached_property
+    def rows(self) -> Tuple[Vector[F], ...]:
+        return tuple(Vector.new_vector_unchecked(row) for row in self.storage.to_rows())
+
+    @property
     def shape(self) -> Tuple[int, int]:
-        return len(self.rows), len(self.rows[0])
+        return self.storage.shape
 
     @functools.cached_property
     def field(self) -> Type:
-        return type(self.rows[0][0])
+        return type(self.storage.entry(0, 0))
 
     @classmethod
     def new_matrix(
@@ -62,19 +107,77 @@ class Matrix(Generic[F]):
         )
         return cls(cast(Tuple[Vector[F]], entries))
 
+    @classmethod
+    def new_matrix_unchecked(cls, entries: Iterable[Iterable[F]]) -> "Matrix[F]":
+        """
+        wrap rows that are known to be valid, e.g. the result of an operation on valid matrices
+        (they are only checked with ValidationLevel.FULL)
+
+        :param entries: the rows, either Vectors or sequences of entries
+        """
+        rows = [row.entries if isinstance(row, Vector) else row for row in entries]
+        if get_validation_level() is ValidationLevel.FULL:
+            return cls(tuple(Vector(tuple(row)) for row in rows))
+        return cls._from_storage(MatrixStorage.from_rows(cast(List[Sequence[F]], rows)))
+
+    @classmethod
+    def _new_flat_unchecked(
+        cls, entries: Tuple[F, ...], shape: Tuple[int, int]
+    ) -> "Matrix[F]":
+        """
+        wrap valid entries given in row major order (see new_matrix_unchecked)
+        """
+        storage = MatrixStorage(buffer=entries, shape=shape, strides=(shape[1], 1))
+        if get_validation_level() is ValidationLevel.FULL:
+            return cls(tuple(Vector(row) for row in storage.to_rows()))
+        return cls._from_storage(storage)
+
     def __repr__(self) -> str:
         return f"abstract_algebra.modules.Matrix[{self.field}]{str(self)}"
 
     def __str__(self) -> str:
         return f"[{", ".join([row.__str__() for row in self.rows])}]"
 
-    def __getitem__(self, index: int) -> Vector[F]:
-        return self.rows[index]
+    @overload
+    def __getitem__(self, index: int) -> Vector[F]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[Vector[F], ...]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Vector[F], Tuple[Vector[F], ...]]:
+        if "rows" in self.__dict__:
+            return self.rows[index]
+        if isinstance(index, slice):
+            return tuple(
+                Vector.new_vector_unchecked(self.storage.row(i))
+                for i in range(*index.indices(self.shape[0]))
+            )
+        return Vector.new_vector_unchecked(self.storage.row(index))
 
     def __iter__(self) -> Iterator[Vector[F]]:
         for row in self.rows:
             yield row
 
+    def __hash__(self) -> int:
+        return hash((self.shape, tuple(self.storage.entries())))
+
+    def column(self, index: int) -> Vector[F]:
+        """
+        the column as a Vector, read straight from the storage (O(number of rows))
+        """
+        return Vector.new_vector_unchecked(self.storage.column(index))
+
+    def submatrix(
+        self, row_indexes: slice = slice(None), column_indexes: slice = slice(None)
+    ) -> "Matrix[F]":
+        """
+        a view on the rows and columns selected by two slices, sharing this matrix's storage
+        e.g. matrix.submatrix(slice(1, 3), slice(None, None, 2))
+        """
+        return Matrix._from_storage(self.storage.submatrix(row_indexes, column_indexes))
+
     def convert_to(
         self, field_factory: Optional[Callable[[T], F]] = None
     ) -> "Matrix[F]":
@@ -108,22 +211,45 @@ class Matrix(Generic[F]):
 
     def __eq__(self, other) -> bool:
         self._validate_elementwise_operation(other=other, operator="==")
-        return all([x == y for x, y in zip(self.rows, other.rows)])
+        return all(
+            x == y for x, y in zip(self.storage.entries(), other.storage.entries())
+        )
 
     def __add__(self, other: "Matrix[F]") -> "Matrix[F]":
         self._validate_elementwise_operation(other=other, operator="+")
-        return Matrix.new_matrix([x + y for x, y in zip(self.rows, other.rows)])
+        return Matrix._new_flat_unchecked(
+            tuple(
+                kernels_for(self.field).axpy(
+                    multiplicative_identity(self.storage.entry(0, 0)),
+                    tuple(other.storage.entries()),
+                    tuple(self.storage.entries()),
+                )
+            ),
+            self.shape,
+        )
 
     def __sub__(self, other: "Matrix[F]") -> "Matrix[F]":
         self._validate_elementwise_operation(other=other, operator="-")
-        return Matrix.new_matrix([x - y for x, y in zip(self.rows, other.rows)])
+        return Matrix._new_flat_unchecked(
+            tuple(
+                kernels_for(self.field).axpy(
+                    additive_inverse(multiplicative_identity(self.storage.entry(0, 0))),
+                    tuple(other.storage.entries()),
+                    tuple(self.storage.entries()),
+                )
+            ),
+            self.shape,
+        )
 
     def __rsub__(self, other: "Matrix[F]") -> "Matrix[F]":
         return other - self
 
     def __mul__(self, scalar: F) -> "Matrix[F]":
         self._validate_scalar_operation(other=scalar, operator="*")
-        return Matrix.new_matrix([row.__mul__(scalar) for row in self.rows])
+        return Matrix._new_flat_unchecked(
+            tuple(kernels_for(self.field).scale(scalar, tuple(self.storage.entries()))),
+            self.shape,
+        )
 
     def __rmul__(self, scalar: F) -> "Matrix[F]":
         return self * scalar
@@ -151,18 +277,35 @@ class Matrix(Generic[F]):
                     f"'Matrix[{self.field}]' of size {self.shape} incompatible with"
                     f"'Matrix[{other.field}]' of size {other.shape}"
                 )
+            elif numpy_backend.supports(self.field, self.storage.entry(0, 0)):
+                return Matrix.new_matrix_unchecked(
+                    numpy_backend.matmul(
+                        self.storage.to_rows(), other.storage.to_rows(), self.field
+                    )
+                )
             else:
-                return Matrix.new_matrix(
-                    [
-                        [
-                            vector_operations.dot_product(row, column)
-                            for column in other.transpose().rows
-                        ]
-                        for row in self.rows
-                    ]
+                return Matrix.new_matrix_unchecked(
+                    matrix_multiplication.multiply(
+                        [list(row) for row in self.storage.to_rows()],
+                        [list(row) for row in other.storage.to_rows()],
+                        additive_identity(self.storage.entry(0, 0)),
+                    )
                 )
         elif isinstance(other, Vector):
-            return (self @ Matrix.new_matrix([other]).transpose()).transpose()[0]
+            if self.field != other.field:
+                raise TypeError(
+                    f"unsupported operand type(s) for @:"
+                    f"'Matrix[{self.field}]' and 'Vector[{other.field}]'"
+                )
+            elif self.shape[1] != len(other):
+                raise TypeError(
+                    f"unsupported operand type(s) for @: "
+                    f"'Matrix[{self.field}]' of size {self.shape} incompatible with"
+                    f"'Dim(Vector[{other.field}])={len(other)}'"
+                )
+            return Vector.new_vector_unchecked(
+                tuple(vector_operations.dot_product(row, other) for row in self.rows)
+            )
         else:
             return NotImplemented
 
@@ -181,6 +324,7 @@ class Matrix(Generic[F]):
             return NotImplemented
 
     def transpose(self) -> "Matrix[F]":
-        return Matrix.new_matrix(
-            [[self[i][j] for i in range(self.shape[0])] for j in range(self.shape[1])]
-        )
+        """
+        a view sharing this matrix's storage (O(1))
+        """
+        return Matrix._from_storage(self.storage.transpose())
@@ -0,0 +1,119 @@
+from typing import TypeVar, Generic, Tuple, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+import itertools
+
+T = TypeVar("T")
+
+
+@dataclass(init=True, frozen=True, eq=False)
+class MatrixStorage(Generic[T]):
+    """
+    the entries of a matrix in one flat buffer:
+    entry (i, j) is buffer[offset + i * strides[0] + j * strides[1]]
+
+    transposed and sliced storages are views that share the buffer,
+    creating them is O(1)
+    """
+
+    buffer: Tuple[T, ...]
+    shape: Tuple[int, int]
+    strides: Tuple[int, int]
+    offset: int = 0
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[T]]) -> "MatrixStorage[T]":
+        """
+        copy rows (all of the same length) into a new row major buffer
+        """
+        column_count = len(rows[0]) if rows else 0
+        return cls(
+            buffer=tuple(itertools.chain.from_iterable(rows)),
+            shape=(len(rows), column_count),
+            strides=(column_count, 1),
+        )
+
+    def _check_index(self, index: int, axis: int) -> int:
+        size = self.shape[axis]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(
+                f"{'row' if axis == 0 else 'column'} index out of range for shape {self.shape}"
+            )
+        return index
+
+    def entry(self, i: int, j: int) -> T:
+        i, j = self._check_index(i, 0), self._check_index(j, 1)
+        return self.buffer[self.offset + i * self.strides[0] + j * self.strides[1]]
+
+    def row(self, i: int) -> Tuple[T, ...]:
+        start = self.offset + self._check_index(i, 0) * self.strides[0]
+        step = self.strides[1]
+        return self.buffer[start : start + self.shape[1] * step : step]
+
+    def column(self, j: int) -> Tuple[T, ...]:
+        start = self.offset + self._check_index(j, 1) * self.strides[1]
+        step = self.strides[0]
+        return self.buffer[start : start + self.shape[0] * step : step]
+
+    def to_rows(self) -> Tuple[Tuple[T, ...], ...]:
+        return tuple(self.row(i) for i in range(self.shape[0]))
+
+    def entries(self) -> Iterator[T]:
+        """
+        all entries in row major order
+        """
+        if self.is_contiguous:
+            return iter(self.buffer)
+        return itertools.chain.from_iterable(self.to_rows())
+
+    @property
+    def is_contiguous(self) -> bool:
+        """
+        True if the buffer holds exactly the entries in row major order
+        """
+        return (
+            self.offset == 0
+            and self.strides == (self.shape[1], 1)
+            and len(self.buffer) == self.shape[0] * self.shape[1]
+        )
+
+    def transpose(self) -> "MatrixStorage[T]":
+        return MatrixStorage(
+            buffer=self.buffer,
+            shape=(self.shape[1], self.shape[0]),
+            strides=(self.strides[1], self.strides[0]),
+            offset=self.offset,
+        )
+
+    def submatrix(
+        self, row_indexes: slice = slice(None), column_indexes: slice = slice(None)
+    ) -> "MatrixStorage[T]":
+        """
+        a view on the rows and columns selected by two slices (with positive steps)
+        """
+        row_range = range(*row_indexes.indices(self.shape[0]))
+        column_range = range(*column_indexes.indices(self.shape[1]))
+        if row_range.step < 0 or column_range.step < 0:
+            raise ValueError(
+                f"Submatrices need positive steps: {row_indexes}, {column_indexes}"
+            )
+        return MatrixStorage(
+            buffer=self.buffer,
+            shape=(len(row_range), len(column_range)),
+            strides=(
+                self.strides[0] * row_range.step,
+                self.strides[1] * column_range.step,
+            ),
+            offset=self.offset
+            + row_range.start * self.strides[0]
+            + column_range.start * self.strides[1],
+        )
+
+    def compact(self) -> "MatrixStorage[T]":
+        """
+        a contiguous copy of a view (the storage itself if it already is contiguous)
+        """
+        if self.is_contiguous:
+            return self
+        return MatrixStorage.from_rows(self.to_rows())
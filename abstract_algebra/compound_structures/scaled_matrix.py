@@ -0,0 +1,338 @@
+from typing import TypeVar, Generic, Tuple, Iterator, Sequence, Union, overload, cast
+from dataclasses import dataclass
+import functools
+import math
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.euclidean_ring import (
+    EuclideanRingProtocol,
+    generalized_gcd,
+)
+from abstract_algebra.compound_structures.fraction import Fraction
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+
+E = TypeVar("E", bound=EuclideanRingProtocol)
+
+
+@dataclass(init=True, frozen=True, eq=False)
+class ScaledVector(Generic[E]):
+    """
+    a vector over Fraction[E] stored as ring elements over one common denominator:
+    entry i is numerators[i] / denominator
+
+    arithmetic works on the numerators with ring operations only,
+    every result is normalized once (one gcd over all of its terms)
+    instead of reducing each entry as a Fraction
+    """
+
+    numerators: Tuple[E, ...]
+    denominator: E
+
+    @classmethod
+    def from_vector(cls, vector: Vector[Fraction[E]]) -> "ScaledVector[E]":
+        """
+        put the entries over the least common multiple of their denominators
+        """
+        for entry in vector:
+            if not isinstance(entry, Fraction):
+                raise TypeError(
+                    f"Only vectors of Fractions can be scaled: Vector[{vector.field}]"
+                )
+        denominator = _lcm([entry.denominator for entry in vector])
+        return cls(
+            numerators=tuple(
+                entry.numerator * (denominator // entry.denominator) for entry in vector
+            ),
+            denominator=denominator,
+        )
+
+    def to_vector(self) -> Vector[Fraction[E]]:
+        return Vector.new_vector_unchecked(
+            tuple(
+                Fraction(numerator, self.denominator) for numerator in self.numerators
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"abstract_algebra.modules.ScaledVector"
+            f"[{','.join(repr(n) for n in self.numerators)}]/{self.denominator!r}"
+        )
+
+    def __len__(self) -> int:
+        return len(self.numerators)
+
+    def __getitem__(self, index: int) -> Fraction[E]:
+        return Fraction(self.numerators[index], self.denominator)
+
+    def __iter__(self) -> Iterator[Fraction[E]]:
+        for numerator in self.numerators:
+            yield Fraction(numerator, self.denominator)
+
+    def _validate_elementwise_operation(self, other: "ScaledVector[E]", operator: str):
+        if len(self) != len(other):
+            raise TypeError(
+                f"unsupported operand type(s) for {operator}: "
+                f"'ScaledVector' of size {len(self)} and 'ScaledVector' of size {len(other)}"
+            )
+        return True
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ScaledVector):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "==")
+        return all(
+            a * other.denominator == b * self.denominator
+            for a, b in zip(self.numerators, other.numerators)
+        )
+
+    def __add__(self, other: "ScaledVector[E]") -> "ScaledVector[E]":
+        if not isinstance(other, ScaledVector):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "+")
+        return _combine(self, other, multiplicative_identity(self.denominator))
+
+    def __sub__(self, other: "ScaledVector[E]") -> "ScaledVector[E]":
+        if not isinstance(other, ScaledVector):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "-")
+        return _combine(
+            self, other, additive_inverse(multiplicative_identity(self.denominator))
+        )
+
+    def __mul__(self, other: Union[Fraction[E], E]) -> "ScaledVector[E]":
+        if isinstance(other, Fraction):
+            numerator, denominator = other.numerator, other.denominator
+        elif isinstance(other, type(self.denominator)):
+            numerator, denominator = other, multiplicative_identity(other)
+        else:
+            return NotImplemented
+        return normalize(
+            tuple(n * numerator for n in self.numerators),
+            self.denominator * denominator,
+        )
+
+    def __rmul__(self, other: Union[Fraction[E], E]) -> "ScaledVector[E]":
+        return self * other
+
+    def dot(self, other: "ScaledVector[E]") -> Fraction[E]:
+        """
+        the dot product: one sum of ring products and one reduction
+        """
+        self._validate_elementwise_operation(other, "dot")
+        return Fraction(
+            _ring_dot(self.numerators, other.numerators),
+            self.denominator * other.denominator,
+        )
+
+    def axpy(self, factor: Fraction[E], other: "ScaledVector[E]") -> "ScaledVector[E]":
+        """
+        self + factor * other with a single normalization (a row operation of elimination)
+        """
+        self._validate_elementwise_operation(other, "axpy")
+        scaled_other = ScaledVector(
+            numerators=tuple(n * factor.numerator for n in other.numerators),
+            denominator=other.denominator * factor.denominator,
+        )
+        return _combine(self, scaled_other, multiplicative_identity(self.denominator))
+
+
+@dataclass(init=True, frozen=True, eq=False)
+class ScaledMatrix(Generic[E]):
+    """
+    a matrix over Fraction[E] stored as one ScaledVector per row
+    (a ring element numerator per entry and one denominator per row)
+
+    products are computed with ring arithmetic only and normalized once per row
+    """
+
+    rows: Tuple[ScaledVector[E], ...]
+
+    def __post_init__(self):
+        for row in self.rows:
+            if len(row) != len(self.rows[0]):
+                raise TypeError(
+                    f"All rows of the matrix need to be of the same length: "
+                    f"Mismatched lengths: {len(row)} | {len(self.rows[0])}"
+                )
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix[Fraction[E]]) -> "ScaledMatrix[E]":
+        return cls(rows=tuple(ScaledVector.from_vector(row) for row in matrix))
+
+    def to_matrix(self) -> Matrix[Fraction[E]]:
+        return Matrix.new_matrix_unchecked([row.to_vector() for row in self.rows])
+
+    def __repr__(self) -> str:
+        return f"abstract_algebra.modules.ScaledMatrix(shape={self.shape})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.rows), len(self.rows[0])
+
+    def __getitem__(self, index: int) -> ScaledVector[E]:
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[ScaledVector[E]]:
+        for row in self.rows:
+            yield row
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ScaledMatrix):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "==")
+        return all(a == b for a, b in zip(self.rows, other.rows))
+
+    def _validate_elementwise_operation(self, other: "ScaledMatrix[E]", operator: str):
+        if self.shape != other.shape:
+            raise TypeError(
+                f"unsupported operand type(s) for {operator}: "
+                f"'ScaledMatrix' of size {self.shape} and 'ScaledMatrix' of size {other.shape}"
+            )
+        return True
+
+    def __add__(self, other: "ScaledMatrix[E]") -> "ScaledMatrix[E]":
+        if not isinstance(other, ScaledMatrix):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "+")
+        return ScaledMatrix(rows=tuple(a + b for a, b in zip(self.rows, other.rows)))
+
+    def __sub__(self, other: "ScaledMatrix[E]") -> "ScaledMatrix[E]":
+        if not isinstance(other, ScaledMatrix):
+            return NotImplemented
+        self._validate_elementwise_operation(other, "-")
+        return ScaledMatrix(rows=tuple(a - b for a, b in zip(self.rows, other.rows)))
+
+    def _validate_matmul(self, other_shape: Tuple[int, int], other_name: str) -> bool:
+        if self.shape[1] != other_shape[0]:
+            raise TypeError(
+                f"unsupported operand type(s) for @: "
+                f"'ScaledMatrix' of size {self.shape} incompatible with"
+                f"'{other_name}' of size {other_shape}"
+            )
+        return True
+
+    @overload
+    def __matmul__(self, other: "ScaledMatrix[E]") -> "ScaledMatrix[E]": ...
+
+    @overload
+    def __matmul__(self, other: ScaledVector[E]) -> ScaledVector[E]: ...
+
+    def __matmul__(
+        self, other: Union["ScaledMatrix[E]", ScaledVector[E]]
+    ) -> Union["ScaledMatrix[E]", ScaledVector[E]]:
+        if isinstance(other, ScaledMatrix):
+            self._validate_matmul(other.shape, "ScaledMatrix")
+            # put all rows of other over one denominator,
+            # then row i of the product is (row i numerators @ other numerators) / (d_i * d)
+            denominator = _lcm([row.denominator for row in other.rows])
+            other_rows = [
+                [n * (denominator // row.denominator) for n in row.numerators]
+                for row in other.rows
+            ]
+            other_columns = list(zip(*other_rows))
+            return ScaledMatrix(
+                rows=tuple(
+                    normalize(
+                        tuple(
+                            _ring_dot(row.numerators, column)
+                            for column in other_columns
+                        ),
+                        row.denominator * denominator,
+                    )
+                    for row in self.rows
+                )
+            )
+        elif isinstance(other, ScaledVector):
+            self._validate_matmul((len(other), 1), "ScaledVector")
+            # entry i is (row i numerators . other numerators) / (d_i * other.denominator)
+            row_denominator = _lcm([row.denominator for row in self.rows])
+            return normalize(
+                tuple(
+                    _ring_dot(row.numerators, other.numerators)
+                    * (row_denominator // row.denominator)
+                    for row in self.rows
+                ),
+                row_denominator * other.denominator,
+            )
+        else:
+            return NotImplemented
+
+
+def normalize(numerators: Sequence[E], denominator: E) -> ScaledVector[E]:
+    """
+    a ScaledVector with the common factors of all numerators and the denominator
+    divided out (one gcd pass) and a positive denominator
+    """
+    zero = additive_identity(denominator)
+    if denominator < zero:
+        numerators = [additive_inverse(n) for n in numerators]
+        denominator = additive_inverse(denominator)
+    g: E
+    if isinstance(denominator, int):
+        g = cast(E, _int_gcd([denominator, *cast(Sequence[int], numerators)]))
+    else:
+        one = multiplicative_identity(denominator)
+        g = denominator
+        for n in numerators:
+            if g == one:
+                break
+            g = generalized_gcd(g, n)
+    if g == multiplicative_identity(denominator):
+        return ScaledVector(numerators=tuple(numerators), denominator=denominator)
+    return ScaledVector(
+        numerators=tuple(n // g for n in numerators), denominator=denominator // g
+    )
+
+
+def _lcm(values: Sequence[E]) -> E:
+    if all(isinstance(value, int) for value in values):
+        return cast(E, _int_lcm(cast(Sequence[int], values)))
+    return functools.reduce(
+        lambda a, b: a * (b // generalized_gcd(a, b)), values[1:], values[0]
+    )
+
+
+def _ring_dot(a: Sequence[E], b: Sequence[E]) -> E:
+    if isinstance(a[0], int):
+        return cast(E, _int_dot(cast(Sequence[int], a), cast(Sequence[int], b)))
+    return functools.reduce(
+        lambda total, term: total + term,
+        [x * y for x, y in zip(a, b)],
+        additive_identity(a[0]),
+    )
+
+
+# the int fast paths of normalize, _lcm and _ring_dot
+
+
+def _int_gcd(values: Sequence[int]) -> int:
+    return math.gcd(*values)
+
+
+def _int_lcm(values: Sequence[int]) -> int:
+    return math.lcm(*values)
+
+
+def _int_dot(a: Sequence[int], b: Sequence[int]) -> int:
+    return cast(int, math.sumprod(a, b))
+
+
+def _combine(
+    first: ScaledVector[E], second: ScaledVector[E], sign: E
+) -> ScaledVector[E]:
+    """
+    first + sign * second over the least common multiple of their denominators
+    """
+    g = generalized_gcd(first.denominator, second.denominator)
+    first_factor = second.denominator // g
+    second_factor = (first.denominator // g) * sign
+    return normalize(
+        tuple(
+            a * first_factor + b * second_factor
+            for a, b in zip(first.numerators, second.numerators)
+        ),
+        first.denominator * first_factor,
+    )
@@ -0,0 +1,231 @@
+from typing import (
+    TypeVar,
+    Generic,
+    Tuple,
+    Dict,
+    Iterable,
+    Type,
+    Any,
+    Callable,
+    Optional,
+    overload,
+    Union,
+    cast,
+)
+import functools
+from dataclasses import dataclass
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.field import FieldProtocol
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.linear_algebra.kernels import kernels_for
+
+F = TypeVar("F", bound=FieldProtocol)
+T = TypeVar("T", bound=FieldProtocol)
+SV = TypeVar("SV", "SparseMatrix", Matrix, Vector)
+
+
+@dataclass(init=True, frozen=True, eq=True)
+class SparseMatrix(Generic[F]):
+    """
+    a matrix stored as one {column index: entry} dictionary per row
+    only the nonzero entries are stored,
+    "zero" is kept so the field is known even if there are no nonzero entries
+    """
+
+    shape: Tuple[int, int]
+    zero: F
+    rows: Tuple[Dict[int, F], ...]
+
+    def __post_init__(self):
+        if len(self.rows) != self.shape[0]:
+            raise TypeError(
+                f"SparseMatrix of shape {self.shape} needs {self.shape[0]} rows: "
+                f"Mismatched dims: {len(self.rows)} | {self.shape[0]}"
+            )
+        for row in self.rows:
+            for column, entry in row.items():
+                if not 0 <= column < self.shape[1]:
+                    raise TypeError(
+                        f"Column index out of range for SparseMatrix of shape {self.shape}: {column}"
+                    )
+                if not isinstance(entry, self.field):
+                    raise TypeError(
+                        f"All entries of the matrix need to be of the same type: "
+                        f"Mismatched types: {type(entry)} | {self.field}"
+                    )
+                if entry == self.zero:
+                    raise TypeError(
+                        f"SparseMatrix can only store nonzero entries: ({column}, {entry})"
+                    )
+
+    @functools.cached_property
+    def field(self) -> Type:
+        return type(self.zero)
+
+    @functools.cached_property
+    def nnz(self) -> int:
+        return sum(len(row) for row in self.rows)
+
+    @classmethod
+    def new_sparse_matrix(
+        cls,
+        shape: Tuple[int, int],
+        entries: Iterable[Tuple[int, int, Any]],
+        example_field_element: Any,
+        field_factory: Optional[Callable[[T], F]] = None,
+    ) -> "SparseMatrix[F]":
+        """
+        build a sparse matrix out of (row, column, entry) triples
+        entries equal to zero are dropped, repeated positions are added together
+
+        :param shape: the shape of the matrix
+        :param entries: the (row, column, entry) triples
+        :param example_field_element: any element of the field (used to find zero)
+        :param field_factory: optional conversion applied to every entry
+        :return: the new sparse matrix
+        """
+        if field_factory is not None:
+            example_field_element = field_factory(example_field_element)
+        zero = additive_identity(example_field_element)
+        rows: Tuple[Dict[int, F], ...] = tuple({} for i in range(shape[0]))
+        for i, j, entry in entries:
+            if field_factory is not None:
+                entry = field_factory(entry)
+            row = rows[i]
+            if j in row:
+                entry = row[j] + entry
+            if entry == zero:
+                row.pop(j, None)
+            else:
+                row[j] = entry
+        return cls(shape=shape, zero=zero, rows=rows)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix[F]) -> "SparseMatrix[F]":
+        zero = additive_identity(matrix[0][0])
+        return cls(
+            shape=matrix.shape,
+            zero=zero,
+            rows=tuple(
+                {j: entry for j, entry in enumerate(row) if entry != zero}
+                for row in matrix
+            ),
+        )
+
+    def to_matrix(self) -> Matrix[F]:
+        return Matrix.new_matrix_unchecked(
+            [[row.get(j, self.zero) for j in range(self.shape[1])] for row in self.rows]
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"abstract_algebra.modules.SparseMatrix[{self.field}]"
+            f"(shape={self.shape}, nnz={self.nnz})"
+        )
+
+    def __str__(self) -> str:
+        return str(self.to_matrix())
+
+    def __getitem__(self, index: int) -> Dict[int, F]:
+        return self.rows[index]
+
+    def entry(self, i: int, j: int) -> F:
+        return self.rows[i].get(j, self.zero)
+
+    def transpose(self) -> "SparseMatrix[F]":
+        columns: Tuple[Dict[int, F], ...] = tuple({} for j in range(self.shape[1]))
+        for i, row in enumerate(self.rows):
+            for j, entry in row.items():
+                columns[j][i] = entry
+        return SparseMatrix(
+            shape=(self.shape[1], self.shape[0]), zero=self.zero, rows=columns
+        )
+
+    def _validate_matmul(self, other: Any, other_shape: Tuple[int, int]) -> bool:
+        if self.field != other.field:
+            raise TypeError(
+                f"unsupported operand type(s) for @:"
+                f"'SparseMatrix[{self.field}]' and '{type(other).__name__}[{other.field}]'"
+            )
+        elif self.shape[1] != other_shape[0]:
+            raise TypeError(
+                f"unsupported operand type(s) for @: "
+                f"'SparseMatrix[{self.field}]' of size {self.shape} incompatible with"
+                f"'{type(other).__name__}[{other.field}]' of size {other_shape}"
+            )
+        return True
+
+    @overload
+    def __matmul__(self, other: "SparseMatrix[F]") -> "SparseMatrix[F]": ...
+
+    @overload
+    def __matmul__(self, other: Matrix[F]) -> Matrix[F]: ...
+
+    @overload
+    def __matmul__(self, other: Vector[F]) -> Vector[F]: ...
+
+    def __matmul__(self, other: SV) -> SV:
+        if isinstance(other, SparseMatrix):
+            self._validate_matmul(other, other.shape)
+            rows = []
+            for row in self.rows:
+                result_row: Dict[int, F] = {}
+                for k, a in row.items():
+                    for j, b in other.rows[k].items():
+                        if j in result_row:
+                            result_row[j] = result_row[j] + a * b
+                        else:
+                            result_row[j] = a * b
+                rows.append(
+                    {j: entry for j, entry in result_row.items() if entry != self.zero}
+                )
+            return cast(
+                SV,
+                SparseMatrix(
+                    shape=(self.shape[0], other.shape[1]),
+                    zero=self.zero,
+                    rows=tuple(rows),
+                ),
+            )
+        elif isinstance(other, Matrix):
+            self._validate_matmul(other, other.shape)
+            result_rows = []
+            for row in self.rows:
+                result_row_entries = [self.zero for j in range(other.shape[1])]
+                for k, a in row.items():
+                    for j, b in enumerate(other[k]):
+                        result_row_entries[j] = result_row_entries[j] + a * b
+                result_rows.append(result_row_entries)
+            return Matrix.new_matrix_unchecked(result_rows)
+        elif isinstance(other, Vector):
+            self._validate_matmul(other, (len(other), 1))
+            dot = kernels_for(type(self.zero)).dot
+            return Vector.new_vector_unchecked(
+                tuple(
+                    (
+                        dot(list(row.values()), [other[k] for k in row])
+                        if row
+                        else self.zero
+                    )
+                    for row in self.rows
+                )
+            )
+        else:
+            return NotImplemented
+
+    @overload
+    def __rmatmul__(self, other: Matrix[F]) -> Matrix[F]: ...
+
+    @overload
+    def __rmatmul__(self, other: Vector[F]) -> Vector[F]: ...
+
+    def __rmatmul__(
+        self, other: Union[Matrix[F], Vector[F]]
+    ) -> Union[Matrix[F], Vector[F]]:
+        if isinstance(other, Matrix):
+            return (self.transpose() @ other.transpose()).transpose()
+        elif isinstance(other, Vector):
+            return self.transpose() @ other
+        else:
+            return NotImplemented
@@ -0,0 +1,53 @@
+from typing import Iterator, Optional
+from enum import Enum
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class ValidationLevel(Enum):
+    """
+    how much Vector and Matrix check their entries when they are constructed
+
+    FULL: everything is validated, including results of library operations
+    BOUNDARY: vectors and matrices built by users are validated,
+        results of library operations on them are trusted
+    OFF: nothing is validated
+    """
+
+    FULL = "full"
+    BOUNDARY = "boundary"
+    OFF = "off"
+
+
+_default_validation_level: ValidationLevel = ValidationLevel.BOUNDARY
+_validation_level_override: ContextVar[Optional[ValidationLevel]] = ContextVar(
+    "validation_level", default=None
+)
+
+
+def get_validation_level() -> ValidationLevel:
+    override = _validation_level_override.get()
+    return _default_validation_level if override is None else override
+
+
+def set_validation_level(level: ValidationLevel) -> None:
+    """
+    set the process wide validation level (contexts inside validation_level keep theirs)
+    """
+    global _default_validation_level
+    _default_validation_level = ValidationLevel(level)
+
+
+@contextmanager
+def validation_level(level: ValidationLevel) -> Iterator[None]:
+    """
+    use a validation level inside a with block (for the current thread / task only), e.g.
+
+    with validation_level(ValidationLevel.OFF):
+        reduced = GaussJordan(matrix).reduced_row_echelon_form
+    """
+    token = _validation_level_override.set(ValidationLevel(level))
+    try:
+        yield
+    finally:
+        _validation_level_override.reset(token)
@@ -12,10 +12,17 @@ from typing import (
 )
 from dataclasses import dataclass
 import functools
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
 from abstract_algebra.abstract_structures.field import (
     FieldProtocol,
     multiplicative_inverse,
 )
+from abstract_algebra.compound_structures.validation import (
+    ValidationLevel,
+    get_validation_level,
+)
+from abstract_algebra.linear_algebra.kernels import kernels_for
 
 F = TypeVar("F", bound=FieldProtocol)
 T = TypeVar("T", bound=FieldProtocol)
@@ -26,6 +33,8 @@ class Vector(Generic[F], Iterable):
     entries: Tuple[F, ...]
 
     def __post_init__(self):
+        if get_validation_level() is ValidationLevel.OFF:
+            return
         for entry in self.entries:
             if not isinstance(entry, self.field):
                 raise TypeError(
@@ -50,6 +59,18 @@ class Vector(Generic[F], Iterable):
             entries = tuple(field_factory(entry) for entry in entries)
         return cls(cast(Tuple[F], entries))
 
+    @classmethod
+    def new_vector_unchecked(cls, entries: Tuple[F, ...]) -> "Vector[F]":
+        """
+        wrap entries that are known to be valid, e.g. the result of an operation on valid vectors
+        (they are only checked with ValidationLevel.FULL)
+        """
+        if get_validation_level() is ValidationLevel.FULL:
+            return cls(entries)
+        vector = object.__new__(cls)
+        object.__setattr__(vector, "entries", entries)
+        return vector
+
     def __repr__(self) -> str:
         return (
             f"abstract_algebra.modules.Vector[{self.field}]"
@@ -96,18 +117,36 @@ class Vector(Generic[F], Iterable):
 
     def __add__(self, other: "Vector[F]") -> "Vector[F]":
         self._validate_elementwise_operation(other=other, operator="+")
-        return Vector.new_vector([x + y for x, y in zip(self.entries, other.entries)])
+        return Vector.new_vector_unchecked(
+            tuple(
+                kernels_for(self.field).axpy(
+                    multiplicative_identity(self.entries[0]),
+                    other.entries,
+                    self.entries,
+                )
+            )
+        )
 
     def __sub__(self, other: "Vector[F]") -> "Vector[F]":
         self._validate_elementwise_operation(other=other, operator="-")
-        return Vector.new_vector([x - y for x, y in zip(self.entries, other.entries)])
+        return Vector.new_vector_unchecked(
+            tuple(
+                kernels_for(self.field).axpy(
+                    additive_inverse(multiplicative_identity(self.entries[0])),
+                    other.entries,
+                    self.entries,
+                )
+            )
+        )
 
     def __rsub__(self, other: "Vector[F]") -> "Vector[F]":
         return other - self
 
     def __mul__(self, scalar: F) -> "Vector[F]":
         self._validate_scalar_operation(scalar=scalar, operator="*")
-        return Vector.new_vector([x * scalar for x in self.entries])
+        return Vector.new_vector_unchecked(
+            tuple(kernels_for(self.field).scale(scalar, self.entries))
+        )
 
     def __rmul__(self, scalar: F) -> "Vector[F]":
         self._validate_scalar_operation(scalar=scalar, operator="/")
@@ -0,0 +1,317 @@
+from typing import Union, Tuple, List, Optional, Iterator, Sequence, Any, Dict
+from dataclasses import dataclass, field
+import functools
+import itertools
+from abstract_algebra.abstract_structures.field import FieldProtocol
+from abstract_algebra.linear_algebra.modular_arithmetic import is_prime
+
+# the exponent used for zero (which has no discrete logarithm)
+ZERO_EXPONENT = -1
+
+
+@dataclass(init=True, frozen=True, eq=False, repr=False)
+class GaloisField:
+    """
+    the finite field GF(p^k) = GF(p)[x] / (f) for a primitive polynomial f of degree k
+
+    every nonzero element is a power of x, elements are stored as that exponent,
+    so multiplication and division add and subtract exponents.
+    Addition uses Zech logarithms: x^a + x^b = x^(a + Z(b - a)) with x^Z(n) = 1 + x^n
+
+    an element's value is its polynomial encoded in base p (coefficient i is digit i)
+    the tables are built once per field and shared by all of its elements,
+    get fields with galois_field(p, k)
+    """
+
+    characteristic: int
+    degree: int
+    modulus_polynomial: Tuple[int, ...]
+    # x^n has the value exp_table[n]
+    exp_table: List[int] = field(init=False)
+    # the element with value v is x^log_table[v]
+    log_table: List[int] = field(init=False)
+    # 1 + x^n = x^zech_table[n] (ZERO_EXPONENT if 1 + x^n = 0)
+    zech_table: List[int] = field(init=False)
+    # every element indexed by its exponent, zero comes last (at index ZERO_EXPONENT)
+    # arithmetic looks its results up here instead of creating new elements
+    elements: Tuple["GaloisFieldElement", ...] = field(init=False)
+    multiplicative_order: int = field(init=False)
+    # -1 = x^negation_offset
+    negation_offset: int = field(init=False)
+
+    def __post_init__(self):
+        p = self.characteristic
+        exp_table = _powers_of_x(p, self.modulus_polynomial)
+        if exp_table is None:
+            raise ValueError(
+                f"{self.modulus_polynomial} is not a primitive polynomial over GF({p})"
+            )
+        multiplicative_order = len(exp_table)
+        log_table = [ZERO_EXPONENT] * (multiplicative_order + 1)
+        for n, value in enumerate(exp_table):
+            log_table[value] = n
+        zech_table = [
+            log_table[value - value % p + (value % p + 1) % p] for value in exp_table
+        ]
+        object.__setattr__(self, "exp_table", exp_table)
+        object.__setattr__(self, "log_table", log_table)
+        object.__setattr__(self, "zech_table", zech_table)
+        object.__setattr__(self, "multiplicative_order", multiplicative_order)
+        object.__setattr__(
+            self, "negation_offset", 0 if p == 2 else multiplicative_order // 2
+        )
+        object.__setattr__(
+            self,
+            "elements",
+            tuple(GaloisFieldElement(self, n) for n in range(multiplicative_order))
+            + (GaloisFieldElement(self, ZERO_EXPONENT),),
+        )
+
+    def __repr__(self) -> str:
+        return f"GF({self.characteristic}^{self.degree})"
+
+    # elements compare fields by identity, so copies and unpickled fields are the cached field
+    def __reduce__(self) -> Tuple[Any, Tuple[int, int, Tuple[int, ...]]]:
+        return galois_field, (self.characteristic, self.degree, self.modulus_polynomial)
+
+    def __copy__(self) -> "GaloisField":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "GaloisField":
+        return self
+
+    def __call__(self, value: int) -> "GaloisFieldElement":
+        """
+        a field_factory mapping a base p encoded polynomial in [0, p^k) to its element
+        """
+        if not 0 <= value < self.order:
+            raise ValueError(f"{self} has no element with value {value}")
+        return self.elements[self.log_table[value]]
+
+    @property
+    def order(self) -> int:
+        return self.multiplicative_order + 1
+
+    @property
+    def zero(self) -> "GaloisFieldElement":
+        return self.elements[ZERO_EXPONENT]
+
+    @property
+    def one(self) -> "GaloisFieldElement":
+        return self.elements[0]
+
+
+@dataclass(init=True, frozen=True, slots=True)
+class GaloisFieldElement(FieldProtocol):
+    """
+    an element of GF(p^k), stored as its exponent with respect to the field's generator
+    """
+
+    field: GaloisField
+    exponent: int
+
+    @property
+    def value(self) -> int:
+        if self.exponent == ZERO_EXPONENT:
+            return 0
+        return self.field.exp_table[self.exponent]
+
+    def __repr__(self) -> str:
+        return f"GaloisFieldElement({self.value}, {self.field})"
+
+    def __str__(self) -> str:
+        return f"{self.value}"
+
+    def _coerce(
+        self, other: Union["GaloisFieldElement", int], operator: str
+    ) -> Union["GaloisFieldElement", None]:
+        if isinstance(other, GaloisFieldElement):
+            if other.field is not self.field:
+                raise TypeError(
+                    f"unsupported operand type(s) for {operator}: "
+                    f"'{self.field}' and '{other.field}'"
+                )
+            return other
+        if isinstance(other, int):
+            return self.field(other % self.field.characteristic)
+        return None
+
+    def __eq__(self, other) -> bool:
+        if type(other) is GaloisFieldElement and other.field is self.field:
+            return self.exponent == other.exponent
+        if isinstance(other, (int, GaloisFieldElement)):
+            element = self._coerce(other, "==")
+            return element is not None and self.exponent == element.exponent
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self.field), self.exponent))
+
+    def __add__(self, other: Union["GaloisFieldElement", int]) -> "GaloisFieldElement":
+        element: Optional[GaloisFieldElement]
+        if type(other) is GaloisFieldElement and other.field is self.field:
+            element = other
+        elif (element := self._coerce(other, "+")) is None:
+            return NotImplemented
+        a, b = self.exponent, element.exponent
+        if a == ZERO_EXPONENT:
+            return element
+        if b == ZERO_EXPONENT:
+            return self
+        field = self.field
+        zech = field.zech_table[(b - a) % field.multiplicative_order]
+        if zech == ZERO_EXPONENT:
+            return field.zero
+        return field.elements[(a + zech) % field.multiplicative_order]
+
+    def __radd__(self, other: Union["GaloisFieldElement", int]) -> "GaloisFieldElement":
+        return self + other
+
+    def __neg__(self) -> "GaloisFieldElement":
+        if self.exponent == ZERO_EXPONENT:
+            return self
+        field = self.field
+        return field.elements[
+            (self.exponent + field.negation_offset) % field.multiplicative_order
+        ]
+
+    def __sub__(self, other: Union["GaloisFieldElement", int]) -> "GaloisFieldElement":
+        element: Optional[GaloisFieldElement]
+        if type(other) is GaloisFieldElement and other.field is self.field:
+            element = other
+        elif (element := self._coerce(other, "-")) is None:
+            return NotImplemented
+        return self + (-element)
+
+    def __rsub__(self, other: Union["GaloisFieldElement", int]) -> "GaloisFieldElement":
+        if (element := self._coerce(other, "-")) is None:
+            return NotImplemented
+        return element + (-self)
+
+    def __mul__(self, other: Union["GaloisFieldElement", int]) -> "GaloisFieldElement":
+        element: Optional[GaloisFieldElement]
+        if type(other) is GaloisFieldElement and other.field is self.field:
+            element = other
+        elif (element := self._coerce(other, "*")) is None:
+            return NotImplemented
+        a, b = self.exponent, element.exponent
+        if a == ZERO_EXPONENT or b == ZERO_EXPONENT:
+            return self.field.zero
+        field = self.field
+        return field.elements[(a + b) % field.multiplicative_order]
+
+    def __rmul__(self, other: Union["GaloisFieldElement", int]) -> "GaloisFieldElement":
+        return self * other
+
+    def __truediv__(
+        self, other: Union["GaloisFieldElement", int]
+    ) -> "GaloisFieldElement":
+        element: Optional[GaloisFieldElement]
+        if type(other) is GaloisFieldElement and other.field is self.field:
+            element = other
+        elif (element := self._coerce(other, "/")) is None:
+            return NotImplemented
+        if element.exponent == ZERO_EXPONENT:
+            raise ZeroDivisionError(f"division by zero in {self.field}")
+        if self.exponent == ZERO_EXPONENT:
+            return self
+        field = self.field
+        return field.elements[
+            (self.exponent - element.exponent) % field.multiplicative_order
+        ]
+
+    def __rtruediv__(
+        self, other: Union["GaloisFieldElement", int]
+    ) -> "GaloisFieldElement":
+        if (element := self._coerce(other, "/")) is None:
+            return NotImplemented
+        return element / self
+
+    def get_additive_identity(self) -> "GaloisFieldElement":
+        return self.field.zero
+
+    def get_multiplicative_identity(self) -> "GaloisFieldElement":
+        return self.field.one
+
+
+def galois_field(
+    characteristic: int,
+    degree: int,
+    modulus_polynomial: Optional[Sequence[int]] = None,
+) -> GaloisField:
+    """
+    the field GF(characteristic^degree), e.g.
+    Matrix.new_matrix([[1, 2], [3, 4]], galois_field(2, 8))
+
+    fields are cached, so every call with the same arguments shares the same tables
+
+    :param characteristic: a prime p
+    :param degree: the degree k of the extension
+    :param modulus_polynomial: the coefficients (lowest first, monic) of a primitive polynomial of degree k,
+        by default the first primitive polynomial in lexicographic order is used
+    :return: the field
+    """
+    if not is_prime(characteristic):
+        raise ValueError(f"GF(p^k) needs a prime characteristic: {characteristic}")
+    if degree < 1:
+        raise ValueError(f"GF(p^k) needs a positive degree: {degree}")
+    if modulus_polynomial is None:
+        modulus_polynomial = _default_modulus_polynomial(characteristic, degree)
+    elif len(modulus_polynomial) != degree + 1 or modulus_polynomial[-1] != 1:
+        raise ValueError(
+            f"The modulus polynomial needs to be monic of degree {degree}: {modulus_polynomial}"
+        )
+    return _cached_galois_field(characteristic, degree, tuple(modulus_polynomial))
+
+
+@functools.cache
+def _cached_galois_field(
+    characteristic: int, degree: int, modulus_polynomial: Tuple[int, ...]
+) -> GaloisField:
+    return GaloisField(characteristic, degree, modulus_polynomial)
+
+
+@functools.cache
+def _default_modulus_polynomial(characteristic: int, degree: int) -> Tuple[int, ...]:
+    return next(
+        polynomial
+        for polynomial in _monic_polynomials(characteristic, degree)
+        if _powers_of_x(characteristic, polynomial) is not None
+    )
+
+
+def _monic_polynomials(characteristic: int, degree: int) -> Iterator[Tuple[int, ...]]:
+    for coefficients in itertools.product(range(characteristic), repeat=degree):
+        if coefficients[-1] != 0:
+            yield tuple(reversed(coefficients)) + (1,)
+
+
+def _powers_of_x(
+    characteristic: int, modulus_polynomial: Tuple[int, ...]
+) -> Optional[List[int]]:
+    """
+    the values of x^0, x^1, ..., x^(p^k - 2) modulo the polynomial
+    or None if x doesn't generate the multiplicative group (the polynomial isn't primitive)
+    """
+    p, k = characteristic, len(modulus_polynomial) - 1
+    multiplicative_order = p**k - 1
+    weights = [p**i for i in range(k)]
+    coefficients = [0] * k
+    coefficients[0] = 1
+    values = []
+    for n in range(multiplicative_order):
+        value = sum(c * w for c, w in zip(coefficients, weights))
+        if n > 0 and value == 1:
+            return None
+        values.append(value)
+        # multiply by x and replace x^k by -(lower terms of the modulus polynomial)
+        leading = coefficients[-1]
+        coefficients = [0] + coefficients[:-1]
+        if leading:
+            coefficients = [
+                (c - leading * m) % p for c, m in zip(coefficients, modulus_polynomial)
+            ]
+    if sum(c * w for c, w in zip(coefficients, weights)) != 1:
+        return None
+    return values
@@ -0,0 +1,108 @@
+from typing import Union, Callable
+from dataclasses import dataclass
+from abstract_algebra.abstract_structures.field import FieldProtocol
+from abstract_algebra.linear_algebra.modular_arithmetic import is_prime
+
+
+@dataclass(init=True, frozen=True)
+class PrimeFieldElement(FieldProtocol):
+    """
+    an element of the prime field GF(p), stored as its residue in [0, p)
+    """
+
+    value: int
+    modulus: int
+
+    def __post_init__(self):
+        object.__setattr__(self, "value", self.value % self.modulus)
+
+    def __str__(self) -> str:
+        return f"{self.value}"
+
+    def _coerce(
+        self, other: Union["PrimeFieldElement", int], operator: str
+    ) -> Union["PrimeFieldElement", None]:
+        if isinstance(other, int):
+            return PrimeFieldElement(other, self.modulus)
+        if isinstance(other, PrimeFieldElement):
+            if other.modulus != self.modulus:
+                raise TypeError(
+                    f"unsupported operand type(s) for {operator}: "
+                    f"'GF({self.modulus})' and 'GF({other.modulus})'"
+                )
+            return other
+        return None
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (int, PrimeFieldElement)):
+            other = self._coerce(other, "==")
+            return self.value == other.value
+        else:
+            return NotImplemented
+
+    def __add__(self, other: Union["PrimeFieldElement", int]) -> "PrimeFieldElement":
+        if (element := self._coerce(other, "+")) is None:
+            return NotImplemented
+        return PrimeFieldElement(self.value + element.value, self.modulus)
+
+    def __radd__(self, other: Union["PrimeFieldElement", int]) -> "PrimeFieldElement":
+        return self + other
+
+    def __sub__(self, other: Union["PrimeFieldElement", int]) -> "PrimeFieldElement":
+        if (element := self._coerce(other, "-")) is None:
+            return NotImplemented
+        return PrimeFieldElement(self.value - element.value, self.modulus)
+
+    def __rsub__(self, other: Union["PrimeFieldElement", int]) -> "PrimeFieldElement":
+        if (element := self._coerce(other, "-")) is None:
+            return NotImplemented
+        return element - self
+
+    def __mul__(self, other: Union["PrimeFieldElement", int]) -> "PrimeFieldElement":
+        if (element := self._coerce(other, "*")) is None:
+            return NotImplemented
+        return PrimeFieldElement(self.value * element.value, self.modulus)
+
+    def __rmul__(self, other: Union["PrimeFieldElement", int]) -> "PrimeFieldElement":
+        return self * other
+
+    def __truediv__(
+        self, other: Union["PrimeFieldElement", int]
+    ) -> "PrimeFieldElement":
+        if (element := self._coerce(other, "/")) is None:
+            return NotImplemented
+        if element.value == 0:
+            raise ZeroDivisionError(f"division by zero in GF({self.modulus})")
+        return PrimeFieldElement(
+            self.value * pow(element.value, -1, self.modulus), self.modulus
+        )
+
+    def __rtruediv__(
+        self, other: Union["PrimeFieldElement", int]
+    ) -> "PrimeFieldElement":
+        if (element := self._coerce(other, "/")) is None:
+            return NotImplemented
+        return element / self
+
+    def get_additive_identity(self) -> "PrimeFieldElement":
+        return PrimeFieldElement(0, self.modulus)
+
+    def get_multiplicative_identity(self) -> "PrimeFieldElement":
+        return PrimeFieldElement(1, self.modulus)
+
+
+def prime_field(modulus: int) -> Callable[[int], PrimeFieldElement]:
+    """
+    a field_factory for GF(modulus), e.g.
+    Matrix.new_matrix([[1, 2], [3, 4]], prime_field(7))
+
+    :param modulus: a prime
+    :return: a function mapping an integer to its residue in GF(modulus)
+    """
+    if not is_prime(modulus):
+        raise ValueError(f"GF(p) needs a prime modulus: {modulus}")
+
+    def factory(value: int) -> PrimeFieldElement:
+        return PrimeFieldElement(value, modulus)
+
+    return factory
@@ -0,0 +1,105 @@
+from typing import Tuple, List, Any
+from dataclasses import dataclass
+import functools
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.linear_algebra import matrix_operations
+from abstract_algebra.linear_algebra.row_operations import RowOperationBuffer
+
+
+@dataclass(init=True, frozen=True)
+class Bareiss:
+    """
+    fraction-free elimination of a matrix over a Euclidean Ring
+
+    Every division performed is exact, so no Fraction is ever created.
+    Each entry of the resulting row echelon form is a minor of the base matrix,
+    so entry size is bounded by the Hadamard bound of the base matrix
+
+    Matrix (and the helpers shared with it) are typed for fields,
+    so the matrices over the ring are Matrix[Any] here
+    """
+
+    base_matrix: Matrix[Any]
+
+    @property
+    def row_echelon_form(self) -> Matrix[Any]:
+        return self._row_echelon_form_and_pivot_columns_and_parity[0]
+
+    @property
+    def pivot_columns(self) -> List[int]:
+        return self._row_echelon_form_and_pivot_columns_and_parity[1]
+
+    @property
+    def rank(self) -> int:
+        return len(self.pivot_columns)
+
+    @functools.cached_property
+    def determinant(self) -> Any:
+        row_echelon_form = self.row_echelon_form
+        if not matrix_operations.is_square(row_echelon_form):
+            return self._zero
+        if self.rank != row_echelon_form.shape[0]:
+            return self._zero
+        determinant = row_echelon_form[-1][-1]
+        if self._row_echelon_transformation_parity:
+            return additive_inverse(determinant)
+        else:
+            return determinant
+
+    @property
+    def _row_echelon_transformation_parity(self) -> bool:
+        return self._row_echelon_form_and_pivot_columns_and_parity[2]
+
+    @functools.cached_property
+    def _zero(self) -> Any:
+        return additive_identity(self.base_matrix[0][0])
+
+    @functools.cached_property
+    def _row_echelon_form_and_pivot_columns_and_parity(
+        self,
+    ) -> Tuple[Matrix[Any], List[int], bool]:
+        """
+        reduce the matrix to a fraction-free row echelon form
+
+        consider the k-th pivot p_k found at (k, c_k).
+        every row i below it is updated as:
+        row_i[j] = (p_k * row_i[j] - row_i[c_k] * row_k[j]) // p_(k-1)
+        where p_(-1) is the multiplicative identity.
+        The division is always exact (Sylvester's identity)
+
+        :return: R, pivot columns, parity (the row swap parity, as in GaussJordan)
+        """
+        buffer = RowOperationBuffer.from_matrix(
+            self.base_matrix, track_transformation=False
+        )
+        rows = buffer.rows
+        zero = buffer.zero
+        row_count, column_count = buffer.shape
+        previous_pivot = buffer.one
+        pivot_columns: List[int] = []
+        pivot_row = 0
+        for pivot_column in range(column_count):
+            if pivot_row >= row_count:
+                break
+            swap_row = -1
+            for i in range(pivot_row, row_count):
+                if rows[i][pivot_column] != zero:
+                    swap_row = i
+                    break
+            if swap_row == -1:
+                continue
+            buffer.swap(swap_row, pivot_row)
+            pivot = rows[pivot_row]
+            pivot_value = pivot[pivot_column]
+            for i in range(pivot_row + 1, row_count):
+                row = rows[i]
+                entry = row[pivot_column]
+                for j in range(pivot_column + 1, column_count):
+                    row[j] = (pivot_value * row[j] - entry * pivot[j]) // previous_pivot
+                row[pivot_column] = zero
+            previous_pivot = pivot_value
+            pivot_columns.append(pivot_column)
+            pivot_row += 1
+        return buffer.to_matrix(), pivot_columns, (buffer.swap_count % 2) != 0
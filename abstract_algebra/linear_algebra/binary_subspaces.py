@@ -0,0 +1,151 @@
+from typing import List, Tuple, Optional
+from dataclasses import dataclass
+import functools
+from abstract_algebra.compound_structures.binary_matrix import BinaryMatrix
+
+
+@dataclass(init=True, frozen=True)
+class BinarySubspaces:
+    """
+    the fundamental subspaces of a BinaryMatrix (see MatrixSubspaces)
+
+    Gauss-Jordan elimination over GF(2) works on whole packed rows,
+    so eliminating a pivot from a row is a single XOR.
+    Vectors are packed ints (bit j is entry j), the bases match MatrixSubspaces
+    """
+
+    matrix: BinaryMatrix
+
+    @property
+    def pivot_columns(self) -> List[int]:
+        return self._pivot_columns_and_reduced_rows[0]
+
+    @property
+    def reduced_row_echelon_form(self) -> BinaryMatrix:
+        return BinaryMatrix(
+            shape=self.matrix.shape, rows=tuple(self._pivot_columns_and_reduced_rows[1])
+        )
+
+    @property
+    def rank(self) -> int:
+        return len(self.pivot_columns)
+
+    @property
+    def nullity(self) -> int:
+        return self.matrix.shape[1] - self.rank
+
+    @functools.cached_property
+    def row_space(self) -> List[int]:
+        return self._pivot_columns_and_reduced_rows[1][: self.rank]
+
+    @functools.cached_property
+    def column_space(self) -> List[int]:
+        columns = self.matrix.transpose()
+        return [columns[j] for j in self.pivot_columns]
+
+    @functools.cached_property
+    def null_space(self) -> List[int]:
+        pivot_columns, reduced_rows = self._pivot_columns_and_reduced_rows
+        return null_space_from_reduced_rows(
+            pivot_columns, reduced_rows, self.matrix.shape[1]
+        )
+
+    @functools.cached_property
+    def _pivot_columns_and_reduced_rows(self) -> Tuple[List[int], List[int]]:
+        return reduce_rows(list(self.matrix.rows), self.matrix.shape[1])
+
+
+def reduce_rows(rows: List[int], column_count: int) -> Tuple[List[int], List[int]]:
+    """
+    Gauss-Jordan elimination of packed rows over GF(2) (in place)
+    only the lowest column_count bits are pivoted on,
+    any higher bits (e.g. an augmented right hand side) are carried along
+
+    :param rows: the packed rows
+    :param column_count: the number of columns that may hold a pivot
+    :return: the pivot columns, the reduced rows (the pivot rows come first)
+    """
+    pivot_columns: List[int] = []
+    rank = 0
+    for j in range(column_count):
+        mask = 1 << j
+        for i in range(rank, len(rows)):
+            if rows[i] & mask:
+                break
+        else:
+            continue
+        rows[rank], rows[i] = rows[i], rows[rank]
+        pivot_row = rows[rank]
+        for i in range(len(rows)):
+            if i != rank and rows[i] & mask:
+                rows[i] ^= pivot_row
+        pivot_columns.append(j)
+        rank += 1
+        if rank == len(rows):
+            break
+    return pivot_columns, rows
+
+
+def null_space_from_reduced_rows(
+    pivot_columns: List[int], reduced_rows: List[int], column_count: int
+) -> List[int]:
+    """
+    read a basis of the null space off of reduced packed rows (see reduce_rows)
+    one packed vector per free column, in increasing order of the free column
+    """
+    pivot_set = set(pivot_columns)
+    null_space: List[int] = []
+    for free_column in range(column_count):
+        if free_column in pivot_set:
+            continue
+        mask = 1 << free_column
+        vector = mask
+        for row, pivot_column in zip(reduced_rows, pivot_columns):
+            if row & mask:
+                vector |= 1 << pivot_column
+        null_space.append(vector)
+    return null_space
+
+
+def solve_binary_system(matrix: BinaryMatrix, b: int) -> Optional[int]:
+    """
+    solve Ax = b over GF(2) (free variables are set to 0)
+
+    :param matrix: the coefficient matrix A
+    :param b: the packed right hand side
+    :return: a packed solution or None if there is none
+    """
+    column_count = matrix.shape[1]
+    rhs_bit = 1 << column_count
+    augmented_rows = [
+        row | rhs_bit if (b >> i) & 1 else row for i, row in enumerate(matrix.rows)
+    ]
+    pivot_columns, reduced_rows = reduce_rows(augmented_rows, column_count)
+    if any(row & rhs_bit for row in reduced_rows[len(pivot_columns) :]):
+        return None
+    x = 0
+    for row, pivot_column in zip(reduced_rows, pivot_columns):
+        if row & rhs_bit:
+            x |= 1 << pivot_column
+    return x
+
+
+def completely_solve_binary_system(
+    matrix: BinaryMatrix, b: int
+) -> Tuple[Optional[int], List[int]]:
+    return solve_binary_system(matrix, b), BinarySubspaces(matrix).null_space
+
+
+def in_binary_span(vectors: List[int], v: int) -> bool:
+    """
+    check if a packed vector is a sum of some of the given packed vectors
+    """
+    basis: List[int] = []
+    for vector in vectors:
+        for basis_vector in basis:
+            vector = min(vector, vector ^ basis_vector)
+        if vector:
+            basis.append(vector)
+    for basis_vector in basis:
+        v = min(v, v ^ basis_vector)
+    return v == 0
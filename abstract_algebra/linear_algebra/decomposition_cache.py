@@ -0,0 +1,233 @@
+from typing import (
+    TypeVar,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+from collections import OrderedDict
+import functools
+import threading
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.compound_structures.fraction import Fraction
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+from abstract_algebra.concrete_structures.galois_field import GaloisFieldElement
+
+R = TypeVar("R")
+
+DEFAULT_MAX_ENTRIES = 256
+# the weight of a cache entry is the number of matrix / vector entries it holds
+DEFAULT_MAX_WEIGHT = 4_000_000
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    weight: int
+    max_entries: int
+    max_weight: int
+
+
+# maps an entry type to a function returning a hashable key for its entries
+# two entries with equal keys have to be equal
+_content_keys: Dict[Type, Callable[[Any], Hashable]] = {}
+
+
+def register_content_key(cls: Type, content_key: Callable[[Any], Hashable]) -> None:
+    """
+    register how entries of a type are keyed in the decomposition cache
+    (needed for entries that are unhashable or compare equal across different fields)
+
+    :param cls: the type of the entries
+    :param content_key: a function mapping an entry to a hashable key
+    """
+    _content_keys[cls] = content_key
+
+
+def _entry_key(entry: Any) -> Hashable:
+    content_key = _content_keys.get(type(entry))
+    if content_key is None:
+        return entry
+    return content_key(entry)
+
+
+register_content_key(
+    Fraction,
+    lambda fraction: (_entry_key(fraction.numerator), _entry_key(fraction.denominator)),
+)
+register_content_key(
+    PrimeFieldElement, lambda element: (element.value, element.modulus)
+)
+register_content_key(
+    GaloisFieldElement, lambda element: (element.field, element.exponent)
+)
+
+
+def matrix_key(matrix: Matrix) -> Optional[Hashable]:
+    """
+    a key that is equal for matrices of the same shape with equal entries of the same type
+
+    :param matrix: the matrix
+    :return: the key or None if the matrix can't be cached
+        (its entries are of mixed types or can't be hashed)
+    """
+    entries = tuple(matrix.storage.entries())
+    field_types = {type(entry) for entry in entries}
+    if len(field_types) != 1:
+        return None
+    (field_type,) = field_types
+    content_key = _content_keys.get(field_type)
+    if content_key is not None:
+        entries = tuple(content_key(entry) for entry in entries)
+    key = (field_type, matrix.shape, entries)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _weight(value: Any) -> int:
+    if isinstance(value, Matrix):
+        return value.shape[0] * value.shape[1]
+    if isinstance(value, Vector):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(_weight(item) for item in value)
+    return 1
+
+
+class DecompositionCache:
+    """
+    a bounded LRU cache for results computed from a matrix (e.g. its reduced row echelon form)
+
+    results are keyed by the content of the matrix (see matrix_key),
+    so equal matrices share them even if they are different instances.
+    The least recently used results are evicted once there are more than
+    max_entries of them or they hold more than max_weight entries in total.
+    Cached results have to be immutable.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_weight: int = DEFAULT_MAX_WEIGHT,
+    ):
+        self._results: "OrderedDict[Tuple[Hashable, str], Tuple[Any, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(
+        self, key: Optional[Hashable], name: str, compute: Callable[[], R]
+    ) -> R:
+        """
+        the cached result "name" for the matrix with the given key,
+        computed (and cached) on a miss
+
+        :param key: the matrix_key of the matrix (None computes without caching)
+        :param name: which result of the matrix to get
+        :param compute: computes the result
+        :return: the result
+        """
+        if key is None or self.max_entries == 0:
+            return compute()
+        cache_key = (key, name)
+        with self._lock:
+            try:
+                cached = self._results.get(cache_key)
+            except TypeError:
+                # entries that can't be compared with each other, see register_content_key
+                return compute()
+            if cached is not None:
+                self._results.move_to_end(cache_key)
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+        result = compute()
+        weight = _weight(result)
+        with self._lock:
+            if cache_key not in self._results:
+                self._results[cache_key] = (result, weight)
+                self._weight += weight
+                self._evict()
+        return result
+
+    def _evict(self) -> None:
+        while self._results and (
+            len(self._results) > self.max_entries or self._weight > self.max_weight
+        ):
+            _, (_, weight) = self._results.popitem(last=False)
+            self._weight -= weight
+            self._evictions += 1
+
+    def resize(self, max_entries: int, max_weight: int) -> None:
+        """
+        change the limits of the cache (0 entries disables it)
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_weight = max_weight
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        drop all results and reset the statistics
+        """
+        with self._lock:
+            self._results.clear()
+            self._weight = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._results),
+                weight=self._weight,
+                max_entries=self.max_entries,
+                max_weight=self.max_weight,
+            )
+
+
+# the process wide cache used by GaussJordan and MatrixSubspaces
+decomposition_cache = DecompositionCache()
+
+
+def shared_decomposition(method: Callable[[Any], R]) -> Callable[[Any], R]:
+    """
+    share the result of a method across all instances with an equal matrix
+    through the process wide decomposition_cache,
+    the instances need a "_matrix_key" attribute (see matrix_key)
+
+    @functools.cached_property
+    @shared_decomposition
+    def _reduced_row_echelon_form(self) -> Matrix[F]:
+        ...
+    """
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self: Any) -> R:
+        return decomposition_cache.get_or_compute(
+            self._matrix_key, name, lambda: method(self)
+        )
+
+    return wrapper
@@ -0,0 +1,141 @@
+from typing import List, Optional, Tuple
+from dataclasses import dataclass
+import functools
+import itertools
+import math
+import numpy as np
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.compound_structures.fraction import Fraction
+from abstract_algebra.linear_algebra import modular_arithmetic
+from abstract_algebra.linear_algebra import numpy_backend
+
+
+@dataclass(init=True, frozen=True)
+class Dixon:
+    """
+    exact solutions of square nonsingular systems over int or Fraction[int] by p-adic lifting
+
+    A (with its denominators cleared) is inverted once modulo a word sized prime p,
+    then every step of the lifting finds the next p-adic digit of the solution:
+        x_i = C r mod p, r = (r - A x_i) / p    (C = A^-1 mod p, starting with r = b)
+    so x_0 + x_1 p + ... + x_(k-1) p^(k-1) solves Ax = b modulo p^k.
+    The rational solution is rebuilt by rational reconstruction once p^k passes
+    the bound of Cramer's rule (it is tried earlier and verified against Ax = b).
+
+    Only the integers of A and b and the p-adic digits take part in the lifting,
+    so no intermediate coefficients grow, every step costs O(n^2) and
+    the number of steps is linear in n times the size of the entries
+
+    (int matrices and vectors are accepted as well, they are typed as Fraction[int]
+    because Matrix needs a field)
+    """
+
+    base_matrix: Matrix[Fraction[int]]
+
+    def solve(self, b: Vector[Fraction[int]]) -> Optional[Vector[Fraction[int]]]:
+        """
+        solve Ax = b exactly
+
+        :param b: the right hand side
+        :return: the solution or None if A is not square or singular
+        """
+        if len(b) != self.base_matrix.shape[0]:
+            raise TypeError(
+                f"unsupported operand type(s) for solve: "
+                f"'Matrix[{self.base_matrix.field}]' of size {self.base_matrix.shape} incompatible with"
+                f"'Dim(Vector[{b.field}])={len(b)}'"
+            )
+        if self._prime_and_inverse is None:
+            return None
+        p, inverse = self._prime_and_inverse
+        rows, scales = self._integer_rows_and_scales
+
+        # A'x = b' for the integer rows A' of A (row i scaled by scales[i]),
+        # b' is scaled by one more common denominator
+        scaled_b = [
+            (b_i if isinstance(b_i, Fraction) else Fraction(b_i)) * scale
+            for b_i, scale in zip(b, scales)
+        ]
+        rhs_denominator = math.lcm(*(b_i.denominator for b_i in scaled_b))
+        rhs = [b_i.numerator * (rhs_denominator // b_i.denominator) for b_i in scaled_b]
+
+        # Cramer's rule: x_j = det(A_j) / det(A)
+        denominator_bound = modular_arithmetic.hadamard_bound(rows)
+        numerator_bound = modular_arithmetic.hadamard_bound(
+            [row + [b_i] for row, b_i in zip(rows, rhs)]
+        )
+        bound = 2 * numerator_bound * denominator_bound
+
+        residues = [0 for _ in rows]
+        residual = list(rhs)
+        modulus = 1
+        next_attempt = 1
+        for step in itertools.count(1):
+            residual_array = np.array([[r_i % p] for r_i in residual], dtype=np.int64)
+            digits = [
+                int(x_i)
+                for x_i in numpy_backend.matmul_modulo(inverse, residual_array, p)[:, 0]
+            ]
+            residues = [x_i + modulus * d_i for x_i, d_i in zip(residues, digits)]
+            modulus *= p
+            residual = [
+                (r_i - math.sumprod(row, digits)) // p
+                for row, r_i in zip(rows, residual)
+            ]
+
+            if modulus <= bound and step < next_attempt:
+                continue
+            # early attempts with the balanced bound, doubling the number of steps in between
+            next_attempt = 2 * step
+            solution = modular_arithmetic.reconstruct_solution(
+                rows,
+                rhs,
+                residues,
+                modulus,
+                numerator_bound if modulus > bound else None,
+            )
+            if solution is not None:
+                return Vector.new_vector_unchecked(
+                    tuple(
+                        Fraction(numerator, denominator * rhs_denominator)
+                        for numerator, denominator in solution
+                    )
+                )
+            if modulus > bound:
+                return None
+        raise AssertionError("The lifting only ends by returning")
+
+    @functools.cached_property
+    def _integer_rows_and_scales(self) -> Tuple[List[List[int]], List[int]]:
+        return modular_arithmetic.integer_rows([list(row) for row in self.base_matrix])
+
+    @functools.cached_property
+    def _prime_and_inverse(self) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        a word sized prime p that doesn't divide det(A) and A^-1 mod p
+
+        :return: p and the inverse (an int64 array) or None if A is not square or singular
+        """
+        row_count, column_count = self.base_matrix.shape
+        if row_count != column_count:
+            return None
+        rows, _ = self._integer_rows_and_scales
+        identity = [[int(i == j) for j in range(row_count)] for i in range(row_count)]
+        denominator_bound = modular_arithmetic.hadamard_bound(rows)
+        bad_modulus = 1
+        for p in modular_arithmetic.word_primes():
+            reduced_rows, pivot_columns, _ = modular_arithmetic.row_reduce_modulo(
+                [row + identity_row for row, identity_row in zip(rows, identity)],
+                p,
+                reduced=True,
+            )
+            if pivot_columns == list(range(row_count)):
+                return p, np.array(
+                    [row[row_count:] for row in reduced_rows], dtype=np.int64
+                )
+            # p divides det(A), once that product passes the bound det(A) = 0
+            bad_modulus *= p
+            if bad_modulus > denominator_bound:
+                return None
+        return None
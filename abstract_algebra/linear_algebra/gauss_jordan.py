@@ -1,6 +1,7 @@
-from typing import TypeVar, Tuple, Generic, List
+from typing import TypeVar, Tuple, Generic, List, Optional, Hashable
 from dataclasses import dataclass
 import functools
+import bisect
 from abstract_algebra.abstract_structures.monoid import additive_identity
 from abstract_algebra.abstract_structures.group import additive_inverse
 from abstract_algebra.abstract_structures.ring import multiplicative_identity
@@ -12,6 +13,12 @@ from abstract_algebra.compound_structures.vector import Vector
 from abstract_algebra.compound_structures.matrix import Matrix
 from abstract_algebra.linear_algebra import vector_operations
 from abstract_algebra.linear_algebra import matrix_operations
+from abstract_algebra.linear_algebra.row_operations import new_row_operation_buffer
+from abstract_algebra.linear_algebra.kernels import kernels_for
+from abstract_algebra.linear_algebra.decomposition_cache import (
+    matrix_key,
+    shared_decomposition,
+)
 
 F = TypeVar("F", bound=FieldProtocol)
 
@@ -22,7 +29,9 @@ class GaussJordan(Generic[F]):
 
     @property
     def reduced_row_echelon_form(self) -> Matrix[F]:
-        return self._reduced_row_echelon_form_and_transformation_matrix[0]
+        if self._is_computed("_reduced_row_echelon_form_and_transformation_matrix"):
+            return self._reduced_row_echelon_form_and_transformation_matrix[0]
+        return self._reduced_row_echelon_form
 
     @property
     def pseudo_inverse(self) -> Matrix[F]:
@@ -30,7 +39,7 @@ class GaussJordan(Generic[F]):
 
     @functools.cached_property
     def determinant(self) -> F:
-        if not matrix_operations.is_square(self.row_echelon_form):
+        if not matrix_operations.is_square(self.base_matrix):
             return self._zero
         determinant = matrix_operations.diagonal_product(self.row_echelon_form)
         if self._row_echelon_transformation_parity:
@@ -40,11 +49,282 @@ class GaussJordan(Generic[F]):
 
     @property
     def pseudo_diagonal(self) -> Matrix[F]:
-        return self._pseudo_diagonal_form_and_transformation_matrix[0]
+        if self._is_computed("_pseudo_diagonal_form_and_transformation_matrix"):
+            return self._pseudo_diagonal_form_and_transformation_matrix[0]
+        return self._pseudo_diagonal_form
 
     @property
     def row_echelon_form(self) -> Matrix[F]:
-        return self._row_echelon_form_and_transformation_matrix_and_parity[0]
+        if self._is_computed("_row_echelon_form_and_transformation_matrix_and_parity"):
+            return self._row_echelon_form_and_transformation_matrix_and_parity[0]
+        return self._row_echelon_form_and_parity[0]
+
+    @property
+    def pivot_columns(self) -> Tuple[int, ...]:
+        return tuple(self._pivot_columns)
+
+    @property
+    def rank(self) -> int:
+        return len(self._pivot_columns)
+
+    def rank_one_update(self, u: Vector[F], v: Vector[F]) -> "GaussJordan[F]":
+        """
+        the decomposition of A + uv^T (the outer product of u and v added to A)
+
+        if A is invertible its inverse and determinant are updated in O(n^2)
+        with the Sherman-Morrison formula:
+        (A + uv^T)^-1 = A^-1 - (A^-1 u)(v^T A^-1) / (1 + v^T A^-1 u)
+        det(A + uv^T) = det(A) (1 + v^T A^-1 u)
+        otherwise (A is singular or the update makes it singular)
+        the updated matrix is decomposed from scratch
+
+        :param u: a vector with one entry per row of A
+        :param v: a vector with one entry per column of A
+        :return: the decomposition of the updated matrix
+        """
+        row_count, column_count = self.base_matrix.shape
+        if len(u) != row_count or len(v) != column_count:
+            raise TypeError(
+                f"unsupported operand type(s) for rank one update: "
+                f"'Matrix[{self.base_matrix.field}]' of size {self.base_matrix.shape} "
+                f"and vectors of size {len(u)} and {len(v)}"
+            )
+        updated_matrix = Matrix.new_matrix_unchecked(
+            _add_outer_product(self.base_matrix, u, v, self._one)
+        )
+        if not self._is_invertible:
+            return GaussJordan(updated_matrix)
+
+        reduced_matrix, inverse = (
+            self._reduced_row_echelon_form_and_transformation_matrix
+        )
+        inverse_u = inverse @ u
+        v_inverse = inverse.transpose() @ v
+        denominator = self._one + vector_operations.dot_product(v, inverse_u)
+        if denominator == self._zero:
+            return GaussJordan(updated_matrix)
+        factor = additive_inverse(multiplicative_inverse(denominator))
+        updated_inverse = Matrix.new_matrix_unchecked(
+            _add_outer_product(inverse, inverse_u, v_inverse, factor)
+        )
+        return GaussJordan._from_known_results(
+            updated_matrix,
+            reduced_matrix,
+            updated_inverse,
+            determinant=self.determinant * denominator,
+        )
+
+    def replace_row(self, i: int, row: Vector[F]) -> "GaussJordan[F]":
+        """
+        the decomposition with row i of A replaced (a rank one update, see rank_one_update)
+        """
+        return self.rank_one_update(
+            self._unit_vector(i, self.base_matrix.shape[0]), row - self.base_matrix[i]
+        )
+
+    def replace_column(self, j: int, column: Vector[F]) -> "GaussJordan[F]":
+        """
+        the decomposition with column j of A replaced (a rank one update, see rank_one_update)
+        """
+        return self.rank_one_update(
+            column - self.base_matrix.column(j),
+            self._unit_vector(j, self.base_matrix.shape[1]),
+        )
+
+    def replace_entry(self, i: int, j: int, value: F) -> "GaussJordan[F]":
+        """
+        the decomposition with entry (i, j) of A replaced (a rank one update, see rank_one_update)
+        """
+        return self.rank_one_update(
+            self._unit_vector(
+                i, self.base_matrix.shape[0], value - self.base_matrix[i][j]
+            ),
+            self._unit_vector(j, self.base_matrix.shape[1]),
+        )
+
+    def append_row(self, row: Vector[F]) -> "GaussJordan[F]":
+        """
+        the decomposition of A with a row appended at the bottom, in O(m(m + n))
+
+        the new row is reduced by the rows of R (E is extended by a row for it).
+        If anything is left it becomes a new pivot row, is cleared out of the other rows
+        and moved up to its place in R.
+        The determinant is only known without a new elimination if R has a zero row
+
+        :param row: the new row
+        :return: the decomposition of the larger matrix
+        """
+        row_count, column_count = self.base_matrix.shape
+        if len(row) != column_count:
+            raise TypeError(
+                f"Cannot append a row of size {len(row)} to "
+                f"Matrix[{self.base_matrix.field}] of size {self.base_matrix.shape}"
+            )
+        zero, one = self._zero, self._one
+        reduced_matrix, transformation = (
+            self._reduced_row_echelon_form_and_transformation_matrix
+        )
+        reduced_rows = [list(r) for r in reduced_matrix.storage.to_rows()]
+        transformation_rows = [
+            list(r) + [zero] for r in transformation.storage.to_rows()
+        ]
+        pivot_columns = matrix_operations.reduced_form_pivot_columns(
+            reduced_matrix, column_count
+        )
+
+        new_row = list(row.entries)
+        new_transformation_row = [zero] * row_count + [one]
+        for i, pivot_column in enumerate(pivot_columns):
+            factor = row[pivot_column]
+            if factor != zero:
+                _subtract_multiple(new_row, reduced_rows[i], factor)
+                _subtract_multiple(
+                    new_transformation_row, transformation_rows[i], factor
+                )
+
+        new_pivot_column = vector_operations.identify_first_nonzero_entry(
+            Vector.new_vector_unchecked(tuple(new_row))
+        )
+        if new_pivot_column == -1:
+            reduced_rows.append(new_row)
+            transformation_rows.append(new_transformation_row)
+        else:
+            scale = multiplicative_inverse(new_row[new_pivot_column])
+            kernels = kernels_for(type(scale))
+            new_row = kernels.scale(scale, new_row)
+            new_transformation_row = kernels.scale(scale, new_transformation_row)
+            for i in range(len(pivot_columns)):
+                factor = reduced_rows[i][new_pivot_column]
+                if factor != zero:
+                    _subtract_multiple(reduced_rows[i], new_row, factor)
+                    _subtract_multiple(
+                        transformation_rows[i], new_transformation_row, factor
+                    )
+            index = bisect.bisect(pivot_columns, new_pivot_column)
+            reduced_rows.insert(index, new_row)
+            transformation_rows.insert(index, new_transformation_row)
+
+        return GaussJordan._from_reduced_rows(
+            Matrix.new_matrix_unchecked(
+                list(self.base_matrix.storage.to_rows()) + [row.entries]
+            ),
+            reduced_rows,
+            transformation_rows,
+        )
+
+    def delete_row(self, i: int) -> "GaussJordan[F]":
+        """
+        the decomposition of A with row i removed, in O(m(m + n))
+
+        column i of E is cleared with the last row k of E that is nonzero there,
+        afterwards no other row of E uses row i of A,
+        so row k and column i of E and row k of R are dropped.
+        If row k of R is zero this leaves R untouched,
+        otherwise its pivot column turns into a free column and R stays reduced.
+        The determinant is only known without a new elimination if R has a zero row
+
+        :param i: the index of the row to remove
+        :return: the decomposition of the smaller matrix
+        """
+        row_count = self.base_matrix.shape[0]
+        if row_count == 1:
+            raise ValueError("Cannot delete the only row of a matrix")
+        i = range(row_count)[i]
+        zero = self._zero
+        reduced_matrix, transformation = (
+            self._reduced_row_echelon_form_and_transformation_matrix
+        )
+        reduced_rows = [list(r) for r in reduced_matrix.storage.to_rows()]
+        transformation_rows = [list(r) for r in transformation.storage.to_rows()]
+        k = max(k for k in range(row_count) if transformation_rows[k][i] != zero)
+        scale = multiplicative_inverse(transformation_rows[k][i])
+        for j in range(row_count):
+            factor = transformation_rows[j][i]
+            if j != k and factor != zero:
+                factor = factor * scale
+                _subtract_multiple(
+                    transformation_rows[j], transformation_rows[k], factor
+                )
+                _subtract_multiple(reduced_rows[j], reduced_rows[k], factor)
+        del reduced_rows[k]
+        del transformation_rows[k]
+        for transformation_row in transformation_rows:
+            del transformation_row[i]
+
+        remaining_rows = self.base_matrix.storage.to_rows()
+        return GaussJordan._from_reduced_rows(
+            Matrix.new_matrix_unchecked(remaining_rows[:i] + remaining_rows[i + 1 :]),
+            reduced_rows,
+            transformation_rows,
+        )
+
+    @classmethod
+    def _from_known_results(
+        cls,
+        base_matrix: Matrix[F],
+        reduced_row_echelon_form: Matrix[F],
+        pseudo_inverse: Matrix[F],
+        determinant: Optional[F] = None,
+    ) -> "GaussJordan[F]":
+        """
+        a decomposition with its reduced row echelon form and pseudo inverse
+        (and optionally its determinant) already filled in,
+        everything else is computed from base_matrix when it is needed
+        """
+        gauss_jordan = cls(base_matrix)
+        gauss_jordan.__dict__["_reduced_row_echelon_form_and_transformation_matrix"] = (
+            reduced_row_echelon_form,
+            pseudo_inverse,
+        )
+        if determinant is not None:
+            gauss_jordan.__dict__["determinant"] = determinant
+        return gauss_jordan
+
+    @classmethod
+    def _from_reduced_rows(
+        cls,
+        base_matrix: Matrix[F],
+        reduced_rows: List[List[F]],
+        transformation_rows: List[List[F]],
+    ) -> "GaussJordan[F]":
+        zero = additive_identity(base_matrix[0][0])
+        determinant = None
+        if matrix_operations.is_square(base_matrix) and reduced_rows[-1][-1] == zero:
+            determinant = zero
+        return cls._from_known_results(
+            base_matrix,
+            Matrix.new_matrix_unchecked(reduced_rows),
+            Matrix.new_matrix_unchecked(transformation_rows),
+            determinant=determinant,
+        )
+
+    def _unit_vector(
+        self, index: int, dimension: int, value: Optional[F] = None
+    ) -> Vector[F]:
+        """
+        the vector with "value" (default 1) at index and 0 everywhere else
+        """
+        index = range(dimension)[index]
+        value = self._one if value is None else value
+        return Vector.new_vector_unchecked(
+            tuple(value if k == index else self._zero for k in range(dimension))
+        )
+
+    @functools.cached_property
+    def _is_invertible(self) -> bool:
+        if not matrix_operations.is_square(self.base_matrix):
+            return False
+        last = self.base_matrix.shape[0] - 1
+        reduced_matrix = self._reduced_row_echelon_form_and_transformation_matrix[0]
+        return reduced_matrix[last][last] != self._zero
+
+    @functools.cached_property
+    def _matrix_key(self) -> Optional[Hashable]:
+        """
+        the decompositions are shared with every GaussJordan of an equal matrix
+        through the decomposition cache
+        """
+        return matrix_key(self.base_matrix)
 
     @functools.cached_property
     def _zero(self) -> F:
@@ -54,15 +334,78 @@ class GaussJordan(Generic[F]):
     def _one(self) -> F:
         return multiplicative_identity(self.base_matrix[0][0])
 
-    @property
-    def _row_echelon_transformation_matrix(self) -> Matrix[F]:
-        return self._row_echelon_form_and_transformation_matrix_and_parity[1]
+    def _is_computed(self, name: str) -> bool:
+        """
+        check if a cached property has already been computed (or filled in)
+
+        the decomposition only tracks the transformation matrix E
+        when something that needs it (e.g. pseudo_inverse) is read,
+        results without E are taken from the tracked elimination if it already happened
+        """
+        return name in self.__dict__
+
+    @functools.cached_property
+    def _pivot_columns(self) -> List[int]:
+        """
+        the pivot column of each nonzero row of the row echelon form
+        """
+        if self._is_computed("_reduced_row_echelon_form_and_transformation_matrix"):
+            return matrix_operations.reduced_form_pivot_columns(
+                self.reduced_row_echelon_form, self.base_matrix.shape[1]
+            )
+        pivot_columns: List[int] = []
+        for row in self.row_echelon_form:
+            pivot_column = vector_operations.identify_first_nonzero_entry(row)
+            if pivot_column == -1:
+                break
+            pivot_columns.append(pivot_column)
+        return pivot_columns
 
     @property
     def _row_echelon_transformation_parity(self) -> bool:
-        return self._row_echelon_form_and_transformation_matrix_and_parity[2]
+        if self._is_computed("_row_echelon_form_and_transformation_matrix_and_parity"):
+            return self._row_echelon_form_and_transformation_matrix_and_parity[2]
+        return self._row_echelon_form_and_parity[1]
+
+    @functools.cached_property
+    @shared_decomposition
+    def _row_echelon_form_and_parity(self) -> Tuple[Matrix[F], bool]:
+        """
+        the row echelon form and its row swap parity,
+        without tracking E (see _row_echelon_form_and_transformation_matrix_and_parity)
+        """
+        buffer = new_row_operation_buffer(self.base_matrix, track_transformation=False)
+        buffer.forward_eliminate()
+        return buffer.to_matrix(), (buffer.swap_count % 2) != 0
+
+    @functools.cached_property
+    @shared_decomposition
+    def _pseudo_diagonal_form(self) -> Matrix[F]:
+        """
+        the pseudo-diagonalized form without tracking E
+        (see _pseudo_diagonal_form_and_transformation_matrix)
+        """
+        buffer = new_row_operation_buffer(
+            self.row_echelon_form, track_transformation=False
+        )
+        buffer.backward_eliminate(self._pivot_columns)
+        return buffer.to_matrix()
+
+    @functools.cached_property
+    @shared_decomposition
+    def _reduced_row_echelon_form(self) -> Matrix[F]:
+        """
+        the reduced row echelon form without tracking E
+        (see _reduced_row_echelon_form_and_transformation_matrix)
+        """
+        buffer = new_row_operation_buffer(
+            self.pseudo_diagonal, track_transformation=False
+        )
+        buffer.normalize_pivots(self._pivot_columns)
+        return buffer.to_matrix()
 
     @functools.cached_property
+    @shared_decomposition
     def _row_echelon_form_and_transformation_matrix_and_parity(
         self,
     ) -> Tuple[Matrix[F], Matrix[F], bool]:
@@ -81,61 +424,16 @@ class GaussJordan(Generic[F]):
         :return: R, E, parity (see above for definition of these values)
         """
 
-        result_matrix = self.base_matrix
-
-        row_operation_dimension = result_matrix.shape[0]
-        identity_matrix = matrix_operations.identity_matrix(
-            dimensions=row_operation_dimension, example_field_element=self._one
+        buffer = new_row_operation_buffer(self.base_matrix)
+        buffer.forward_eliminate()
+        return (
+            buffer.to_matrix(),
+            buffer.transformation_matrix(),
+            (buffer.swap_count % 2) != 0,
         )
-        row_operations = identity_matrix
-
-        swap_count = 0
-        pivot_row: int = 0
-        for pivot_column in range(0, result_matrix.shape[0] - 1):
-            column = result_matrix.transpose()[pivot_column]
-            swap_row = vector_operations.identify_first_nonzero_entry(
-                column, starting_index=pivot_row
-            )
-
-            if swap_row == -1:
-                continue
-
-            if swap_row != pivot_row:
-                swap_count += 1
-                row_swap_list: List[Vector[F]] = list(identity_matrix.rows)
-                temp_row: Vector[F] = row_swap_list[swap_row]
-                row_swap_list[swap_row] = row_swap_list[pivot_row]
-                row_swap_list[pivot_row] = temp_row
-                row_swap_matrix: Matrix[F] = Matrix.new_matrix(row_swap_list)
-                result_matrix = row_swap_matrix @ result_matrix
-                row_operations = row_swap_matrix @ row_operations
-
-            pivot_value = result_matrix[pivot_row][pivot_column]
-            pivot_matrix: Matrix[F] = Matrix.new_matrix(
-                [
-                    [
-                        (
-                            self._one
-                            if (j == i)
-                            else (
-                                self._zero
-                                if (j != pivot_column or i < pivot_row)
-                                else (self._zero - (result_matrix[i][j] / pivot_value))
-                            )
-                        )
-                        for j in range(row_operation_dimension)
-                    ]
-                    for i in range(row_operation_dimension)
-                ]
-            )
-
-            row_operations = pivot_matrix @ row_operations
-            result_matrix = pivot_matrix @ result_matrix
-            pivot_row += 1
-
-        return result_matrix, row_operations, (swap_count % 2) != 0
 
     @functools.cached_property
+    @shared_decomposition
     def _pseudo_diagonal_form_and_transformation_matrix(
         self,
     ) -> Tuple[Matrix[F], Matrix[F]]:
@@ -157,44 +455,17 @@ class GaussJordan(Generic[F]):
         :return: D, E (as defined above)
         """
 
-        result_matrix = self.row_echelon_form
-        row_operations = self._row_echelon_transformation_matrix
-
-        row_operation_dimension = result_matrix.shape[0]
-        for pivot_column in range(result_matrix.shape[1] - 1, -1, -1):
-            column = result_matrix.transpose()[pivot_column]
-            pivot_row = vector_operations.identify_first_nonzero_entry(
-                column, starting_index=row_operation_dimension - 1, reverse=True
-            )
-            if pivot_row == -1:
-                continue
-            pivot_value = result_matrix[pivot_row][pivot_column]
-            pivot_matrix: Matrix[F] = Matrix.new_matrix(
-                [
-                    [
-                        (
-                            self._one
-                            if (j == i)
-                            else (
-                                self._zero
-                                if (j != pivot_row or i > pivot_row)
-                                else (
-                                    self._zero
-                                    - (result_matrix[i][pivot_column] / pivot_value)
-                                )
-                            )
-                        )
-                        for j in range(row_operation_dimension)
-                    ]
-                    for i in range(row_operation_dimension)
-                ]
-            )
-            row_operations = pivot_matrix @ row_operations
-            result_matrix = pivot_matrix @ result_matrix
-
-        return result_matrix, row_operations
+        row_echelon_form, transformation, _ = (
+            self._row_echelon_form_and_transformation_matrix_and_parity
+        )
+        buffer = new_row_operation_buffer(
+            row_echelon_form, transformation=transformation
+        )
+        buffer.backward_eliminate(self._pivot_columns)
+        return buffer.to_matrix(), buffer.transformation_matrix()
 
     @functools.cached_property
+    @shared_decomposition
     def _reduced_row_echelon_form_and_transformation_matrix(
         self,
     ) -> Tuple[Matrix[F], Matrix[F]]:
@@ -214,32 +485,31 @@ class GaussJordan(Generic[F]):
 
         :return: R, E (see above for the definition of these values)
         """
-        starting_matrix = self.pseudo_diagonal
-        row_operations = self._pseudo_diagonal_form_and_transformation_matrix[1]
-
-        pivot_indexes = [
-            vector_operations.identify_first_nonzero_entry(starting_matrix[i])
-            for i in range(starting_matrix.shape[0])
-        ]
-
-        scaling_matrix: Matrix[F] = Matrix.new_matrix(
-            [
-                [
-                    (
-                        self._zero
-                        if i != j
-                        else (
-                            self._one
-                            if pivot_indexes[i] == -1
-                            else multiplicative_inverse(
-                                starting_matrix[i][pivot_indexes[i]]
-                            )
-                        )
-                    )
-                    for j in range(starting_matrix.shape[0])
-                ]
-                for i in range(starting_matrix.shape[0])
-            ]
+        pseudo_diagonal, transformation = (
+            self._pseudo_diagonal_form_and_transformation_matrix
         )
-
-        return scaling_matrix @ starting_matrix, scaling_matrix @ row_operations
+        buffer = new_row_operation_buffer(
+            pseudo_diagonal, transformation=transformation
+        )
+        buffer.normalize_pivots(self._pivot_columns)
+        return buffer.to_matrix(), buffer.transformation_matrix()
+
+
+def _subtract_multiple(target: List[F], source: List[F], factor: F) -> None:
+    """
+    target = target - factor * source (in place)
+    """
+    target[:] = kernels_for(type(factor)).axpy(additive_inverse(factor), source, target)
+
+
+def _add_outer_product(
+    matrix: Matrix[F], u: Vector[F], v: Vector[F], factor: F
+) -> List[List[F]]:
+    """
+    the rows of matrix + factor * uv^T
+    """
+    kernels = kernels_for(type(factor))
+    return [
+        kernels.axpy(factor * u_entry, v.entries, row)
+        for row, u_entry in zip(matrix.storage.to_rows(), u)
+    ]
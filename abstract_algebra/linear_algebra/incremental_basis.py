@@ -0,0 +1,150 @@
+from typing import TypeVar, Generic, List, Optional, Iterable
+from dataclasses import dataclass, field
+import bisect
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.field import (
+    FieldProtocol,
+    multiplicative_inverse,
+)
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.linear_algebra.kernels import kernels_for
+
+F = TypeVar("F", bound=FieldProtocol)
+
+
+@dataclass(init=True)
+class IncrementalBasis(Generic[F]):
+    """
+    a basis of the span of a stream of vectors, grown one vector at a time
+
+    the span is kept as reduced rows: every row has a 1 in its pivot column
+    and all other rows are 0 there (the nonzero rows of a reduced row echelon form).
+    A vector v then lies in the span iff v - sum(v[p] * row_p) is zero,
+    so every operation costs O(rank * dimension) instead of a new Gauss-Jordan elimination
+
+    "basis" holds the added vectors that increased the rank,
+    "coefficients" expresses every reduced row in terms of them:
+    reduced_rows[i] = sum(coefficients[i][k] * basis[k])
+    """
+
+    dimension: int
+    basis: List[Vector[F]] = field(default_factory=list)
+    reduced_rows: List[List[F]] = field(default_factory=list)
+    pivot_columns: List[int] = field(default_factory=list)
+    coefficients: List[List[F]] = field(default_factory=list)
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector[F]]) -> "IncrementalBasis[F]":
+        vectors = list(vectors)
+        if not vectors:
+            raise ValueError("Cannot find the dimension of an empty list of vectors")
+        incremental_basis = cls(dimension=len(vectors[0]))
+        for vector in vectors:
+            incremental_basis.add(vector)
+        return incremental_basis
+
+    @property
+    def rank(self) -> int:
+        return len(self.basis)
+
+    def _validate_vector(self, v: Vector[F]) -> bool:
+        if len(v) != self.dimension:
+            raise TypeError(
+                f"Vector doesn't fit into IncrementalBasis of dimension {self.dimension}: "
+                f"Mismatched dims: {len(v)} | {self.dimension}"
+            )
+        return True
+
+    def _residual(self, v: Vector[F]) -> List[F]:
+        """
+        v minus its projection onto the span along the pivot columns
+        """
+        zero = additive_identity(v[0])
+        kernels = kernels_for(v.field)
+        residual = list(v.entries)
+        for row, pivot_column in zip(self.reduced_rows, self.pivot_columns):
+            factor = v[pivot_column]
+            if factor == zero:
+                continue
+            residual = kernels.axpy(additive_inverse(factor), row, residual)
+        return residual
+
+    def contains(self, v: Vector[F]) -> bool:
+        self._validate_vector(v)
+        zero = additive_identity(v[0])
+        return all(entry == zero for entry in self._residual(v))
+
+    def __contains__(self, v: Vector[F]) -> bool:
+        return self.contains(v)
+
+    def coordinates(self, v: Vector[F]) -> Optional[Vector[F]]:
+        """
+        the coefficients c with v = sum(c[k] * basis[k])
+
+        :param v: the vector
+        :return: the coefficients or None if v is not in the span (or the basis is still empty)
+        """
+        if not self.contains(v) or self.rank == 0:
+            return None
+        zero = additive_identity(v[0])
+        kernels = kernels_for(v.field)
+        coordinates = [zero] * self.rank
+        for coefficient_row, pivot_column in zip(self.coefficients, self.pivot_columns):
+            factor = v[pivot_column]
+            if factor == zero:
+                continue
+            coordinates = kernels.axpy(factor, coefficient_row, coordinates)
+        return Vector.new_vector_unchecked(tuple(coordinates))
+
+    def add(self, v: Vector[F]) -> bool:
+        """
+        add a vector to the span
+
+        :param v: the vector
+        :return: True if the vector increased the rank (it is appended to "basis")
+        """
+        self._validate_vector(v)
+        zero = additive_identity(v[0])
+        one = multiplicative_identity(v[0])
+        kernels = kernels_for(v.field)
+        residual = self._residual(v)
+        pivot_column = next(
+            (k for k, entry in enumerate(residual) if entry != zero), None
+        )
+        if pivot_column is None:
+            return False
+
+        # residual = v - sum(v[p] * reduced_rows[p]), in terms of the basis with v appended
+        for coefficient_row in self.coefficients:
+            coefficient_row.append(zero)
+        new_coefficients = [zero] * self.rank + [one]
+        for coefficient_row, column in zip(self.coefficients, self.pivot_columns):
+            factor = v[column]
+            if factor == zero:
+                continue
+            new_coefficients = kernels.axpy(
+                additive_inverse(factor), coefficient_row, new_coefficients
+            )
+
+        scale = multiplicative_inverse(residual[pivot_column])
+        new_row = kernels.scale(scale, residual)
+        new_coefficients = kernels.scale(scale, new_coefficients)
+
+        # clear the new pivot column out of the other rows
+        for row, coefficient_row in zip(self.reduced_rows, self.coefficients):
+            factor = row[pivot_column]
+            if factor == zero:
+                continue
+            row[:] = kernels.axpy(additive_inverse(factor), new_row, row)
+            coefficient_row[:] = kernels.axpy(
+                additive_inverse(factor), new_coefficients, coefficient_row
+            )
+
+        index = bisect.bisect(self.pivot_columns, pivot_column)
+        self.pivot_columns.insert(index, pivot_column)
+        self.reduced_rows.insert(index, new_row)
+        self.coefficients.insert(index, new_coefficients)
+        self.basis.append(v)
+        return True
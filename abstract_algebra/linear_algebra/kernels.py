@@ -0,0 +1,285 @@
+from typing import (
+    TypeVar,
+    Generic,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    cast,
+)
+from dataclasses import dataclass
+import functools
+import math
+import numpy as np
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.field import FieldProtocol
+from abstract_algebra.compound_structures.fraction import Fraction, Rational
+from abstract_algebra.concrete_structures.complex import ComplexNumber
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+from abstract_algebra.linear_algebra import numpy_backend
+
+F = TypeVar("F", bound=FieldProtocol)
+
+
+@dataclass(init=True, frozen=True)
+class FieldKernels(Generic[F]):
+    """
+    the bulk routines for sequences of entries of one field:
+        dot(x, y) = sum(x[k] * y[k])
+        axpy(a, x, y) = [y[k] + a * x[k]]
+        scale(a, x) = [x[k] * a]
+        sum(x) = x[0] + x[1] + ...
+
+    the sequences are non empty and of the same length
+    """
+
+    dot: Callable[[Sequence[F], Sequence[F]], F]
+    axpy: Callable[[F, Sequence[F], Sequence[F]], List[F]]
+    scale: Callable[[F, Sequence[F]], List[F]]
+    sum: Callable[[Sequence[F]], F]
+
+
+def generic_dot(x: Sequence[F], y: Sequence[F]) -> F:
+    total = additive_identity(x[0])
+    for xk, yk in zip(x, y):
+        total = total + xk * yk
+    return total
+
+
+def generic_axpy(factor: F, x: Sequence[F], y: Sequence[F]) -> List[F]:
+    # additions and subtractions of vectors don't need the products
+    one = multiplicative_identity(factor)
+    if factor == one:
+        return [yk + xk for xk, yk in zip(x, y)]
+    if factor == additive_inverse(one):
+        return [yk - xk for xk, yk in zip(x, y)]
+    return [yk + factor * xk for xk, yk in zip(x, y)]
+
+
+def generic_scale(factor: F, x: Sequence[F]) -> List[F]:
+    return [xk * factor for xk in x]
+
+
+def generic_sum(x: Sequence[F]) -> F:
+    return functools.reduce(lambda a, b: a + b, x, additive_identity(x[0]))
+
+
+GENERIC_KERNELS: FieldKernels = FieldKernels(
+    dot=generic_dot, axpy=generic_axpy, scale=generic_scale, sum=generic_sum
+)
+
+# maps a field (the type of the entries) to its kernels
+_kernels: Dict[Type, FieldKernels] = {}
+
+
+def register_kernels(
+    field: Type,
+    dot: Optional[Callable[[Sequence[F], Sequence[F]], F]] = None,
+    axpy: Optional[Callable[[F, Sequence[F], Sequence[F]], List[F]]] = None,
+    scale: Optional[Callable[[F, Sequence[F]], List[F]]] = None,
+    sum: Optional[Callable[[Sequence[F]], F]] = None,
+) -> None:
+    """
+    register optimized bulk routines for the entries of a field,
+    the routines that are left out fall back to the generic ones
+
+    the routines have to return the same values as the generic ones
+    (up to rounding for floating point fields)
+
+    :param field: the type of the entries
+    """
+    _kernels[field] = FieldKernels(
+        dot=dot or GENERIC_KERNELS.dot,
+        axpy=axpy or GENERIC_KERNELS.axpy,
+        scale=scale or GENERIC_KERNELS.scale,
+        sum=sum or GENERIC_KERNELS.sum,
+    )
+
+
+def kernels_for(field: Type) -> FieldKernels:
+    """
+    the kernels registered for a field (the generic ones if there are none)
+    """
+    return _kernels.get(field, GENERIC_KERNELS)
+
+
+def _int_sumprod(x: Sequence[int], y: Sequence[int]) -> int:
+    """
+    math.sumprod of ints (exact, typeshed declares it for floats)
+    """
+    return cast(int, math.sumprod(x, y))
+
+
+# float: correctly rounded accumulation
+
+
+def _float_dot(x: Sequence[float], y: Sequence[float]) -> float:
+    return math.sumprod(x, y)
+
+
+register_kernels(float, dot=_float_dot, sum=math.fsum)
+
+
+# Rational: integer accumulation over one common denominator, reduced once
+# (typed as Fraction[int], the type of Rational arithmetic)
+
+
+def _rational_dot(
+    x: Sequence[Fraction[int]], y: Sequence[Fraction[int]]
+) -> Fraction[int]:
+    numerators = [xk.numerator * yk.numerator for xk, yk in zip(x, y)]
+    denominators = [xk.denominator * yk.denominator for xk, yk in zip(x, y)]
+    return _rational_sum_of_terms(numerators, denominators)
+
+
+def _rational_sum(x: Sequence[Fraction[int]]) -> Fraction[int]:
+    return _rational_sum_of_terms(
+        [xk.numerator for xk in x], [xk.denominator for xk in x]
+    )
+
+
+def _rational_sum_of_terms(numerators: List[int], denominators: List[int]) -> Rational:
+    denominator = math.lcm(*denominators)
+    return Rational(
+        _int_sumprod(numerators, [denominator // d for d in denominators]),
+        denominator,
+    )
+
+
+def _rational_axpy(
+    factor: Fraction[int], x: Sequence[Fraction[int]], y: Sequence[Fraction[int]]
+) -> List[Fraction[int]]:
+    """
+    every entry y + factor * x is reduced once, entries with x = 0 are kept as they are
+    """
+    factor_numerator, factor_denominator = factor.numerator, factor.denominator
+    if factor_numerator == 0:
+        return list(y)
+    result = []
+    for xk, yk in zip(x, y):
+        numerator = xk.numerator
+        if numerator == 0:
+            result.append(yk)
+            continue
+        numerator *= factor_numerator
+        denominator = xk.denominator * factor_denominator
+        result.append(
+            Rational(
+                yk.numerator * denominator + numerator * yk.denominator,
+                yk.denominator * denominator,
+            )
+        )
+    return result
+
+
+register_kernels(Rational, dot=_rational_dot, axpy=_rational_axpy, sum=_rational_sum)
+
+
+# GF(p): integer accumulation of the residues, reduced once
+
+
+def _common_modulus(operator: str, *sequences: Sequence[PrimeFieldElement]) -> int:
+    modulus = sequences[0][0].modulus
+    for sequence in sequences:
+        for entry in sequence:
+            if entry.modulus != modulus:
+                raise TypeError(
+                    f"unsupported operand type(s) for {operator}: "
+                    f"'GF({modulus})' and 'GF({entry.modulus})'"
+                )
+    return modulus
+
+
+def _prime_field_dot(
+    x: Sequence[PrimeFieldElement], y: Sequence[PrimeFieldElement]
+) -> PrimeFieldElement:
+    modulus = _common_modulus("dot", x, y)
+    return PrimeFieldElement(
+        _int_sumprod([xk.value for xk in x], [yk.value for yk in y]), modulus
+    )
+
+
+def _prime_field_axpy(
+    factor: PrimeFieldElement,
+    x: Sequence[PrimeFieldElement],
+    y: Sequence[PrimeFieldElement],
+) -> List[PrimeFieldElement]:
+    modulus = _common_modulus("axpy", [factor], x, y)
+    return [
+        PrimeFieldElement(yk.value + factor.value * xk.value, modulus)
+        for xk, yk in zip(x, y)
+    ]
+
+
+def _prime_field_scale(
+    factor: PrimeFieldElement, x: Sequence[PrimeFieldElement]
+) -> List[PrimeFieldElement]:
+    modulus = _common_modulus("*", [factor], x)
+    return [PrimeFieldElement(xk.value * factor.value, modulus) for xk in x]
+
+
+def _prime_field_sum(x: Sequence[PrimeFieldElement]) -> PrimeFieldElement:
+    modulus = _common_modulus("+", x)
+    return PrimeFieldElement(sum(xk.value for xk in x), modulus)
+
+
+register_kernels(
+    PrimeFieldElement,
+    dot=_prime_field_dot,
+    axpy=_prime_field_axpy,
+    scale=_prime_field_scale,
+    sum=_prime_field_sum,
+)
+
+
+# ComplexNumber: vectorized with numpy (see numpy_backend)
+
+
+def _to_complex_array(x: Sequence[ComplexNumber]) -> np.ndarray:
+    return numpy_backend.to_array([x], ComplexNumber)[0]
+
+
+def _from_complex_array(array: np.ndarray) -> List[ComplexNumber]:
+    return numpy_backend.from_array(array[np.newaxis], ComplexNumber)[0]
+
+
+def _complex_dot(
+    x: Sequence[ComplexNumber], y: Sequence[ComplexNumber]
+) -> ComplexNumber:
+    total = complex(np.dot(_to_complex_array(x), _to_complex_array(y)))
+    return ComplexNumber(total.real, total.imag)
+
+
+def _complex_axpy(
+    factor: ComplexNumber, x: Sequence[ComplexNumber], y: Sequence[ComplexNumber]
+) -> List[ComplexNumber]:
+    return _from_complex_array(
+        _to_complex_array(y)
+        + complex(factor.real, factor.imaginary) * _to_complex_array(x)
+    )
+
+
+def _complex_scale(
+    factor: ComplexNumber, x: Sequence[ComplexNumber]
+) -> List[ComplexNumber]:
+    return _from_complex_array(
+        _to_complex_array(x) * complex(factor.real, factor.imaginary)
+    )
+
+
+def _complex_sum(x: Sequence[ComplexNumber]) -> ComplexNumber:
+    total = complex(np.sum(_to_complex_array(x)))
+    return ComplexNumber(total.real, total.imag)
+
+
+register_kernels(
+    ComplexNumber,
+    dot=_complex_dot,
+    axpy=_complex_axpy,
+    scale=_complex_scale,
+    sum=_complex_sum,
+)
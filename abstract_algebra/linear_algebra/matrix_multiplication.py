@@ -0,0 +1,144 @@
+from typing import TypeVar, List, Optional
+from abstract_algebra.abstract_structures.field import FieldProtocol
+
+F = TypeVar("F", bound=FieldProtocol)
+
+# tile size of the blocked multiplication
+BLOCK_SIZE: int = 32
+# matrices with every dimension at least this large are split by Strassen-Winograd
+# set to None to always use the blocked multiplication
+STRASSEN_THRESHOLD: Optional[int] = 128
+
+
+def multiply(
+    left: List[List[F]],
+    right: List[List[F]],
+    zero: F,
+    strassen_threshold: Optional[int] = None,
+    block_size: Optional[int] = None,
+) -> List[List[F]]:
+    """
+    multiply two matrices given as lists of rows
+
+    :param left: the rows of the left matrix (n x k)
+    :param right: the rows of the right matrix (k x m)
+    :param zero: the additive identity of the field
+    :param strassen_threshold: overrides STRASSEN_THRESHOLD
+    :param block_size: overrides BLOCK_SIZE
+    :return: the rows of the product (n x m)
+    """
+    if strassen_threshold is None:
+        strassen_threshold = STRASSEN_THRESHOLD
+    if block_size is None:
+        block_size = BLOCK_SIZE
+    n, k, m = len(left), len(right), len(right[0])
+    if strassen_threshold is not None and min(n, k, m) >= strassen_threshold:
+        return strassen_multiply(left, right, zero, strassen_threshold, block_size)
+    return blocked_multiply(left, right, zero, block_size)
+
+
+def blocked_multiply(
+    left: List[List[F]], right: List[List[F]], zero: F, block_size: int
+) -> List[List[F]]:
+    """
+    tiled i-k-j multiplication:
+    each row of the result is accumulated as a sum of scaled rows of "right",
+    skipping zero entries of "left"
+    """
+    n, k, m = len(left), len(right), len(right[0])
+    result = [[zero] * m for _ in range(n)]
+    for i0 in range(0, n, block_size):
+        for k0 in range(0, k, block_size):
+            k1 = min(k0 + block_size, k)
+            for j0 in range(0, m, block_size):
+                j1 = min(j0 + block_size, m)
+                for i in range(i0, min(i0 + block_size, n)):
+                    left_row = left[i]
+                    result_row = result[i]
+                    for p in range(k0, k1):
+                        a = left_row[p]
+                        if a == zero:
+                            continue
+                        right_row = right[p]
+                        for j in range(j0, j1):
+                            result_row[j] = result_row[j] + a * right_row[j]
+    return result
+
+
+def strassen_multiply(
+    left: List[List[F]],
+    right: List[List[F]],
+    zero: F,
+    strassen_threshold: int,
+    block_size: int,
+) -> List[List[F]]:
+    """
+    Strassen-Winograd multiplication (7 multiplications and 15 additions of half sized blocks)
+    odd dimensions are padded with zeros
+    below strassen_threshold the blocks are multiplied by blocked_multiply
+    """
+    n, k, m = len(left), len(right), len(right[0])
+    if min(n, k, m) < strassen_threshold:
+        return blocked_multiply(left, right, zero, block_size)
+    half_n, half_k, half_m = (n + 1) // 2, (k + 1) // 2, (m + 1) // 2
+    a11, a12, a21, a22 = _split(left, half_n, half_k, zero)
+    b11, b12, b21, b22 = _split(right, half_k, half_m, zero)
+
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+
+    def recurse(x: List[List[F]], y: List[List[F]]) -> List[List[F]]:
+        return strassen_multiply(x, y, zero, strassen_threshold, block_size)
+
+    m1 = recurse(a11, b11)
+    m2 = recurse(a12, b21)
+    m3 = recurse(s4, b22)
+    m4 = recurse(a22, t4)
+    m5 = recurse(s1, t1)
+    m6 = recurse(s2, t2)
+    m7 = recurse(s3, t3)
+
+    c11 = _add(m1, m2)
+    u2 = _add(m1, m6)
+    u3 = _add(u2, m7)
+    u4 = _add(u2, m5)
+    c12 = _add(u4, m3)
+    c21 = _sub(u3, m4)
+    c22 = _add(u3, m5)
+
+    top = [row11 + row12 for row11, row12 in zip(c11, c12)]
+    bottom = [row21 + row22 for row21, row22 in zip(c21, c22)]
+    return [row[:m] for row in (top + bottom)[:n]]
+
+
+def _split(
+    rows: List[List[F]], half_rows: int, half_columns: int, zero: F
+) -> List[List[List[F]]]:
+    """
+    split into four (half_rows x half_columns) quadrants, padding with zeros
+    """
+    column_count = len(rows[0])
+    padding = [zero] * (2 * half_columns - column_count)
+    padded = [row + padding for row in rows]
+    padded += [[zero] * (2 * half_columns) for _ in range(2 * half_rows - len(rows))]
+    top, bottom = padded[:half_rows], padded[half_rows:]
+    return [
+        [row[:half_columns] for row in top],
+        [row[half_columns:] for row in top],
+        [row[:half_columns] for row in bottom],
+        [row[half_columns:] for row in bottom],
+    ]
+
+
+def _add(x: List[List[F]], y: List[List[F]]) -> List[List[F]]:
+    return [[a + b for a, b in zip(row_x, row_y)] for row_x, row_y in zip(x, y)]
+
+
+def _sub(x: List[List[F]], y: List[List[F]]) -> List[List[F]]:
+    return [[a - b for a, b in zip(row_x, row_y)] for row_x, row_y in zip(x, y)]
@@ -1,10 +1,11 @@
-from typing import Tuple, TypeVar
+from typing import Tuple, TypeVar, List
 import functools
 from abstract_algebra.abstract_structures.monoid import additive_identity
 from abstract_algebra.abstract_structures.ring import multiplicative_identity
 from abstract_algebra.abstract_structures.field import FieldProtocol
 from abstract_algebra.compound_structures.vector import Vector
 from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.linear_algebra import vector_operations
 
 
 F = TypeVar("F", bound=FieldProtocol)
@@ -13,13 +14,15 @@ F = TypeVar("F", bound=FieldProtocol)
 def zero_matrix(shape: Tuple[int, int], example_field_element: F) -> Matrix[F]:
     zero = additive_identity(example_field_element)
 
-    return Matrix.new_matrix([[zero for i in range(shape[0])] for j in range(shape[1])])
+    return Matrix.new_matrix_unchecked(
+        [[zero for i in range(shape[0])] for j in range(shape[1])]
+    )
 
 
 def identity_matrix(dimensions: int, example_field_element: F) -> Matrix[F]:
     zero = additive_identity(example_field_element)
     one = multiplicative_identity(example_field_element)
-    return Matrix.new_matrix(
+    return Matrix.new_matrix_unchecked(
         [
             [one if i == j else zero for j in range(dimensions)]
             for i in range(dimensions)
@@ -39,7 +42,7 @@ def matrix_to_vector(matrix: Matrix[F]) -> Vector[F]:
 
 
 def vector_to_matrix(vector: Vector[F]) -> Matrix[F]:
-    return Matrix.new_matrix([vector])
+    return Matrix.new_matrix_unchecked([vector])
 
 
 def is_square(matrix: Matrix[F]) -> bool:
@@ -68,3 +71,27 @@ def diagonal_product(matrix: Matrix[F]) -> F:
         [matrix[i][i] for i in range(matrix.shape[0])],
         multiplicative_identity(matrix[0][0]),
     )
+
+
+def reduced_form_pivot_columns(
+    reduced_matrix: Matrix[F], column_count: int
+) -> List[int]:
+    """
+    the pivot column of each nonzero row of a reduced row echelon form
+
+    every pivot is right of the one above it,
+    so each row is only searched from the previous pivot on (one pass over the columns)
+
+    :param reduced_matrix: the reduced row echelon form of a matrix A, optionally augmented with extra columns
+    :param column_count: the number of columns of A (pivots in later columns are ignored)
+    :return: the pivot columns in increasing order
+    """
+    pivot_columns: List[int] = []
+    start = 0
+    for row in reduced_matrix:
+        pivot_column = vector_operations.identify_first_nonzero_entry(row, start)
+        if pivot_column == -1 or pivot_column >= column_count:
+            break
+        pivot_columns.append(pivot_column)
+        start = pivot_column + 1
+    return pivot_columns
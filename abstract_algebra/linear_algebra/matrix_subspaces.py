@@ -1,4 +1,4 @@
-from typing import TypeVar, List, Generic, Tuple
+from typing import TypeVar, List, Generic, Tuple, Optional, Hashable, Sequence
 from dataclasses import dataclass
 import functools
 from abstract_algebra.abstract_structures.monoid import additive_identity
@@ -7,81 +7,137 @@ from abstract_algebra.abstract_structures.ring import multiplicative_identity
 from abstract_algebra.abstract_structures.field import FieldProtocol
 from abstract_algebra.compound_structures.vector import Vector
 from abstract_algebra.compound_structures.matrix import Matrix
-from abstract_algebra.linear_algebra import vector_operations
+from abstract_algebra.linear_algebra.matrix_operations import reduced_form_pivot_columns
 from abstract_algebra.linear_algebra.gauss_jordan import GaussJordan
+from abstract_algebra.linear_algebra.decomposition_cache import (
+    matrix_key,
+    shared_decomposition,
+)
 
 F = TypeVar("F", bound=FieldProtocol)
 
 
 @dataclass(init=True, frozen=True)
 class MatrixSubspaces(Generic[F]):
+    """
+    the four fundamental subspaces of a matrix A of shape (m, n)
+
+    everything is read off of one Gauss-Jordan elimination:
+    its pivot columns partition the column indexes into pivot and free columns,
+    rank and nullity only need the forward elimination,
+    the bases are read off of the reduced row echelon form R = EA
+    (E is only built for the left null space)
+    """
+
     matrix: Matrix[F]
 
     @functools.cached_property
     def reduced_row_echelon_form(self) -> Matrix[F]:
-        return GaussJordan(self.matrix).reduced_row_echelon_form
+        return self._gauss_jordan.reduced_row_echelon_form
 
-    @functools.cached_property
+    @property
+    def pivot_columns(self) -> Tuple[int, ...]:
+        return self._pivot_and_free_columns[0]
+
+    @property
+    def free_columns(self) -> Tuple[int, ...]:
+        return self._pivot_and_free_columns[1]
+
+    @property
     def rank(self) -> int:
-        return len(self.column_space)
+        return len(self.pivot_columns)
 
-    @functools.cached_property
+    @property
     def nullity(self) -> int:
-        return len(self.null_space)
+        return len(self.free_columns)
 
     @functools.cached_property
     def column_space(self) -> List[Vector[F]]:
-        row_count = self.matrix.shape[0]
-        reduced_matrix = self.reduced_row_echelon_form
-        basic_indexes = [
-            index
-            for i in range(row_count)
-            if (
-                index := vector_operations.identify_first_nonzero_entry(
-                    reduced_matrix[i]
-                )
-            )
-            != -1
-        ]
-        return [
-            column
-            for index, column in enumerate(self.matrix.transpose().rows)
-            if index in basic_indexes
-        ]
+        """
+        the pivot columns of A
+        """
+        return [self.matrix.column(index) for index in self.pivot_columns]
 
     @functools.cached_property
     def null_space(self) -> List[Vector[F]]:
-        zero = additive_identity(self.matrix[0][0])
-        one = multiplicative_identity(self.matrix[0][0])
-        row_count = self.matrix.shape[0]
-        column_count = self.matrix.shape[1]
-        reduced_matrix = self.reduced_row_echelon_form
-        basic_indexes = [
-            index
-            for i in range(row_count)
-            if (
-                index := vector_operations.identify_first_nonzero_entry(
-                    reduced_matrix[i]
-                )
+        """
+        one vector per free column (see null_space_from_reduced_form)
+        """
+        return list(self._null_space)
+
+    @functools.cached_property
+    def row_space(self) -> List[Vector[F]]:
+        """
+        the nonzero rows of R
+        """
+        return list(self.reduced_row_echelon_form.rows[: self.rank])
+
+    @functools.cached_property
+    def left_null_space(self) -> List[Vector[F]]:
+        """
+        the vectors y with yA = 0: the rows of E that R has zero rows for
+        """
+        return list(self._gauss_jordan.pseudo_inverse.rows[self.rank :])
+
+    @functools.cached_property
+    def _gauss_jordan(self) -> GaussJordan[F]:
+        return GaussJordan(self.matrix)
+
+    @functools.cached_property
+    def _matrix_key(self) -> Optional[Hashable]:
+        return matrix_key(self.matrix)
+
+    @functools.cached_property
+    @shared_decomposition
+    def _pivot_and_free_columns(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        # the pivots of the row echelon form are the pivots of R,
+        # so rank and nullity don't need the backward elimination
+        pivot_columns = self._gauss_jordan.pivot_columns
+        pivot_set = set(pivot_columns)
+        free_columns = tuple(
+            j for j in range(self.matrix.shape[1]) if j not in pivot_set
+        )
+        return pivot_columns, free_columns
+
+    @functools.cached_property
+    @shared_decomposition
+    def _null_space(self) -> Tuple[Vector[F], ...]:
+        return tuple(
+            null_space_from_reduced_form(
+                self.reduced_row_echelon_form,
+                self.matrix.shape[1],
+                pivot_columns=self.pivot_columns,
+            )
+        )
+
+
+def null_space_from_reduced_form(
+    reduced_matrix: Matrix[F],
+    column_count: int,
+    pivot_columns: Optional[Sequence[int]] = None,
+) -> List[Vector[F]]:
+    """
+    read a basis of the null space off of a reduced row echelon form
+
+    :param reduced_matrix: the reduced row echelon form of a matrix A, optionally augmented with extra columns
+    :param column_count: the number of columns of A (any columns after these are ignored)
+    :param pivot_columns: the pivot columns of A if they are already known (see reduced_form_pivot_columns)
+    :return: a basis of the null space of A (one vector per free variable)
+    """
+    zero = additive_identity(reduced_matrix[0][0])
+    one = multiplicative_identity(reduced_matrix[0][0])
+    if pivot_columns is None:
+        pivot_columns = reduced_form_pivot_columns(reduced_matrix, column_count)
+    pivot_set = set(pivot_columns)
+    null_space_vectors: List[Vector[F]] = []
+    for free_column in range(column_count):
+        if free_column in pivot_set:
+            continue
+        column_vector = [zero] * column_count
+        column_vector[free_column] = one
+        for i, pivot_column in enumerate(pivot_columns):
+            column_vector[pivot_column] = additive_inverse(
+                reduced_matrix[i][free_column]
             )
-            != -1
-        ]
-        free_indexes = [j for j in range(column_count) if j not in basic_indexes]
-        null_space_vectors: List[Vector[F]] = []
-        for free_variable_index in free_indexes:
-            column_vector = []
-            column_entry_pointer = 0
-            for column_index in range(column_count):
-                if column_index in basic_indexes:
-                    column_vector.append(
-                        additive_inverse(
-                            reduced_matrix[column_entry_pointer][free_variable_index]
-                        )
-                    )
-                    column_entry_pointer += 1
-                elif column_index == free_variable_index:
-                    column_vector.append(one)
-                else:
-                    column_vector.append(zero)
-            null_space_vectors.append(Vector.new_vector(column_vector))
-        return null_space_vectors
+        null_space_vectors.append(Vector.new_vector_unchecked(tuple(column_vector)))
+    return null_space_vectors
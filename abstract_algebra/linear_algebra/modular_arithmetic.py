@@ -0,0 +1,314 @@
+from typing import Any, Iterator, List, Optional, Tuple
+import math
+import numpy as np
+from abstract_algebra.compound_structures.fraction import Fraction
+
+WORD_PRIME_BOUND = 2**31
+
+
+def is_prime(n: int) -> bool:
+    """
+    deterministic Miller-Rabin primality test (exact for n < 3,317,044,064,679,887,385,961,981)
+    """
+    if n < 2:
+        return False
+    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in small_primes:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in small_primes:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def word_primes(upper_bound: int = WORD_PRIME_BOUND) -> Iterator[int]:
+    """
+    yield the primes below upper_bound in descending order
+
+    the default bound keeps every product of two residues below 2**62
+    """
+    candidate = upper_bound - 1
+    if candidate % 2 == 0:
+        candidate -= 1
+    while candidate > 2:
+        if is_prime(candidate):
+            yield candidate
+        candidate -= 2
+
+
+def chinese_remainder(
+    residue: int, modulus: int, new_residue: int, new_modulus: int
+) -> Tuple[int, int]:
+    """
+    combine x = residue (mod modulus) and x = new_residue (mod new_modulus)
+
+    :return: the combined residue in [0, modulus * new_modulus), the combined modulus
+    """
+    inverse = pow(modulus, -1, new_modulus)
+    t = ((new_residue - residue) * inverse) % new_modulus
+    return residue + modulus * t, modulus * new_modulus
+
+
+def symmetric_residue(residue: int, modulus: int) -> int:
+    """
+    map a residue into (-modulus / 2, modulus / 2]
+    """
+    residue %= modulus
+    if residue > modulus // 2:
+        return residue - modulus
+    return residue
+
+
+def rational_reconstruction(
+    residue: int, modulus: int, numerator_bound: Optional[int] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    find n/d with n = d * residue (mod modulus), |n| <= numerator_bound and 0 < d <= modulus / (2 * numerator_bound)
+
+    :param numerator_bound: defaults to sqrt(modulus / 2) (the balanced bound)
+    :return: (n, d) with gcd(n, d) = 1, or None if no such fraction exists
+    """
+    if numerator_bound is None:
+        numerator_bound = math.isqrt(modulus // 2)
+    denominator_bound = modulus // (2 * numerator_bound) if numerator_bound else 0
+    r0, r1 = modulus, residue % modulus
+    t0, t1 = 0, 1
+    while r1 > numerator_bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    if t1 == 0 or abs(t1) > denominator_bound:
+        return None
+    if t1 < 0:
+        r1, t1 = -r1, -t1
+    if math.gcd(r1, t1) != 1:
+        return None
+    return r1, t1
+
+
+def reconstruct_solution(
+    rows: List[List[int]],
+    rhs: List[int],
+    residues: List[int],
+    modulus: int,
+    numerator_bound: Optional[int],
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    rational reconstruction of every entry of a solution of Ax = b known modulo "modulus",
+    verified against Ax = b
+
+    :param rows: the integer rows of A
+    :param rhs: the integer right hand side b
+    :param residues: the entries of x modulo "modulus"
+    :param modulus: the modulus
+    :param numerator_bound: a bound for the numerators (None for the balanced bound)
+    :return: (numerator, denominator) per entry or None if the modulus isn't large enough yet
+    """
+    solution: List[Tuple[int, int]] = []
+    for residue in residues:
+        fraction = rational_reconstruction(residue, modulus, numerator_bound)
+        if fraction is None:
+            return None
+        solution.append(fraction)
+    common_denominator = math.lcm(*(denominator for _, denominator in solution))
+    x = [
+        numerator * (common_denominator // denominator)
+        for numerator, denominator in solution
+    ]
+    for row, b_i in zip(rows, rhs):
+        if math.sumprod(row, x) != b_i * common_denominator:
+            return None
+    return solution
+
+
+def integer_rows(rows: List[List[Any]]) -> Tuple[List[List[int]], List[int]]:
+    """
+    clear the denominators of a matrix over int or Fraction[int] row by row
+
+    :param rows: the entries of the matrix
+    :return: the integer rows, the factor each row was scaled by
+    """
+    result_rows: List[List[int]] = []
+    scales: List[int] = []
+    for row in rows:
+        if all(isinstance(entry, int) for entry in row):
+            result_rows.append(list(row))
+            scales.append(1)
+            continue
+        for entry in row:
+            if not isinstance(entry, Fraction) or entry.ring is not int:
+                raise TypeError(
+                    f"Modular elimination needs entries of type int or Fraction[int]: {entry}"
+                )
+        scale = math.lcm(*(entry.denominator for entry in row))
+        result_rows.append(
+            [entry.numerator * (scale // entry.denominator) for entry in row]
+        )
+        scales.append(scale)
+    return result_rows, scales
+
+
+def hadamard_bound(rows: List[List[int]]) -> int:
+    """
+    an upper bound for the absolute value of every minor of an integer matrix
+
+    this is the product of the euclidean norms of the nonzero rows (rounded up)
+    """
+    bound = 1
+    for row in rows:
+        norm_squared = sum(entry * entry for entry in row)
+        if norm_squared != 0:
+            norm = math.isqrt(norm_squared)
+            if norm * norm != norm_squared:
+                norm += 1
+            bound *= norm
+    return bound
+
+
+def row_reduce_modulo(
+    rows: List[List[int]], p: int, reduced: bool = False
+) -> Tuple[List[List[int]], List[int], int]:
+    """
+    row reduce an integer matrix over the prime field GF(p)
+
+    word sized primes (below WORD_PRIME_BOUND) are reduced with vectorized int64 numpy kernels
+
+    :param rows: the rows of the matrix (not modified)
+    :param p: a prime
+    :param reduced: set to True for a reduced row echelon form (otherwise a row echelon form)
+    :return: the reduced rows (entries in [0, p)), pivot columns, number of row swaps
+    """
+    if p < WORD_PRIME_BOUND and rows and rows[0]:
+        return _row_reduce_modulo_numpy(rows, p, reduced)
+    rows = [[entry % p for entry in row] for row in rows]
+    row_count = len(rows)
+    column_count = len(rows[0]) if rows else 0
+    pivot_columns: List[int] = []
+    swap_count = 0
+    pivot_row = 0
+    for pivot_column in range(column_count):
+        if pivot_row >= row_count:
+            break
+        swap_row = -1
+        for i in range(pivot_row, row_count):
+            if rows[i][pivot_column]:
+                swap_row = i
+                break
+        if swap_row == -1:
+            continue
+        if swap_row != pivot_row:
+            rows[swap_row], rows[pivot_row] = rows[pivot_row], rows[swap_row]
+            swap_count += 1
+        pivot = rows[pivot_row]
+        inverse = pow(pivot[pivot_column], -1, p)
+        if reduced:
+            # normalize the pivot to 1 and clear the column above and below it
+            for j in range(pivot_column, column_count):
+                pivot[j] = pivot[j] * inverse % p
+            inverse = 1
+            targets = [i for i in range(row_count) if i != pivot_row]
+        else:
+            targets = list(range(pivot_row + 1, row_count))
+        for i in targets:
+            row = rows[i]
+            entry = row[pivot_column]
+            if not entry:
+                continue
+            factor = entry * inverse % p
+            row[pivot_column:] = [
+                (a - factor * b) % p
+                for a, b in zip(row[pivot_column:], pivot[pivot_column:])
+            ]
+        pivot_columns.append(pivot_column)
+        pivot_row += 1
+    return rows, pivot_columns, swap_count
+
+
+def _row_reduce_modulo_numpy(
+    rows: List[List[int]], p: int, reduced: bool
+) -> Tuple[List[List[int]], List[int], int]:
+    """
+    row_reduce_modulo on an int64 array, one vectorized update per pivot
+    (residues are below 2**31 so every product fits in int64)
+    """
+    array = np.array([[entry % p for entry in row] for row in rows], dtype=np.int64)
+    row_count, column_count = array.shape
+    pivot_columns: List[int] = []
+    swap_count = 0
+    pivot_row = 0
+    for pivot_column in range(column_count):
+        if pivot_row >= row_count:
+            break
+        nonzero = np.flatnonzero(array[pivot_row:, pivot_column])
+        if nonzero.size == 0:
+            continue
+        swap_row = pivot_row + int(nonzero[0])
+        if swap_row != pivot_row:
+            array[[pivot_row, swap_row]] = array[[swap_row, pivot_row]]
+            swap_count += 1
+        inverse = pow(int(array[pivot_row, pivot_column]), -1, p)
+        if reduced:
+            array[pivot_row, pivot_column:] = (
+                array[pivot_row, pivot_column:] * inverse % p
+            )
+            targets = np.flatnonzero(array[:, pivot_column])
+            targets = targets[targets != pivot_row]
+            factors = array[targets, pivot_column]
+        else:
+            targets = (
+                pivot_row + 1 + np.flatnonzero(array[pivot_row + 1 :, pivot_column])
+            )
+            factors = array[targets, pivot_column] * inverse % p
+        if targets.size:
+            array[targets, pivot_column:] = (
+                array[targets, pivot_column:]
+                - np.outer(factors, array[pivot_row, pivot_column:]) % p
+            ) % p
+        pivot_columns.append(pivot_column)
+        pivot_row += 1
+    return array.tolist(), pivot_columns, swap_count
+
+
+def determinant_modulo(rows: List[List[int]], p: int) -> int:
+    """
+    the determinant of a square integer matrix modulo p
+    """
+    reduced_rows, pivot_columns, swap_count = row_reduce_modulo(rows, p)
+    if len(pivot_columns) != len(rows):
+        return 0
+    determinant = 1 if swap_count % 2 == 0 else p - 1
+    for i in range(len(rows)):
+        determinant = determinant * reduced_rows[i][i] % p
+    return determinant
+
+
+def rank_modulo(rows: List[List[int]], p: int) -> int:
+    """
+    the rank of an integer matrix over GF(p)
+    """
+    return len(row_reduce_modulo(rows, p)[1])
+
+
+def solve_modulo(rows: List[List[int]], b: List[int], p: int) -> Optional[List[int]]:
+    """
+    solve Ax = b over GF(p) for a square integer matrix A
+
+    :return: x (entries in [0, p)) or None if A is singular modulo p
+    """
+    augmented_rows = [row + [b_i] for row, b_i in zip(rows, b)]
+    reduced_rows, pivot_columns, _ = row_reduce_modulo(augmented_rows, p, reduced=True)
+    if pivot_columns != list(range(len(rows))):
+        return None
+    return [row[-1] for row in reduced_rows]
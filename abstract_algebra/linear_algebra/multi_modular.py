@@ -0,0 +1,157 @@
+from typing import Any, List, Optional, Tuple, Union
+from dataclasses import dataclass
+import functools
+import math
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.compound_structures.fraction import Fraction
+from abstract_algebra.linear_algebra import modular_arithmetic
+from abstract_algebra.linear_algebra.modular_arithmetic import (
+    integer_rows,
+    reconstruct_solution,
+)
+from abstract_algebra.linear_algebra.solve_systems import solve_linear_system
+
+
+@dataclass(init=True, frozen=True)
+class MultiModular:
+    """
+    exact linear algebra over int or Fraction[int] by
+    clearing denominators, eliminating modulo many word sized primes
+    and rebuilding the result with the Chinese Remainder Theorem
+    (and rational reconstruction for solutions)
+
+    Enough primes are used for their product to exceed (twice) the Hadamard bound
+    so the results are exact and match GaussJordan / Bareiss
+
+    (int matrices are accepted as well and have int determinants,
+    they are typed as Fraction[int] because Matrix needs a field)
+    """
+
+    base_matrix: Matrix[Fraction[int]]
+
+    @functools.cached_property
+    def determinant(self) -> Union[int, Fraction[int]]:
+        if self.base_matrix.shape[0] != self.base_matrix.shape[1]:
+            return self._from_integer(0, 1)
+        rows, scales = self._integer_rows_and_scales
+        bound = 2 * modular_arithmetic.hadamard_bound(rows)
+        residue, modulus = 0, 1
+        for p in modular_arithmetic.word_primes():
+            residue, modulus = modular_arithmetic.chinese_remainder(
+                residue, modulus, modular_arithmetic.determinant_modulo(rows, p), p
+            )
+            if modulus > bound:
+                break
+        return self._from_integer(
+            modular_arithmetic.symmetric_residue(residue, modulus), math.prod(scales)
+        )
+
+    @functools.cached_property
+    def rank(self) -> int:
+        """
+        the rank modulo p never exceeds the rank over the rationals
+        and can only drop if p divides every maximal nonzero minor.
+        Once the primes multiply past the Hadamard bound one of them must keep the rank
+        """
+        rows, _ = self._integer_rows_and_scales
+        full_rank = min(self.base_matrix.shape)
+        bound = modular_arithmetic.hadamard_bound(rows)
+        rank, modulus = 0, 1
+        for p in modular_arithmetic.word_primes():
+            rank = max(rank, modular_arithmetic.rank_modulo(rows, p))
+            modulus *= p
+            if rank == full_rank or modulus > bound:
+                break
+        return rank
+
+    def solve(self, b: Vector[Fraction[int]]) -> Optional[Vector[Fraction[int]]]:
+        """
+        solve Ax = b exactly
+
+        square nonsingular systems are solved multi-modularly,
+        anything else falls back to solve_linear_system over Fraction[int]
+
+        :param b: the right hand side
+        :return: the solution (as in solve_linear_system) or None if there is no solution
+        """
+        if len(b) != self.base_matrix.shape[0]:
+            raise TypeError(
+                f"unsupported operand type(s) for solve: "
+                f"'Matrix[{self.base_matrix.field}]' of size {self.base_matrix.shape} incompatible with"
+                f"'Dim(Vector[{b.field}])={len(b)}'"
+            )
+        if self.base_matrix.shape[0] == self.base_matrix.shape[1]:
+            solution = self._solve_nonsingular(b)
+            if solution is not None:
+                return solution
+        return solve_linear_system(
+            self._as_fractions(self.base_matrix), self._as_fractions(b)
+        )
+
+    @functools.cached_property
+    def _integer_rows_and_scales(self) -> Tuple[List[List[int]], List[int]]:
+        return integer_rows([list(row) for row in self.base_matrix])
+
+    def _from_integer(
+        self, numerator: int, denominator: int
+    ) -> Union[int, Fraction[int]]:
+        if self.base_matrix.field is int:
+            return numerator
+        return Fraction(numerator, denominator)
+
+    @staticmethod
+    def _as_fractions(value: Any) -> Any:
+        if value.field is int:
+            return value.convert_to(Fraction[int])
+        return value
+
+    def _solve_nonsingular(
+        self, b: Vector[Fraction[int]]
+    ) -> Optional[Vector[Fraction[int]]]:
+        """
+        solve Ax = b for a square matrix by rational reconstruction of the solution modulo many primes
+
+        :return: the solution or None if A is singular
+        """
+        augmented_rows, _ = integer_rows(
+            [list(row) + [b_i] for row, b_i in zip(self.base_matrix, b)]
+        )
+        rows = [row[:-1] for row in augmented_rows]
+        rhs = [row[-1] for row in augmented_rows]
+
+        # Cramer's rule: x_j = det(A_j) / det(A)
+        denominator_bound = modular_arithmetic.hadamard_bound(rows)
+        numerator_bound = modular_arithmetic.hadamard_bound(augmented_rows)
+        bound = 2 * numerator_bound * denominator_bound
+
+        residues = [0 for _ in rows]
+        modulus, bad_modulus = 1, 1
+        for p in modular_arithmetic.word_primes():
+            x = modular_arithmetic.solve_modulo(rows, rhs, p)
+            if x is None:
+                # p divides det(A), once that product passes the bound det(A) = 0
+                bad_modulus *= p
+                if bad_modulus > denominator_bound:
+                    return None
+                continue
+            for j, x_j in enumerate(x):
+                residues[j], _ = modular_arithmetic.chinese_remainder(
+                    residues[j], modulus, x_j, p
+                )
+            modulus *= p
+            solution = reconstruct_solution(
+                rows,
+                rhs,
+                residues,
+                modulus,
+                numerator_bound if modulus > bound else None,
+            )
+            if solution is not None:
+                return Vector.new_vector_unchecked(
+                    tuple(
+                        Fraction(numerator, denominator)
+                        for numerator, denominator in solution
+                    )
+                )
+        return None
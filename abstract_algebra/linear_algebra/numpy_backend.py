@@ -0,0 +1,101 @@
+from typing import Any, Dict, Iterable, List, Optional, Type, cast
+import numpy as np
+from abstract_algebra.concrete_structures.complex import ComplexNumber
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+
+# fields with a native numpy representation
+NUMPY_DTYPES: Dict[Type, Any] = {
+    float: np.float64,
+    ComplexNumber: np.complex128,
+    PrimeFieldElement: np.int64,
+}
+# GF(p) arrays hold residues in int64, so every product of two residues has to fit
+MAX_NUMPY_MODULUS = 2**31
+
+
+def supports(field: Type, sample: Any = None) -> bool:
+    """
+    whether the entries of a field can be put into a numpy array
+
+    :param field: the type of the entries
+    :param sample: an entry, GF(p) is only supported for p below MAX_NUMPY_MODULUS
+    """
+    if field is PrimeFieldElement:
+        return sample is not None and sample.modulus < MAX_NUMPY_MODULUS
+    return field in NUMPY_DTYPES
+
+
+def modulus_of(rows: Iterable[Iterable[Any]]) -> int:
+    """
+    the common modulus of the entries of a GF(p) matrix
+    """
+    moduli = set(entry.modulus for row in rows for entry in row)
+    if len(moduli) != 1:
+        raise TypeError(f"All entries need to be in the same field: GF({moduli})")
+    modulus = moduli.pop()
+    if modulus >= MAX_NUMPY_MODULUS:
+        raise TypeError(f"GF({modulus}) is too large for the int64 numpy backend")
+    return modulus
+
+
+def to_array(rows: Iterable[Iterable[Any]], field: Type) -> np.ndarray:
+    """
+    convert the rows of a float, ComplexNumber or GF(p) matrix to a numpy array
+    """
+    if field is ComplexNumber:
+        return np.array(
+            [[complex(entry.real, entry.imaginary) for entry in row] for row in rows],
+            dtype=np.complex128,
+        )
+    if field is PrimeFieldElement:
+        return np.array(
+            [[entry.value for entry in row] for row in rows], dtype=np.int64
+        )
+    return np.array([list(row) for row in rows], dtype=NUMPY_DTYPES[field])
+
+
+def from_array(
+    array: np.ndarray, field: Type, modulus: Optional[int] = None
+) -> List[List[Any]]:
+    """
+    convert a 2d numpy array back to rows of python floats, ComplexNumbers or GF(modulus) elements
+    """
+    rows = array.tolist()
+    if field is ComplexNumber:
+        return [
+            [ComplexNumber(entry.real, entry.imag) for entry in row] for row in rows
+        ]
+    if field is PrimeFieldElement:
+        prime = cast(int, modulus)
+        return [[PrimeFieldElement(entry, prime) for entry in row] for row in rows]
+    return rows
+
+
+def matmul_modulo(left: np.ndarray, right: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    multiply two int64 arrays of residues modulo a prime below MAX_NUMPY_MODULUS
+
+    the inner dimension is split into chunks short enough
+    that the partial sums can't overflow int64
+    """
+    chunk = max(1, (2**63 - 1 - modulus) // ((modulus - 1) ** 2 or 1))
+    result = np.zeros((left.shape[0], right.shape[1]), dtype=np.int64)
+    for start in range(0, left.shape[1], chunk):
+        stop = start + chunk
+        result += left[:, start:stop] @ right[start:stop]
+        result %= modulus
+    return result
+
+
+def matmul(
+    left: Iterable[Iterable[Any]], right: Iterable[Iterable[Any]], field: Type
+) -> List[List[Any]]:
+    """
+    multiply two matrices given as rows with numpy (BLAS for float and ComplexNumber)
+    """
+    if field is PrimeFieldElement:
+        left, right = list(left), list(right)
+        modulus = modulus_of(left + right)
+        product = matmul_modulo(to_array(left, field), to_array(right, field), modulus)
+        return from_array(product, field, modulus)
+    return from_array(to_array(left, field) @ to_array(right, field), field)
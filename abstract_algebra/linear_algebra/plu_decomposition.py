@@ -0,0 +1,148 @@
+from typing import TypeVar, Generic, List, Optional, Tuple, cast
+from dataclasses import dataclass
+import functools
+from abstract_algebra.abstract_structures.field import FieldProtocol
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.linear_algebra.row_operations import RowOperationBuffer
+
+F = TypeVar("F", bound=FieldProtocol)
+
+
+@dataclass(init=True, frozen=True)
+class PLUDecomposition(Generic[F]):
+    """
+    factor a matrix once as:
+    PA = LU
+    where P is a permutation matrix,
+    L is a unit lower triangular matrix,
+    U is a row echelon form of A
+
+    after the factorization every right hand side only costs
+    a forward and a back substitution
+    """
+
+    base_matrix: Matrix[F]
+
+    @functools.cached_property
+    def permutation(self) -> Matrix[F]:
+        buffer = self._buffer
+        return Matrix.new_matrix_unchecked(
+            [
+                [buffer.one if j == k else buffer.zero for j in range(len(buffer.rows))]
+                for k in buffer.permutation
+            ]
+        )
+
+    @functools.cached_property
+    def lower(self) -> Matrix[F]:
+        buffer = self._buffer
+        return Matrix.new_matrix_unchecked(
+            [
+                [
+                    (
+                        buffer.one
+                        if i == j
+                        else (buffer.zero if j > i else self._multipliers[i][j])
+                    )
+                    for j in range(len(buffer.rows))
+                ]
+                for i in range(len(buffer.rows))
+            ]
+        )
+
+    @functools.cached_property
+    def upper(self) -> Matrix[F]:
+        return self._buffer.to_matrix()
+
+    @property
+    def pivot_columns(self) -> List[int]:
+        return self._pivot_columns
+
+    @property
+    def rank(self) -> int:
+        return len(self._pivot_columns)
+
+    def solve(self, b: Vector[F]) -> Optional[Vector[F]]:
+        """
+        solve Ax = b using the factorization
+
+        :param b: the right hand side
+        :return: a solution x (with every free variable set to 0) or None if there is no solution
+        """
+        if b.field != self.base_matrix.field:
+            raise TypeError(
+                f"unsupported operand type(s) for solve: "
+                f"'Matrix[{self.base_matrix.field}]' and 'Vector[{b.field}]'"
+            )
+        if len(b) != self.base_matrix.shape[0]:
+            raise TypeError(
+                f"unsupported operand type(s) for solve: "
+                f"'Matrix[{self.base_matrix.field}]' of size {self.base_matrix.shape} incompatible with"
+                f"'Dim(Vector[{b.field}])={len(b)}'"
+            )
+        buffer = self._buffer
+        zero = buffer.zero
+        multipliers = self._multipliers
+        upper = buffer.rows
+
+        # forward substitution: Ly = Pb
+        y: List[F] = [b[k] for k in buffer.permutation]
+        for i in range(1, len(y)):
+            row = multipliers[i]
+            total = y[i]
+            for j in range(min(i, self.rank)):
+                if row[j] != zero:
+                    total = total - row[j] * y[j]
+            y[i] = total
+
+        # the zero rows of U have to match zeros in y
+        for i in range(self.rank, len(y)):
+            if y[i] != zero:
+                return None
+
+        # back substitution: Ux = y with the free variables set to 0
+        x: List[F] = [zero for j in range(self.base_matrix.shape[1])]
+        for k in range(self.rank - 1, -1, -1):
+            row = upper[k]
+            total = y[k]
+            for pivot_column in self._pivot_columns[k + 1 :]:
+                total = total - row[pivot_column] * x[pivot_column]
+            x[self._pivot_columns[k]] = total / row[self._pivot_columns[k]]
+        return Vector.new_vector_unchecked(tuple(x))
+
+    def solve_many(self, rhs_matrix: Matrix[F]) -> List[Optional[Vector[F]]]:
+        """
+        solve Ax = b for each column b of rhs_matrix
+
+        :param rhs_matrix: the right hand sides as columns
+        :return: a solution (or None) for each column (see solve)
+        """
+        return [self.solve(rhs_matrix.column(j)) for j in range(rhs_matrix.shape[1])]
+
+    @property
+    def _buffer(self) -> RowOperationBuffer[F]:
+        return self._factorization_and_pivot_columns[0]
+
+    @property
+    def _pivot_columns(self) -> List[int]:
+        return self._factorization_and_pivot_columns[1]
+
+    @property
+    def _multipliers(self) -> List[List[F]]:
+        return cast(List[List[F]], self._buffer.multipliers)
+
+    @functools.cached_property
+    def _factorization_and_pivot_columns(
+        self,
+    ) -> Tuple[RowOperationBuffer[F], List[int]]:
+        """
+        run forward elimination once, recording the permutation and the multipliers
+
+        :return: the eliminated buffer (holding P, L and U), pivot columns
+        """
+        buffer = RowOperationBuffer.from_matrix(
+            self.base_matrix, track_transformation=False, track_multipliers=True
+        )
+        pivot_columns = buffer.forward_eliminate()
+        return buffer, pivot_columns
@@ -0,0 +1,487 @@
+from typing import TypeVar, Generic, Any, List, Optional, Tuple, Type
+from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+import numpy as np
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.field import (
+    FieldProtocol,
+    multiplicative_inverse,
+)
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+from abstract_algebra.linear_algebra import numpy_backend
+from abstract_algebra.linear_algebra.kernels import kernels_for
+
+F = TypeVar("F", bound=FieldProtocol)
+
+
+class AbstractRowOperationBuffer(ABC, Generic[F]):
+    """
+    a mutable working copy of the rows of a matrix that is row reduced in place
+
+    the elimination loops are shared, storing the rows is up to the subclasses
+    (python lists in RowOperationBuffer, numpy arrays in NumpyRowOperationBuffer)
+    """
+
+    permutation: List[int]
+    swap_count: int
+
+    @classmethod
+    @abstractmethod
+    def from_matrix(
+        cls,
+        matrix: Matrix[F],
+        track_transformation: bool = True,
+        transformation: Optional[Matrix[F]] = None,
+        track_multipliers: bool = False,
+    ) -> "AbstractRowOperationBuffer[F]":
+        """
+        copy a matrix into a new working buffer
+
+        :param matrix: the matrix to copy
+        :param track_transformation: set to True to accumulate the row operations into a transformation matrix
+        :param transformation: the transformation to start from (defaults to the identity matrix)
+        :param track_multipliers: set to True to record the multipliers of forward elimination
+        :return: the new buffer
+        """
+
+    @property
+    @abstractmethod
+    def shape(self) -> Tuple[int, int]: ...
+
+    @abstractmethod
+    def to_matrix(self) -> Matrix[F]: ...
+
+    @abstractmethod
+    def transformation_matrix(self) -> Matrix[F]: ...
+
+    @abstractmethod
+    def is_zero(self, i: int, j: int) -> bool:
+        """
+        whether the entry in row i and column j is zero
+        """
+
+    @abstractmethod
+    def swap(self, i: int, j: int) -> None:
+        """
+        swap row i and row j
+        """
+
+    @abstractmethod
+    def normalize_pivots(self, pivot_columns: List[int]) -> None:
+        """
+        scale each nonzero row so that its pivot is the multiplicative identity
+
+        :param pivot_columns: the pivot column of each nonzero row (see forward_eliminate)
+        """
+
+    @abstractmethod
+    def eliminate_column(self, pivot_row: int, pivot_column: int, rows: range) -> None:
+        """
+        use the pivot at (pivot_row, pivot_column) to zero out that column in each of "rows"
+        """
+
+    def forward_eliminate(self) -> List[int]:
+        """
+        reduce the buffer to a row echelon form (not reduced)
+        the pivot of each step is the first nonzero entry at or below the current pivot row
+
+        :return: the pivot column of each nonzero row of the row echelon form
+        """
+        row_count, column_count = self.shape
+        pivot_columns: List[int] = []
+        pivot_row = 0
+        for pivot_column in range(column_count):
+            if pivot_row >= row_count:
+                break
+            swap_row = -1
+            for i in range(pivot_row, row_count):
+                if not self.is_zero(i, pivot_column):
+                    swap_row = i
+                    break
+            if swap_row == -1:
+                continue
+            self.swap(swap_row, pivot_row)
+            self.eliminate_column(
+                pivot_row, pivot_column, range(pivot_row + 1, row_count)
+            )
+            pivot_columns.append(pivot_column)
+            pivot_row += 1
+        return pivot_columns
+
+    def backward_eliminate(self, pivot_columns: List[int]) -> None:
+        """
+        zero out all the entries above the pivots of a buffer in row echelon form
+
+        :param pivot_columns: the pivot column of each nonzero row (see forward_eliminate)
+        """
+        for pivot_row in range(len(pivot_columns) - 1, -1, -1):
+            self.eliminate_column(
+                pivot_row, pivot_columns[pivot_row], range(0, pivot_row)
+            )
+
+
+@dataclass(init=True)
+class RowOperationBuffer(AbstractRowOperationBuffer[F]):
+    """
+    a mutable working copy of the rows of a matrix
+    that elementary row operations are applied to in place
+
+    if "transformation" is set, every row operation is mirrored onto it.
+    Starting from the identity this accumulates E in the equation:
+    R = EA
+    where A is the starting matrix and R is the current state of the buffer
+
+    if "multipliers" is set, forward elimination records the multiplier of each
+    eliminated entry in it, building the strictly lower part of L in the equation:
+    PA = LU
+    where P is the permutation matrix built from "permutation"
+    """
+
+    rows: List[List[F]]
+    zero: F
+    one: F
+    transformation: Optional[List[List[F]]] = None
+    multipliers: Optional[List[List[F]]] = None
+    permutation: List[int] = field(default_factory=list)
+    swap_count: int = 0
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: Matrix[F],
+        track_transformation: bool = True,
+        transformation: Optional[Matrix[F]] = None,
+        track_multipliers: bool = False,
+    ) -> "RowOperationBuffer[F]":
+        zero = additive_identity(matrix[0][0])
+        one = multiplicative_identity(matrix[0][0])
+        rows = [list(row) for row in matrix.storage.to_rows()]
+        transformation_rows: Optional[List[List[F]]] = None
+        if transformation is not None:
+            transformation_rows = [list(row.entries) for row in transformation.rows]
+        elif track_transformation:
+            transformation_rows = [
+                [one if i == j else zero for j in range(len(rows))]
+                for i in range(len(rows))
+            ]
+        multipliers: Optional[List[List[F]]] = None
+        if track_multipliers:
+            multipliers = [[zero for j in range(len(rows))] for i in range(len(rows))]
+        return cls(
+            rows=rows,
+            zero=zero,
+            one=one,
+            transformation=transformation_rows,
+            multipliers=multipliers,
+            permutation=list(range(len(rows))),
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.rows), len(self.rows[0])
+
+    def to_matrix(self) -> Matrix[F]:
+        return Matrix.new_matrix_unchecked(self.rows)
+
+    def transformation_matrix(self) -> Matrix[F]:
+        if self.transformation is None:
+            raise ValueError("This buffer is not tracking its transformation matrix")
+        return Matrix.new_matrix_unchecked(self.transformation)
+
+    def is_zero(self, i: int, j: int) -> bool:
+        return self.rows[i][j] == self.zero
+
+    def swap(self, i: int, j: int) -> None:
+        if i == j:
+            return
+        self.rows[i], self.rows[j] = self.rows[j], self.rows[i]
+        if self.transformation is not None:
+            self.transformation[i], self.transformation[j] = (
+                self.transformation[j],
+                self.transformation[i],
+            )
+        if self.multipliers is not None:
+            self.multipliers[i], self.multipliers[j] = (
+                self.multipliers[j],
+                self.multipliers[i],
+            )
+        self.permutation[i], self.permutation[j] = (
+            self.permutation[j],
+            self.permutation[i],
+        )
+        self.swap_count += 1
+
+    def scale(self, i: int, factor: F, start: int = 0) -> None:
+        """
+        multiply row i by factor
+
+        :param i: the row to scale
+        :param factor: the (nonzero) scalar to multiply by
+        :param start: the first column of the buffer that can be nonzero in row i
+        """
+        kernels = kernels_for(type(factor))
+        row = self.rows[i]
+        row[start:] = kernels.scale(factor, row[start:])
+        if self.transformation is not None:
+            self.transformation[i] = kernels.scale(factor, self.transformation[i])
+
+    def add_multiple(self, target: int, source: int, factor: F, start: int = 0) -> None:
+        """
+        add factor times row "source" to row "target" (an "axpy" operation)
+
+        :param target: the row that is modified
+        :param source: the row that is added
+        :param factor: the scalar to multiply the source row by
+        :param start: the first column of the buffer that can be nonzero in row "source"
+        """
+        kernels = kernels_for(type(factor))
+        target_row = self.rows[target]
+        target_row[start:] = kernels.axpy(
+            factor, self.rows[source][start:], target_row[start:]
+        )
+        if self.transformation is not None:
+            self.transformation[target] = kernels.axpy(
+                factor, self.transformation[source], self.transformation[target]
+            )
+
+    def normalize_pivots(self, pivot_columns: List[int]) -> None:
+        for pivot_row, pivot_column in enumerate(pivot_columns):
+            pivot_value = self.rows[pivot_row][pivot_column]
+            if pivot_value != self.one:
+                self.scale(
+                    pivot_row, multiplicative_inverse(pivot_value), start=pivot_column
+                )
+
+    def eliminate_column(self, pivot_row: int, pivot_column: int, rows: range) -> None:
+        pivot_value = self.rows[pivot_row][pivot_column]
+        for i in rows:
+            entry = self.rows[i][pivot_column]
+            if entry == self.zero:
+                continue
+            multiplier = entry / pivot_value
+            # only rows below the pivot belong to L, back elimination isn't recorded
+            if self.multipliers is not None and i > pivot_row:
+                self.multipliers[i][pivot_row] = multiplier
+            self.add_multiple(i, pivot_row, self.zero - multiplier, start=pivot_column)
+            self.rows[i][pivot_column] = self.zero
+
+
+@dataclass(init=True)
+class NumpyRowOperationBuffer(AbstractRowOperationBuffer[F]):
+    """
+    the counterpart of RowOperationBuffer for float and ComplexNumber matrices
+    where "rows", "transformation" and "multipliers" are numpy arrays
+    so every row operation (and every column elimination) is vectorized.
+    "zero", "one" and the factors of the row operations are numpy scalars.
+
+    The operations are carried out in the same order as in RowOperationBuffer
+    so the results are the same
+    """
+
+    rows: np.ndarray
+    zero: Any
+    one: Any
+    transformation: Optional[np.ndarray] = None
+    multipliers: Optional[np.ndarray] = None
+    permutation: List[int] = field(default_factory=list)
+    swap_count: int = 0
+    element_type: Type = float
+    modulus: Optional[int] = None
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: Matrix[F],
+        track_transformation: bool = True,
+        transformation: Optional[Matrix[F]] = None,
+        track_multipliers: bool = False,
+    ) -> "NumpyRowOperationBuffer[F]":
+        element_type = matrix.field
+        modulus = None
+        if element_type is PrimeFieldElement:
+            modulus = numpy_backend.modulus_of(matrix.storage.to_rows())
+        rows = numpy_backend.to_array(matrix.storage.to_rows(), element_type)
+        row_count = rows.shape[0]
+        transformation_rows = None
+        if transformation is not None:
+            transformation_rows = numpy_backend.to_array(transformation, element_type)
+        elif track_transformation:
+            transformation_rows = np.eye(row_count, dtype=rows.dtype)
+        multipliers = None
+        if track_multipliers:
+            multipliers = np.zeros((row_count, row_count), dtype=rows.dtype)
+        return cls(
+            rows=rows,
+            zero=rows.dtype.type(0),
+            one=rows.dtype.type(1),
+            transformation=transformation_rows,
+            multipliers=multipliers,
+            permutation=list(range(row_count)),
+            element_type=element_type,
+            modulus=modulus,
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        row_count, column_count = self.rows.shape
+        return row_count, column_count
+
+    def to_matrix(self) -> Matrix[F]:
+        return Matrix.new_matrix_unchecked(
+            numpy_backend.from_array(self.rows, self.element_type, self.modulus)
+        )
+
+    def transformation_matrix(self) -> Matrix[F]:
+        if self.transformation is None:
+            raise ValueError("This buffer is not tracking its transformation matrix")
+        return Matrix.new_matrix_unchecked(
+            numpy_backend.from_array(
+                self.transformation, self.element_type, self.modulus
+            )
+        )
+
+    def is_zero(self, i: int, j: int) -> bool:
+        return bool(self.rows[i, j] == self.zero)
+
+    def swap(self, i: int, j: int) -> None:
+        if i == j:
+            return
+        for array in (self.rows, self.transformation, self.multipliers):
+            if array is not None:
+                array[[i, j]] = array[[j, i]]
+        self.permutation[i], self.permutation[j] = (
+            self.permutation[j],
+            self.permutation[i],
+        )
+        self.swap_count += 1
+
+    def scale(self, i: int, factor: Any, start: int = 0) -> None:
+        self.rows[i, start:] *= factor
+        if self.transformation is not None:
+            self.transformation[i] *= factor
+
+    def add_multiple(
+        self, target: int, source: int, factor: Any, start: int = 0
+    ) -> None:
+        self.rows[target, start:] += factor * self.rows[source, start:]
+        if self.transformation is not None:
+            self.transformation[target] += factor * self.transformation[source]
+
+    def normalize_pivots(self, pivot_columns: List[int]) -> None:
+        for pivot_row, pivot_column in enumerate(pivot_columns):
+            pivot_value = self.rows[pivot_row, pivot_column]
+            if pivot_value != self.one:
+                self.scale(pivot_row, self.one / pivot_value, start=pivot_column)
+
+    def eliminate_column(self, pivot_row: int, pivot_column: int, rows: range) -> None:
+        targets = np.arange(rows.start, rows.stop)
+        if targets.size == 0:
+            return
+        targets = targets[self.rows[targets, pivot_column] != self.zero]
+        if targets.size == 0:
+            return
+        multipliers = (
+            self.rows[targets, pivot_column] / self.rows[pivot_row, pivot_column]
+        )
+        if self.multipliers is not None:
+            below = targets > pivot_row
+            self.multipliers[targets[below], pivot_row] = multipliers[below]
+        self.rows[targets, pivot_column:] -= np.outer(
+            multipliers, self.rows[pivot_row, pivot_column:]
+        )
+        self.rows[targets, pivot_column] = self.zero
+        if self.transformation is not None:
+            self.transformation[targets] -= np.outer(
+                multipliers, self.transformation[pivot_row]
+            )
+
+
+@dataclass(init=True)
+class PrimeFieldRowOperationBuffer(NumpyRowOperationBuffer[F]):
+    """
+    a NumpyRowOperationBuffer for GF(p) matrices:
+    the arrays hold int64 residues and every operation is reduced modulo p
+    """
+
+    @property
+    def prime(self) -> int:
+        if self.modulus is None:
+            raise ValueError("GF(p) buffers need the modulus p")
+        return self.modulus
+
+    def scale(self, i: int, factor: Any, start: int = 0) -> None:
+        factor = int(factor) % self.prime
+        self.rows[i, start:] = self.rows[i, start:] * factor % self.prime
+        if self.transformation is not None:
+            self.transformation[i] = self.transformation[i] * factor % self.prime
+
+    def add_multiple(
+        self, target: int, source: int, factor: Any, start: int = 0
+    ) -> None:
+        factor = int(factor) % self.prime
+        self.rows[target, start:] = (
+            self.rows[target, start:] + factor * self.rows[source, start:]
+        ) % self.prime
+        if self.transformation is not None:
+            self.transformation[target] = (
+                self.transformation[target] + factor * self.transformation[source]
+            ) % self.prime
+
+    def normalize_pivots(self, pivot_columns: List[int]) -> None:
+        for pivot_row, pivot_column in enumerate(pivot_columns):
+            pivot_value = int(self.rows[pivot_row, pivot_column])
+            if pivot_value != 1:
+                self.scale(
+                    pivot_row, pow(pivot_value, -1, self.prime), start=pivot_column
+                )
+
+    def eliminate_column(self, pivot_row: int, pivot_column: int, rows: range) -> None:
+        targets = np.arange(rows.start, rows.stop)
+        if targets.size == 0:
+            return
+        targets = targets[self.rows[targets, pivot_column] != 0]
+        if targets.size == 0:
+            return
+        inverse = pow(int(self.rows[pivot_row, pivot_column]), -1, self.prime)
+        multipliers = self.rows[targets, pivot_column] * inverse % self.prime
+        if self.multipliers is not None:
+            below = targets > pivot_row
+            self.multipliers[targets[below], pivot_row] = multipliers[below]
+        self.rows[targets, pivot_column:] = (
+            self.rows[targets, pivot_column:]
+            - np.outer(multipliers, self.rows[pivot_row, pivot_column:]) % self.prime
+        ) % self.prime
+        if self.transformation is not None:
+            self.transformation[targets] = (
+                self.transformation[targets]
+                - np.outer(multipliers, self.transformation[pivot_row]) % self.prime
+            ) % self.prime
+
+
+def new_row_operation_buffer(
+    matrix: Matrix[F],
+    track_transformation: bool = True,
+    transformation: Optional[Matrix[F]] = None,
+    track_multipliers: bool = False,
+) -> AbstractRowOperationBuffer[F]:
+    """
+    copy a matrix into a new working buffer,
+    using the numpy backed buffer for the fields numpy supports
+    (GF(p) only for p below numpy_backend.MAX_NUMPY_MODULUS)
+    (see AbstractRowOperationBuffer.from_matrix for the parameters)
+    """
+    buffer_type: Type[AbstractRowOperationBuffer[F]]
+    if not numpy_backend.supports(matrix.field, matrix.storage.entry(0, 0)):
+        buffer_type = RowOperationBuffer
+    elif matrix.field is PrimeFieldElement:
+        buffer_type = PrimeFieldRowOperationBuffer
+    else:
+        buffer_type = NumpyRowOperationBuffer
+    return buffer_type.from_matrix(
+        matrix,
+        track_transformation=track_transformation,
+        transformation=transformation,
+        track_multipliers=track_multipliers,
+    )
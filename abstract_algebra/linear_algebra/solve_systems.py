@@ -1,13 +1,25 @@
-from typing import TypeVar, Tuple, List, Optional
+from typing import TypeVar, Tuple, List, Optional, cast
 from abstract_algebra.abstract_structures.monoid import additive_identity
 from abstract_algebra.abstract_structures.group import additive_inverse
 from abstract_algebra.abstract_structures.field import FieldProtocol, multiplicative_inverse
 from abstract_algebra.compound_structures.vector import Vector
 from abstract_algebra.compound_structures.matrix import Matrix
-from abstract_algebra.linear_algebra.matrix_subspaces import MatrixSubspaces
+from abstract_algebra.compound_structures.fraction import Fraction, Rational
+from abstract_algebra.linear_algebra.gauss_jordan import GaussJordan
+from abstract_algebra.linear_algebra.incremental_basis import IncrementalBasis
+from abstract_algebra.linear_algebra.matrix_subspaces import (
+    MatrixSubspaces,
+    null_space_from_reduced_form,
+)
+from abstract_algebra.linear_algebra.matrix_operations import reduced_form_pivot_columns
+from abstract_algebra.linear_algebra.dixon import Dixon
 
 F = TypeVar("F", bound=FieldProtocol)
 
+# square rational systems of at least this size are solved by p-adic lifting (see Dixon)
+# set to None to always use Gauss-Jordan elimination
+DIXON_THRESHOLD: Optional[int] = 10
+
 
 def in_null_space(matrix: Matrix[F], vector: Vector[F]) -> bool:
     zero = additive_identity(vector)
@@ -15,26 +27,84 @@ def in_null_space(matrix: Matrix[F], vector: Vector[F]) -> bool:
 
 
 def in_span(vectors: List[Vector[F]], v: Vector[F]) -> bool:
-    column_matrix: Matrix[F] = Matrix.new_matrix(vectors).transpose()
-    column_basis = MatrixSubspaces(column_matrix).column_space
-
-    augmented_column_matrix: Matrix[F] = Matrix.new_matrix(vectors + [v]).transpose()
-    augmented_column_basis = MatrixSubspaces(augmented_column_matrix).column_space
-
-    return len(column_basis) == len(augmented_column_basis)
+    return IncrementalBasis.from_vectors(vectors).contains(v)
 
 
 def solve_linear_system(matrix: Matrix[F], b: Vector[F]) -> Optional[Vector[F]]:
+    if _use_dixon(matrix, b):
+        # _use_dixon made sure that F is Fraction[int]
+        solution = Dixon(cast(Matrix[Fraction[int]], matrix)).solve(
+            cast(Vector[Fraction[int]], b)
+        )
+        if solution is not None:
+            return cast(Vector[F], solution)
     augmented_matrix: Matrix[F] = Matrix.new_matrix(list(matrix.transpose().rows) + [b]).transpose()
     null_basis = MatrixSubspaces(augmented_matrix).null_space
     for vec in null_basis:
-        if (k := vec[-1]) != 0:
-            x = Vector.new_vector(vec.entries[:-1])
+        if (k := vec[-1]) != additive_identity(k):
+            x = Vector.new_vector_unchecked(vec.entries[:-1])
             return additive_inverse(multiplicative_inverse(k)) * x
     return None
 
 
+def _use_dixon(matrix: Matrix[F], b: Vector[F]) -> bool:
+    """
+    True for square systems over Fraction[int] with at least DIXON_THRESHOLD rows
+    (singular ones still fall back to Gauss-Jordan elimination)
+    """
+    return (
+        DIXON_THRESHOLD is not None
+        and matrix.shape[0] == matrix.shape[1] == len(b) >= DIXON_THRESHOLD
+        and all(type(entry) is Rational for entry in matrix.storage.entries())
+        and all(type(entry) is Rational for entry in b)
+    )
+
+
 def completely_solve_linear_system(
     matrix: Matrix[F], b: Vector[F]
 ) -> Tuple[Optional[Vector[F]], List[Vector[F]]]:
     return solve_linear_system(matrix, b), MatrixSubspaces(matrix).null_space
+
+
+def solve_linear_systems(
+    matrix: Matrix[F], rhs_matrix: Matrix[F]
+) -> Tuple[List[Optional[Vector[F]]], List[Vector[F]]]:
+    """
+    solve Ax = b for every column b of rhs_matrix with a single elimination of [A | B]
+
+    :param matrix: the coefficient matrix A
+    :param rhs_matrix: the right hand sides B (one per column)
+    :return: a solution (or None) for each column of B, a basis of the null space of A
+    """
+    if matrix.shape[0] != rhs_matrix.shape[0]:
+        raise TypeError(
+            f"Cannot augment Matrix[{matrix.field}] of size {matrix.shape} "
+            f"with Matrix[{rhs_matrix.field}] of size {rhs_matrix.shape}"
+        )
+    column_count = matrix.shape[1]
+    augmented_matrix: Matrix[F] = Matrix.new_matrix(
+        [list(row) + list(rhs_row) for row, rhs_row in zip(matrix, rhs_matrix)]
+    )
+    reduced_matrix = GaussJordan(augmented_matrix).reduced_row_echelon_form
+    zero = additive_identity(matrix[0][0])
+
+    # rows pivoting inside A hold the basic variables of every solution
+    pivot_columns = reduced_form_pivot_columns(reduced_matrix, column_count)
+    basic_rows: List[Tuple[int, int]] = list(enumerate(pivot_columns))
+
+    solutions: List[Optional[Vector[F]]] = []
+    for rhs_column in range(column_count, reduced_matrix.shape[1]):
+        if any(
+            reduced_matrix[i][rhs_column] != zero
+            for i in range(len(basic_rows), reduced_matrix.shape[0])
+        ):
+            solutions.append(None)
+            continue
+        x = [zero for j in range(column_count)]
+        for i, pivot_column in basic_rows:
+            x[pivot_column] = reduced_matrix[i][rhs_column]
+        solutions.append(Vector.new_vector_unchecked(tuple(x)))
+
+    return solutions, null_space_from_reduced_form(
+        reduced_matrix, column_count, pivot_columns
+    )
@@ -0,0 +1,163 @@
+from typing import TypeVar, Generic, List, Tuple, Dict, Set
+from dataclasses import dataclass
+import functools
+import heapq
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.field import (
+    FieldProtocol,
+    multiplicative_inverse,
+)
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.sparse_matrix import SparseMatrix
+
+F = TypeVar("F", bound=FieldProtocol)
+
+
+@dataclass(init=True, frozen=True)
+class SparseSubspaces(Generic[F]):
+    """
+    the fundamental subspaces of a SparseMatrix (see MatrixSubspaces)
+
+    the matrix is reduced by sparse Gauss-Jordan elimination,
+    so only nonzero entries are ever touched.
+    Pivots are chosen Markowitz-style to limit fill-in:
+    the row with the fewest nonzeros is pivoted on
+    its entry whose column has the fewest nonzeros.
+
+    The spans match MatrixSubspaces, but since the pivots are chosen differently
+    the bases (the basic columns, the null space vectors) can differ
+    """
+
+    matrix: SparseMatrix[F]
+
+    @property
+    def pivots(self) -> List[Tuple[int, int]]:
+        """
+        the (row, column) of every pivot in the order they were chosen
+        """
+        return self._pivots_and_reduced_rows[0]
+
+    @functools.cached_property
+    def pivot_columns(self) -> List[int]:
+        return sorted(column for _, column in self.pivots)
+
+    @property
+    def rank(self) -> int:
+        return len(self.pivots)
+
+    @property
+    def nullity(self) -> int:
+        return self.matrix.shape[1] - self.rank
+
+    @functools.cached_property
+    def column_space(self) -> List[Vector[F]]:
+        columns = self.matrix.transpose()
+        return [
+            Vector.new_vector_unchecked(
+                tuple(
+                    columns[index].get(i, self.matrix.zero)
+                    for i in range(self.matrix.shape[0])
+                )
+            )
+            for index in self.pivot_columns
+        ]
+
+    @functools.cached_property
+    def sparse_null_space(self) -> SparseMatrix[F]:
+        """
+        a basis of the null space as the rows of a sparse matrix
+        (one row per free column, in increasing order of the free column)
+        """
+        zero = self.matrix.zero
+        one = multiplicative_identity(zero)
+        pivots, reduced_rows = self._pivots_and_reduced_rows
+        pivot_columns = set(column for _, column in pivots)
+        free_columns = [
+            j for j in range(self.matrix.shape[1]) if j not in pivot_columns
+        ]
+        basis_rows: Dict[int, Dict[int, F]] = {j: {j: one} for j in free_columns}
+        for row_index, pivot_column in pivots:
+            for j, entry in reduced_rows[row_index].items():
+                if j != pivot_column:
+                    basis_rows[j][pivot_column] = additive_inverse(entry)
+        return SparseMatrix(
+            shape=(len(free_columns), self.matrix.shape[1]),
+            zero=zero,
+            rows=tuple(basis_rows[j] for j in free_columns),
+        )
+
+    @functools.cached_property
+    def null_space(self) -> List[Vector[F]]:
+        null_space = self.sparse_null_space
+        return [
+            Vector.new_vector_unchecked(
+                tuple(row.get(j, null_space.zero) for j in range(null_space.shape[1]))
+            )
+            for row in null_space.rows
+        ]
+
+    @functools.cached_property
+    def _pivots_and_reduced_rows(
+        self,
+    ) -> Tuple[List[Tuple[int, int]], List[Dict[int, F]]]:
+        """
+        sparse Gauss-Jordan elimination
+
+        after the elimination every pivot row holds a one in its pivot column
+        and otherwise only entries in free (non-pivot) columns.
+        All the other rows are empty
+
+        :return: the (row, column) of each pivot, the reduced rows
+        """
+        zero = self.matrix.zero
+        one = multiplicative_identity(zero)
+        rows: List[Dict[int, F]] = [dict(row) for row in self.matrix.rows]
+        column_rows: Dict[int, Set[int]] = {}
+        for i, row in enumerate(rows):
+            for j in row:
+                column_rows.setdefault(j, set()).add(i)
+
+        active = set(i for i, row in enumerate(rows) if row)
+        queue = [(len(rows[i]), i) for i in active]
+        heapq.heapify(queue)
+        pivots: List[Tuple[int, int]] = []
+        while queue:
+            count, pivot_row_index = heapq.heappop(queue)
+            if pivot_row_index not in active:
+                continue
+            pivot_row = rows[pivot_row_index]
+            if count != len(pivot_row):
+                continue
+            if not pivot_row:
+                active.discard(pivot_row_index)
+                continue
+
+            # Markowitz cost (r - 1)(c - 1) with r fixed by the choice of row
+            pivot_column = min(pivot_row, key=lambda j: len(column_rows[j]))
+            inverse = multiplicative_inverse(pivot_row[pivot_column])
+            for j in pivot_row:
+                pivot_row[j] = pivot_row[j] * inverse
+            pivot_row[pivot_column] = one
+
+            for i in list(column_rows[pivot_column]):
+                if i == pivot_row_index:
+                    continue
+                row = rows[i]
+                factor = row[pivot_column]
+                for j, entry in pivot_row.items():
+                    updated = row.get(j, zero) - factor * entry
+                    if j == pivot_column or updated == zero:
+                        if j in row:
+                            del row[j]
+                            column_rows[j].discard(i)
+                    else:
+                        if j not in row:
+                            column_rows[j].add(i)
+                        row[j] = updated
+                if i in active:
+                    heapq.heappush(queue, (len(row), i))
+
+            active.discard(pivot_row_index)
+            pivots.append((pivot_row_index, pivot_column))
+        return pivots, rows
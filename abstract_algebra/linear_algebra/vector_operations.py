@@ -1,19 +1,15 @@
 from typing import TypeVar
-import functools
 from abstract_algebra.abstract_structures.monoid import additive_identity
 from abstract_algebra.abstract_structures.field import FieldProtocol
 from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.linear_algebra.kernels import kernels_for
 
 
 F = TypeVar("F", bound=FieldProtocol)
 
 
 def dot_product(v: Vector[F], w: Vector[F]) -> F:
-    return functools.reduce(
-        lambda a, b: a + b,
-        [xi * yi for (xi, yi) in zip(v.entries, w.entries)],
-        additive_identity(v.entries[0]),
-    )
+    return kernels_for(v.field).dot(v.entries, w.entries)
 
 
 def identify_first_nonzero_entry(
@@ -0,0 +1,298 @@
+from typing import (
+    TypeVar,
+    Generic,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from dataclasses import dataclass
+import functools
+import random
+from abstract_algebra.abstract_structures.monoid import additive_identity
+from abstract_algebra.abstract_structures.group import additive_inverse
+from abstract_algebra.abstract_structures.ring import multiplicative_identity
+from abstract_algebra.abstract_structures.field import (
+    FieldProtocol,
+    multiplicative_inverse,
+)
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.compound_structures.sparse_matrix import SparseMatrix
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+from abstract_algebra.concrete_structures.galois_field import GaloisFieldElement
+from abstract_algebra.linear_algebra import vector_operations
+from abstract_algebra.linear_algebra.solve_systems import solve_linear_system
+
+F = TypeVar("F", bound=FieldProtocol)
+
+# how often a random projection may annihilate a nonzero vector before giving up
+DEFAULT_TRIES = 16
+
+
+class InconclusiveSystemError(ValueError):
+    """
+    raised by Wiedemann.solve for a singular system that it can neither solve nor
+    prove inconsistent (b has a component along the nilpotent part of A)
+    """
+
+
+@dataclass(init=True, frozen=True)
+class Wiedemann(Generic[F]):
+    """
+    a black box solver for square systems Ax = b over a finite field (GF(p) or GF(p^k))
+
+    A is only used through "apply" (v -> Av), so it can be a Matrix, a SparseMatrix
+    or any other linear operator, and no more than a few vectors are stored besides it.
+
+    The minimal polynomial f of b (the monic f of least degree with f(A)b = 0)
+    is found with Berlekamp-Massey on the projected Krylov sequence u.A^i b for a random u.
+    A random u can miss factors of f, then the search continues on f_u(A)b
+    and the factors are multiplied up until b is annihilated (which is checked exactly).
+    With f(λ) = c_0 + c_1 λ + ... + c_d λ^d and c_0 != 0:
+        x = -(c_1 b + c_2 Ab + ... + c_d A^(d-1) b) / c_0 solves Ax = b
+
+    :param apply: the matrix-vector product v -> Av
+    :param dimension: the size n of A (n x n)
+    :param zero: the additive identity of the field
+    :param seed: seeds the random projections and starting vectors
+    :param tries: how many random vectors to try before giving up
+    :param fallback: solves the systems Wiedemann can't decide (e.g. by elimination),
+        returning None if there is no solution. from_matrix uses solve_linear_system
+    """
+
+    apply: Callable[[Vector[F]], Vector[F]]
+    dimension: int
+    zero: F
+    seed: Optional[int] = None
+    tries: int = DEFAULT_TRIES
+    fallback: Optional[Callable[[Vector[F]], Optional[Vector[F]]]] = None
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: Union[Matrix[F], SparseMatrix[F]],
+        seed: Optional[int] = None,
+        tries: int = DEFAULT_TRIES,
+    ) -> "Wiedemann[F]":
+        if matrix.shape[0] != matrix.shape[1]:
+            raise TypeError(
+                f"Wiedemann needs a square matrix: Mismatched dims: {matrix.shape}"
+            )
+        if isinstance(matrix, SparseMatrix):
+            zero = matrix.zero
+        else:
+            zero = additive_identity(matrix[0][0])
+
+        def eliminate(b: Vector[F]) -> Optional[Vector[F]]:
+            if isinstance(matrix, SparseMatrix):
+                return solve_linear_system(matrix.to_matrix(), b)
+            return solve_linear_system(matrix, b)
+
+        return cls(
+            apply=matrix.__matmul__,
+            dimension=matrix.shape[0],
+            zero=zero,
+            seed=seed,
+            tries=tries,
+            fallback=eliminate,
+        )
+
+    def solve(self, b: Vector[F]) -> Optional[Vector[F]]:
+        """
+        solve Ax = b
+
+        :param b: the right hand side
+        :return: a solution or None if there is none.
+            Wiedemann only solves singular systems if b has no component along
+            the nilpotent part of A (always the case if 0 is a simple root of the minimal polynomial of A),
+            the other systems are passed to the fallback
+        :raises InconclusiveSystemError: if such a system comes up and there is no fallback
+        """
+        if len(b) != self.dimension:
+            raise TypeError(
+                f"unsupported operand type(s) for solve: "
+                f"'Wiedemann' of dimension {self.dimension} incompatible with"
+                f"'Dim(Vector[{b.field}])={len(b)}'"
+            )
+        polynomial = self.minimal_polynomial(b)
+        if polynomial[0] == self.zero:
+            if self.fallback is None:
+                raise InconclusiveSystemError(
+                    "b has a component along the nilpotent part of A, "
+                    "Wiedemann can't tell if the system is solvable"
+                )
+            return self.fallback(b)
+        if len(polynomial) == 1:
+            # b = 0
+            return b
+        x = apply_polynomial(self.apply, polynomial[1:], b)
+        return x * additive_inverse(multiplicative_inverse(polynomial[0]))
+
+    @functools.cached_property
+    def null_space_vector(self) -> Optional[Vector[F]]:
+        """
+        a nonzero vector v with Av = 0 or None if A is (most likely) nonsingular
+
+        for a random z with minimal polynomial λ^k g(λ) (g(0) != 0, k > 0)
+        g(A)z is nonzero and A^k g(A)z = 0,
+        so the last nonzero vector of g(A)z, A g(A)z, ... is in the null space.
+        If every z tried has k = 0, A is nonsingular with high probability
+        """
+        for _ in range(self.tries):
+            z = self._random_vector()
+            polynomial = self.minimal_polynomial(z)
+            k = next(k for k, c in enumerate(polynomial) if c != self.zero)
+            if k == 0:
+                continue
+            v = apply_polynomial(self.apply, polynomial[k:], z)
+            while not self._is_zero(w := self.apply(v)):
+                v = w
+            return v
+        return None
+
+    @property
+    def null_space(self) -> List[Vector[F]]:
+        """
+        the null space vector as a list (empty if none was found),
+        unlike MatrixSubspaces.null_space this is not a basis
+        """
+        if self.null_space_vector is None:
+            return []
+        return [self.null_space_vector]
+
+    def completely_solve(
+        self, b: Vector[F]
+    ) -> Tuple[Optional[Vector[F]], List[Vector[F]]]:
+        return self.solve(b), self.null_space
+
+    def minimal_polynomial(self, v: Vector[F]) -> List[F]:
+        """
+        the minimal polynomial of v with respect to A
+
+        :param v: the vector
+        :return: the coefficients (lowest degree first) of the monic polynomial f of least degree with f(A)v = 0
+        """
+        one = multiplicative_identity(self.zero)
+        polynomial = [one]
+        residual = v
+        failures = 0
+        while not self._is_zero(residual):
+            # the minimal polynomial of the residual divides the one of v
+            # so its degree is at most dimension - deg(polynomial)
+            length = 2 * (self.dimension - len(polynomial) + 1)
+            factor = berlekamp_massey(self._projected_sequence(residual, length))
+            if len(factor) == 1:
+                failures += 1
+                if failures >= self.tries:
+                    raise ValueError(
+                        f"No annihilating polynomial found in {self.tries} random projections"
+                    )
+                continue
+            residual = apply_polynomial(self.apply, factor, residual)
+            polynomial = _multiply_polynomials(polynomial, factor)
+        return polynomial
+
+    def _projected_sequence(self, v: Vector[F], length: int) -> List[F]:
+        """
+        u.v, u.Av, ..., u.A^(length - 1)v for a random u
+        """
+        u = self._random_vector()
+        sequence: List[F] = []
+        for i in range(length):
+            if i:
+                v = self.apply(v)
+            sequence.append(vector_operations.dot_product(u, v))
+        return sequence
+
+    @functools.cached_property
+    def _random(self) -> random.Random:
+        return random.Random(self.seed)
+
+    def _random_vector(self) -> Vector[F]:
+        return Vector.new_vector_unchecked(
+            tuple(
+                random_field_element(self.zero, self._random)
+                for _ in range(self.dimension)
+            )
+        )
+
+    def _is_zero(self, v: Vector[F]) -> bool:
+        return all(entry == self.zero for entry in v)
+
+
+def berlekamp_massey(sequence: Sequence[F]) -> List[F]:
+    """
+    the minimal polynomial of a linearly recurrent sequence over a field
+
+    :param sequence: s_0, s_1, ... (twice as many terms as the degree of the recurrence are enough)
+    :return: the coefficients (lowest degree first) of the monic f of least degree
+        with f_0 s_i + f_1 s_(i+1) + ... + f_d s_(i+d) = 0 for every i
+    """
+    zero = additive_identity(sequence[0])
+    one = multiplicative_identity(sequence[0])
+    # connection polynomial C: s_n + C_1 s_(n-1) + ... + C_L s_(n-L) = 0
+    connection, previous = [one], [one]
+    length, shift, previous_discrepancy = 0, 1, one
+    for n, s in enumerate(sequence):
+        discrepancy = s
+        for i in range(1, min(length, len(connection) - 1) + 1):
+            discrepancy = discrepancy + connection[i] * sequence[n - i]
+        if discrepancy == zero:
+            shift += 1
+            continue
+        coefficient = discrepancy / previous_discrepancy
+        updated = connection + [zero] * (len(previous) + shift - len(connection))
+        for i, p in enumerate(previous):
+            updated[i + shift] = updated[i + shift] - coefficient * p
+        if 2 * length <= n:
+            previous, previous_discrepancy = connection, discrepancy
+            length, shift = n + 1 - length, 1
+        else:
+            shift += 1
+        connection = updated
+    connection = connection + [zero] * (length + 1 - len(connection))
+    # f(λ) = λ^L C(1/λ)
+    return connection[length::-1]
+
+
+def apply_polynomial(
+    apply: Callable[[Vector[F]], Vector[F]], polynomial: Sequence[F], v: Vector[F]
+) -> Vector[F]:
+    """
+    f(A)v by Horner's rule (deg f products with A)
+
+    :param apply: the matrix-vector product v -> Av
+    :param polynomial: the coefficients of f (lowest degree first)
+    :param v: the vector
+    """
+    result = v * polynomial[-1]
+    for coefficient in reversed(polynomial[:-1]):
+        result = apply(result) + v * coefficient
+    return result
+
+
+def random_field_element(sample: F, rng: random.Random) -> F:
+    """
+    a uniformly random element of the finite field of "sample"
+    """
+    # the element has the type of "sample", which is F
+    if isinstance(sample, PrimeFieldElement):
+        return cast(F, PrimeFieldElement(rng.randrange(sample.modulus), sample.modulus))
+    if isinstance(sample, GaloisFieldElement):
+        return cast(F, rng.choice(sample.field.elements))
+    raise TypeError(
+        f"Random elements are only available for finite fields: {type(sample)}"
+    )
+
+
+def _multiply_polynomials(first: List[F], second: List[F]) -> List[F]:
+    zero = additive_identity(first[0])
+    product = [zero] * (len(first) + len(second) - 1)
+    for i, a in enumerate(first):
+        for j, b in enumerate(second):
+            product[i + j] = product[i + j] + a * b
+    return product
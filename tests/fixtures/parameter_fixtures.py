@@ -9,6 +9,11 @@ from abstract_algebra.compound_structures.vector import Vector
 from abstract_algebra.compound_structures.matrix import Matrix
 from abstract_algebra.compound_structures.fraction import Fraction
 from abstract_algebra.concrete_structures.complex import ComplexNumber, GaussianInteger
+from abstract_algebra.concrete_structures.prime_field import PrimeFieldElement
+from abstract_algebra.concrete_structures.galois_field import (
+    GaloisFieldElement,
+    galois_field,
+)
 
 integer_values: List[int] = [0, 4, 10, 23]
 float_values: List[float] = [0.5, 2.4, 4.0, 120.4]
@@ -31,6 +36,18 @@ complex_values: List[ComplexNumber] = [
     ComplexNumber(20.33, 20.1),
     ComplexNumber(20.33, 0.0),
 ]
+prime_field_values: List[PrimeFieldElement] = [
+    PrimeFieldElement(1, 2),
+    PrimeFieldElement(3, 7),
+    PrimeFieldElement(-5, 101),
+    PrimeFieldElement(123456789, 2147483647),
+]
+galois_field_values: List[GaloisFieldElement] = [
+    galois_field(2, 4)(1),
+    galois_field(2, 4)(13),
+    galois_field(3, 2)(7),
+    galois_field(2, 8)(200),
+]
 gaussian_integer_values: List[GaussianInteger] = [
     GaussianInteger(1, 0),
     GaussianInteger(0, 1),
@@ -92,7 +109,12 @@ matrix_values: List[Matrix] = [
 
 field_values: List[FieldProtocol] = cast(
     List[FieldProtocol],
-    float_values + complex_values + fraction_int_values + fraction_complex_values,
+    float_values
+    + complex_values
+    + fraction_int_values
+    + fraction_complex_values
+    + prime_field_values
+    + galois_field_values,
 )
 euclidian_ring_values: List[EuclideanRingProtocol] = cast(
     List[EuclideanRingProtocol],
@@ -127,6 +149,16 @@ def parameter_gaussian(request) -> GaussianInteger:
     return request.param
 
 
+@pytest.fixture(params=prime_field_values)
+def parameter_prime_field(request) -> PrimeFieldElement:
+    return request.param
+
+
+@pytest.fixture(params=galois_field_values)
+def parameter_galois_field(request) -> GaloisFieldElement:
+    return request.param
+
+
 @pytest.fixture(params=fraction_int_values)
 def parameter_fraction_int(request) -> Fraction[int]:
     return request.param
@@ -1,8 +1,21 @@
 from abstract_algebra.abstract_structures.monoid import MonoidProtocol
 from abstract_algebra.abstract_structures.group import GroupProtocol
 from abstract_algebra.abstract_structures.ring import RingProtocol
-from abstract_algebra.abstract_structures.euclidean_ring import EuclideanRingProtocol
+import math
+import pytest
+from abstract_algebra.abstract_structures.euclidean_ring import (
+    EuclideanRingProtocol,
+    generalized_gcd,
+    extended_gcd,
+    batch_gcd,
+)
 from abstract_algebra.abstract_structures.field import FieldProtocol
+import copy
+import fractions
+import itertools
+import pickle
+from abstract_algebra.compound_structures.fraction import Fraction, Rational
+from abstract_algebra.concrete_structures.complex import GaussianInteger
 from tests.fixtures.parameter_fixtures import (
     parameter_monoid,
     parameter_group,
@@ -40,3 +53,95 @@ def test_field(parameter_field: FieldProtocol):
     assert isinstance(
         parameter_field, FieldProtocol
     ), f"test parameter should implement FieldProtocol: {parameter_field}"
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        (12, 18),
+        (-12, 18),
+        (0, 7),
+        (7, 0),
+        (2**100 + 1, 2**64 - 1),
+        (GaussianInteger(7, 3), GaussianInteger(2, 5)),
+        (GaussianInteger(4, 2), GaussianInteger(2, 4)),
+    ],
+)
+def test_extended_gcd(a: EuclideanRingProtocol, b: EuclideanRingProtocol):
+    g, x, y = extended_gcd(a, b)
+    assert a * x + b * y == g, f"Bezout identity fails for {a}, {b}: {g}, {x}, {y}"
+    zero = a - a
+    assert a % g == zero, f"{g} doesn't divide {a}"
+    assert b % g == zero, f"{g} doesn't divide {b}"
+
+
+def test_batch_gcd():
+    values = [15, 21, 35, 11, 13 * 17, 17 * 19, 2**61 - 1]
+    expected = [generalized_gcd(value, math.prod(values) // value) for value in values]
+    assert batch_gcd(values) == expected, f"batch_gcd is wrong: {batch_gcd(values)}"
+
+
+def test_new_fractions():
+    numerators = [6, -4, 0, -3, 10**30, 7]
+    denominators = [8, -6, -5, 9, 4 * 10**20, -14]
+    fractions = Fraction.new_fractions(numerators, denominators)
+    for fraction, numerator, denominator in zip(fractions, numerators, denominators):
+        expected = Fraction(numerator, denominator)
+        assert (fraction.numerator, fraction.denominator) == (
+            expected.numerator,
+            expected.denominator,
+        ), f"new_fractions reduced {numerator}/{denominator} to {fraction}"
+
+
+def test_fractions_copy_and_pickle():
+    fraction_values = [
+        Fraction(3, -4),
+        Fraction(2),
+        Fraction(10**30, 7),
+        Fraction(GaussianInteger(1, 2), GaussianInteger(3, 1)),
+    ]
+    for fraction in fraction_values:
+        for duplicate in [
+            copy.copy(fraction),
+            copy.deepcopy(fraction),
+            pickle.loads(pickle.dumps(fraction)),
+        ]:
+            assert type(duplicate) is type(fraction), f"{duplicate} changed type"
+            assert duplicate == fraction, f"{duplicate} != {fraction}"
+            assert (duplicate.numerator, duplicate.denominator) == (
+                fraction.numerator,
+                fraction.denominator,
+            ), f"{duplicate} has different terms than {fraction}"
+    assert pickle.loads(pickle.dumps(Fraction(1))) is Fraction(
+        1
+    ), "Unpickled small integers aren't interned"
+
+
+def test_rational_matches_python_fractions():
+    assert type(Fraction[int](3)) is Rational, "Fraction[int] didn't create a Rational"
+    assert Fraction(4, 2) is Fraction(2), "Small integers aren't interned"
+    assert not hasattr(Fraction(1, 3), "__dict__"), "Rational has a __dict__"
+    assert {Fraction(2, 4), Fraction(-1, -2)} == {
+        Fraction(1, 2)
+    }, "Rational hashes differ"
+
+    terms = [(0, 1), (3, 1), (-1, 2), (5, -6), (-4, -10), (7, 12), (10**20, 3)]
+    for (a, b), (c, d) in itertools.product(terms, repeat=2):
+        x, y = Fraction(a, b), Fraction(c, d)
+        expected_x, expected_y = fractions.Fraction(a, b), fractions.Fraction(c, d)
+        results = [
+            (x + y, expected_x + expected_y),
+            (x - y, expected_x - expected_y),
+            (x * y, expected_x * expected_y),
+            (x + c, expected_x + c),
+            (c - x, c - expected_x),
+            (x * c, expected_x * c),
+        ]
+        if c != 0:
+            results += [(x / y, expected_x / expected_y), (x / c, expected_x / c)]
+        for result, expected in results:
+            assert type(result) is Rational, f"{result} is not a Rational"
+            assert (result.numerator, result.denominator) == (
+                expected.numerator,
+                expected.denominator,
+            ), f"{a}/{b} and {c}/{d}: {result} != {expected}"
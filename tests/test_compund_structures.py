@@ -1,5 +1,18 @@
 import pytest
 from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.compound_structures.validation import (
+    ValidationLevel,
+    get_validation_level,
+    validation_level,
+)
+from abstract_algebra.compound_structures.sparse_matrix import SparseMatrix
+from abstract_algebra.compound_structures.binary_matrix import BinaryMatrix
+from abstract_algebra.compound_structures.fraction import Fraction
+from abstract_algebra.compound_structures.scaled_matrix import (
+    ScaledMatrix,
+    ScaledVector,
+)
 from tests.fixtures.parameter_fixtures import parameter_vector, parameter_matrix
 
 
@@ -28,3 +41,157 @@ def test_vector_addition(first: Vector, second: Vector, expected: Vector):
     assert (
         expected == result
     ), f"Failure of Vector Addition. Added {first} to {second}. Expected: {expected}. Actual: {result}"
+
+
+def test_sparse_matrix_round_trip(parameter_matrix):
+    sparse_matrix = SparseMatrix.from_matrix(parameter_matrix)
+    assert (
+        sparse_matrix.to_matrix() == parameter_matrix
+    ), f"Converting to a SparseMatrix and back changed the matrix: {parameter_matrix}"
+    assert (
+        sparse_matrix.transpose().to_matrix() == parameter_matrix.transpose()
+    ), f"Sparse transpose doesn't match the dense transpose: {parameter_matrix}"
+
+
+def test_sparse_matrix_multiplication(parameter_matrix):
+    sparse_matrix = SparseMatrix.from_matrix(parameter_matrix)
+    sparse_transpose = sparse_matrix.transpose()
+    expected = parameter_matrix @ parameter_matrix.transpose()
+    assert (
+        sparse_matrix @ sparse_transpose
+    ).to_matrix() == expected, f"Sparse @ Sparse is wrong for {parameter_matrix}"
+    assert (
+        sparse_matrix @ parameter_matrix.transpose() == expected
+    ), f"Sparse @ Matrix is wrong for {parameter_matrix}"
+    assert (
+        parameter_matrix @ sparse_transpose == expected
+    ), f"Matrix @ Sparse is wrong for {parameter_matrix}"
+    row = parameter_matrix[0]
+    assert (
+        sparse_matrix @ row == parameter_matrix @ row
+    ), f"Sparse @ Vector is wrong for {parameter_matrix}"
+
+
+@pytest.mark.parametrize(
+    "entries", [[[1, 0, 1], [0, 1, 1]], [[1, 1], [0, 1], [1, 0]], [[0, 0, 0, 1]]]
+)
+def test_binary_matrix_operations(entries):
+    binary_matrix = BinaryMatrix.new_binary_matrix(entries)
+    matrix = binary_matrix.to_matrix()
+    assert (
+        BinaryMatrix.from_matrix(matrix) == binary_matrix
+    ), f"Converting to a Matrix and back changed the binary matrix: {entries}"
+    assert (
+        binary_matrix.transpose().to_matrix() == matrix.transpose()
+    ), f"Binary transpose doesn't match the dense transpose: {entries}"
+    assert (
+        binary_matrix @ binary_matrix.transpose()
+    ).to_matrix() == matrix @ matrix.transpose(), f"Binary @ is wrong for {entries}"
+    row = matrix[0]
+    assert (
+        binary_matrix @ row == matrix @ row
+    ), f"Binary @ Vector is wrong for {entries}"
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        [[(1, 2), (1, 3)], [(-2, 3), (5, 6)]],
+        [
+            [(1, 4), (3, 4), (0, 1)],
+            [(2, 5), (-1, 10), (7, 1)],
+            [(1, 6), (1, 6), (1, 3)],
+        ],
+    ],
+)
+def test_scaled_matrix_operations(entries):
+    matrix = Matrix.new_matrix(
+        [Vector.new_vector([Fraction(n, d) for n, d in row]) for row in entries]
+    )
+    scaled_matrix = ScaledMatrix.from_matrix(matrix)
+    assert (
+        scaled_matrix.to_matrix() == matrix
+    ), f"Converting to a ScaledMatrix and back changed the matrix: {entries}"
+    assert (
+        scaled_matrix @ scaled_matrix
+    ).to_matrix() == matrix @ matrix, f"Scaled @ is wrong for {entries}"
+    first, second = scaled_matrix[0], scaled_matrix[-1]
+    assert (scaled_matrix @ first).to_vector() == matrix @ matrix[
+        0
+    ], f"Scaled @ Vector is wrong for {entries}"
+    assert first.dot(second) == sum(
+        (a * b for a, b in zip(matrix[0], matrix[-1])), Fraction(0, 1)
+    ), f"Scaled dot product is wrong for {entries}"
+    factor = Fraction(-3, 7)
+    assert (
+        first.axpy(factor, second).to_vector() == matrix[0] + matrix[-1] * factor
+    ), f"Scaled axpy is wrong for {entries}"
+    assert first.axpy(factor, second) == ScaledVector.from_vector(
+        matrix[0] + matrix[-1] * factor
+    ), f"Scaled axpy isn't equal to the scaled result for {entries}"
+
+
+def test_validation_levels(parameter_matrix):
+    level = get_validation_level()
+    mixed_entries = [[1.0, 2], [3.0, 4.0]]
+    if level is not ValidationLevel.OFF:
+        with pytest.raises(TypeError):
+            Matrix.new_matrix(mixed_entries)
+    with validation_level(ValidationLevel.OFF):
+        Matrix.new_matrix(mixed_entries)
+    with validation_level(ValidationLevel.FULL):
+        assert get_validation_level() is ValidationLevel.FULL
+        checked_sum = parameter_matrix + parameter_matrix
+        checked_transpose = parameter_matrix.transpose()
+    assert (
+        get_validation_level() is level
+    ), "validation_level didn't restore the previous level"
+    assert (
+        parameter_matrix + parameter_matrix == checked_sum
+    ), f"Unchecked sum differs from the checked sum: {parameter_matrix}"
+    assert (
+        parameter_matrix.transpose() == checked_transpose
+    ), f"Unchecked transpose differs from the checked transpose: {parameter_matrix}"
+
+
+def test_matrix_views(parameter_matrix):
+    row_count, column_count = parameter_matrix.shape
+    entries = [list(row) for row in parameter_matrix]
+    transpose = parameter_matrix.transpose()
+    assert (
+        transpose.storage.buffer is parameter_matrix.storage.buffer
+    ), f"transpose copied the storage of {parameter_matrix}"
+    assert transpose == Matrix.new_matrix(
+        [[entries[i][j] for i in range(row_count)] for j in range(column_count)]
+    ), f"transpose is wrong for {parameter_matrix}"
+    for j in range(column_count):
+        assert parameter_matrix.column(j) == Vector.new_vector(
+            [row[j] for row in entries]
+        ), f"Column {j} is wrong for {parameter_matrix}"
+
+    for row_indexes, column_indexes in [
+        (slice(1, None), slice(None)),
+        (slice(None), slice(None, None, 2)),
+        (slice(0, 1), slice(1, None)),
+    ]:
+        expected_rows = [row[column_indexes] for row in entries[row_indexes]]
+        if not expected_rows or not expected_rows[0]:
+            continue
+        submatrix = parameter_matrix.submatrix(row_indexes, column_indexes)
+        assert submatrix == Matrix.new_matrix(
+            expected_rows
+        ), f"submatrix{row_indexes, column_indexes} is wrong for {parameter_matrix}"
+        assert (
+            submatrix.transpose().transpose() == submatrix
+        ), f"Views of views are wrong for {parameter_matrix}"
+
+
+def test_matrix_row_slices(parameter_matrix):
+    transpose = parameter_matrix.transpose()
+    matrix_sum = parameter_matrix + parameter_matrix
+    for matrix in [parameter_matrix, transpose, matrix_sum]:
+        rows = [matrix[i] for i in range(matrix.shape[0])]
+        for index in [slice(1, None), slice(None, None, -1), slice(0, 1), slice(5, 9)]:
+            assert matrix[index] == tuple(
+                rows[index]
+            ), f"matrix[{index}] is wrong for {matrix}"
@@ -1,7 +1,9 @@
 from math import isclose
 from typing import cast, SupportsFloat
+from dataclasses import dataclass
 from abstract_algebra.abstract_structures.monoid import (
     additive_identity,
+    register_additive_identity,
     MonoidProtocol,
 )
 from abstract_algebra.abstract_structures.group import (
@@ -10,10 +12,12 @@ from abstract_algebra.abstract_structures.group import (
 )
 from abstract_algebra.abstract_structures.ring import (
     multiplicative_identity,
+    register_multiplicative_identity,
     RingProtocol,
 )
 from abstract_algebra.abstract_structures.field import (
     multiplicative_inverse,
+    register_multiplicative_inverse,
     FieldProtocol,
 )
 from tests.fixtures.parameter_fixtures import (
@@ -61,3 +65,55 @@ def test_multiplicative_inverse_works(parameter_field: FieldProtocol):
     else:
         res = value_x_inverse == identity
     assert res, f"Multiplicative Inverse doesn't act as Inverse: {parameter_field}"
+
+
+@dataclass(frozen=True)
+class _Residue:
+    """
+    a bare bones user type without get_additive_identity / get_multiplicative_identity
+    """
+
+    value: int
+    modulus: int
+
+    def __add__(self, other: "_Residue") -> "_Residue":
+        return _Residue((self.value + other.value) % self.modulus, self.modulus)
+
+    def __sub__(self, other: "_Residue") -> "_Residue":
+        return _Residue((self.value - other.value) % self.modulus, self.modulus)
+
+    def __mul__(self, other: "_Residue") -> "_Residue":
+        return _Residue((self.value * other.value) % self.modulus, self.modulus)
+
+    def __truediv__(self, other: "_Residue") -> "_Residue":
+        return self * _Residue(pow(other.value, -1, self.modulus), self.modulus)
+
+
+def test_registered_identities_and_inverse():
+    element = _Residue(3, 7)
+    assert additive_identity(element) == _Residue(
+        0, 7
+    ), f"Additive identity of {element} isn't found by subtraction"
+    assert multiplicative_identity(element) == _Residue(
+        1, 7
+    ), f"Multiplicative identity of {element} isn't found by division"
+
+    calls = []
+    register_additive_identity(
+        _Residue, lambda r: calls.append("zero") or _Residue(0, r.modulus)
+    )
+    register_multiplicative_identity(
+        _Residue, lambda r: calls.append("one") or _Residue(1, r.modulus)
+    )
+    register_multiplicative_inverse(
+        _Residue,
+        lambda r: calls.append("inverse") or _Residue(pow(r.value, -1, r.modulus), 7),
+    )
+    assert additive_identity(element) == _Residue(0, 7)
+    assert multiplicative_identity(element) == _Residue(1, 7)
+    assert multiplicative_inverse(element) == _Residue(5, 7)
+    assert calls == [
+        "zero",
+        "one",
+        "inverse",
+    ], f"Registered functions weren't used for {element}: {calls}"
@@ -0,0 +1,885 @@
+from typing import Any, Callable, List
+import pytest
+import copy
+import functools
+import itertools
+import pickle
+from math import isclose
+from abstract_algebra.compound_structures.vector import Vector
+from abstract_algebra.compound_structures.matrix import Matrix
+from abstract_algebra.compound_structures.sparse_matrix import SparseMatrix
+from abstract_algebra.compound_structures.binary_matrix import (
+    BinaryMatrix,
+    unpack_vector,
+)
+from abstract_algebra.compound_structures.fraction import Fraction
+from abstract_algebra.compound_structures.validation import (
+    ValidationLevel,
+    validation_level,
+)
+from abstract_algebra.concrete_structures.complex import GaussianInteger, ComplexNumber
+from abstract_algebra.concrete_structures.galois_field import (
+    GaloisFieldElement,
+    galois_field,
+)
+from abstract_algebra.concrete_structures.prime_field import (
+    PrimeFieldElement,
+    prime_field,
+)
+from abstract_algebra.linear_algebra.gauss_jordan import GaussJordan
+from abstract_algebra.linear_algebra.bareiss import Bareiss
+from abstract_algebra.linear_algebra.plu_decomposition import PLUDecomposition
+from abstract_algebra.linear_algebra.multi_modular import MultiModular
+from abstract_algebra.linear_algebra.dixon import Dixon
+from abstract_algebra.linear_algebra import solve_systems
+from abstract_algebra.linear_algebra.matrix_subspaces import MatrixSubspaces
+from abstract_algebra.linear_algebra.sparse_subspaces import SparseSubspaces
+from abstract_algebra.linear_algebra.binary_subspaces import (
+    BinarySubspaces,
+    solve_binary_system,
+    in_binary_span,
+)
+from abstract_algebra.linear_algebra.solve_systems import (
+    solve_linear_system,
+    solve_linear_systems,
+)
+from abstract_algebra.linear_algebra.incremental_basis import IncrementalBasis
+from abstract_algebra.linear_algebra.decomposition_cache import (
+    decomposition_cache,
+    matrix_key,
+)
+from abstract_algebra.linear_algebra.kernels import GENERIC_KERNELS, kernels_for
+from abstract_algebra.linear_algebra.wiedemann import (
+    Wiedemann,
+    InconclusiveSystemError,
+    berlekamp_massey,
+)
+from abstract_algebra.linear_algebra import matrix_operations
+from abstract_algebra.linear_algebra import matrix_multiplication
+from abstract_algebra.linear_algebra import modular_arithmetic
+from abstract_algebra.linear_algebra.row_operations import (
+    RowOperationBuffer,
+    NumpyRowOperationBuffer,
+    PrimeFieldRowOperationBuffer,
+    new_row_operation_buffer,
+)
+
+# field factories for int entries, typed so that mypy accepts them in new_matrix/new_vector
+rational: Callable[[Any], Fraction[int]] = Fraction[int]
+
+fraction_matrix_values: List[Matrix[Fraction[int]]] = [
+    Matrix.new_matrix([[1, 2], [3, 4]], rational),
+    Matrix.new_matrix([[0, 2, 1], [1, 1, 0], [2, 0, 3]], rational),
+    Matrix.new_matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]], rational),
+    Matrix.new_matrix([[0, 1, 2], [0, 3, 4]], rational),
+    Matrix.new_matrix([[0, 0, 1], [0, 0, 2], [0, 0, 0]], rational),
+    Matrix.new_matrix([[1, 2], [2, 4], [3, 7]], rational),
+]
+
+
+@pytest.fixture(params=fraction_matrix_values)
+def parameter_fraction_matrix(request) -> Matrix[Fraction[int]]:
+    return request.param
+
+
+def test_pseudo_inverse_transforms_to_reduced_form(parameter_fraction_matrix):
+    gauss_jordan = GaussJordan(parameter_fraction_matrix)
+    result = gauss_jordan.pseudo_inverse @ parameter_fraction_matrix
+    assert (
+        result == gauss_jordan.reduced_row_echelon_form
+    ), f"E @ A doesn't match the reduced row echelon form: {parameter_fraction_matrix}"
+
+
+def test_fundamental_subspaces(parameter_fraction_matrix):
+    matrix = parameter_fraction_matrix
+    row_count, column_count = matrix.shape
+    subspaces = MatrixSubspaces(matrix)
+    assert sorted(subspaces.pivot_columns + subspaces.free_columns) == list(
+        range(column_count)
+    ), f"Pivot and free columns don't partition the columns: {matrix}"
+    assert (
+        subspaces.rank + subspaces.nullity == column_count
+    ), f"Rank-nullity fails: {matrix}"
+    assert (
+        len(subspaces.row_space) == subspaces.rank
+    ), f"Row space has the wrong dimension: {matrix}"
+    assert (
+        len(subspaces.left_null_space) == row_count - subspaces.rank
+    ), f"Left null space has the wrong dimension: {matrix}"
+    for vector in subspaces.null_space:
+        assert matrix @ vector == Vector.new_vector(
+            [0] * row_count, Fraction[int]
+        ), f"{vector} is not in the null space of {matrix}"
+    for vector in subspaces.left_null_space:
+        assert matrix.transpose() @ vector == Vector.new_vector(
+            [0] * column_count, Fraction[int]
+        ), f"{vector} is not in the left null space of {matrix}"
+    row_space_matrix = Matrix.new_matrix(subspaces.row_space)
+    assert (
+        MatrixSubspaces(row_space_matrix).null_space == subspaces.null_space
+    ), f"The row space doesn't span the rows of {matrix}"
+
+
+def test_reduced_row_echelon_form_is_reduced(parameter_fraction_matrix):
+    reduced = GaussJordan(parameter_fraction_matrix).reduced_row_echelon_form
+    zero = Fraction(0)
+    one = Fraction(1)
+    last_pivot = -1
+    for row in reduced:
+        nonzero = [j for j, entry in enumerate(row) if entry != zero]
+        if not nonzero:
+            last_pivot = reduced.shape[1]
+            continue
+        pivot = nonzero[0]
+        assert pivot > last_pivot, f"Pivots out of order in: {reduced}"
+        assert row[pivot] == one, f"Pivot isn't one in: {reduced}"
+        for other in reduced:
+            if other is not row:
+                assert other[pivot] == zero, f"Pivot column not cleared in: {reduced}"
+        last_pivot = pivot
+
+
+@pytest.mark.parametrize(
+    "matrix,expected",
+    [
+        (fraction_matrix_values[0], Fraction(-2)),
+        (fraction_matrix_values[1], Fraction(-8)),
+        (fraction_matrix_values[2], Fraction(0)),
+    ],
+)
+def test_determinant(matrix: Matrix, expected: Fraction):
+    result = GaussJordan(matrix).determinant
+    assert (
+        result == expected
+    ), f"Determinant of {matrix} is wrong. Expected: {expected}. Actual: {result}"
+
+
+def test_inverse():
+    matrix = fraction_matrix_values[1]
+    identity = matrix_operations.identity_matrix(3, Fraction(1))
+    inverse = GaussJordan(matrix).pseudo_inverse
+    assert inverse @ matrix == identity, f"Inverse is wrong for {matrix}: {inverse}"
+
+
+# Matrix[int] is outside of the FieldProtocol bound, so these are plain Matrix
+integer_matrix_values: List[Matrix] = [
+    Matrix.new_matrix([[1, 2], [3, 4]]),
+    Matrix.new_matrix([[0, 2, 1], [1, 1, 0], [2, 0, 3]]),
+    Matrix.new_matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]),
+    Matrix.new_matrix([[0, 1, 2], [0, 3, 4]]),
+    Matrix.new_matrix([[2, -3, 5, 7], [11, 4, -6, 1], [0, 9, 8, -2], [3, 3, 1, 5]]),
+]
+
+
+@pytest.mark.parametrize("matrix", integer_matrix_values)
+def test_bareiss_matches_gauss_jordan(matrix: Matrix):
+    bareiss = Bareiss(matrix)
+    gauss_jordan = GaussJordan(matrix.convert_to(rational))
+    expected_rank = len(gauss_jordan._pivot_columns)
+    assert (
+        bareiss.rank == expected_rank
+    ), f"Rank of {matrix} is wrong. Expected: {expected_rank}. Actual: {bareiss.rank}"
+    expected_determinant = gauss_jordan.determinant
+    assert (
+        Fraction(bareiss.determinant) == expected_determinant
+    ), f"Determinant of {matrix} is wrong. Expected: {expected_determinant}. Actual: {bareiss.determinant}"
+    assert all(
+        isinstance(entry, int) for row in bareiss.row_echelon_form for entry in row
+    ), f"Fraction-free elimination produced non integer entries: {bareiss.row_echelon_form}"
+
+
+def test_bareiss_gaussian_integer_determinant():
+    a, b, c, d = (
+        GaussianInteger(1, 2),
+        GaussianInteger(3, -1),
+        GaussianInteger(0, 4),
+        GaussianInteger(-2, 5),
+    )
+    matrix = Matrix.new_matrix([[a, b], [c, d]])
+    expected = a * d - b * c
+    result = Bareiss(matrix).determinant
+    assert (
+        result == expected
+    ), f"Determinant of {matrix} is wrong. Expected: {expected}. Actual: {result}"
+
+
+@pytest.mark.parametrize("matrix", fraction_matrix_values)
+def test_plu_factors(matrix: Matrix[Fraction[int]]):
+    plu = PLUDecomposition(matrix)
+    assert (
+        plu.permutation @ matrix == plu.lower @ plu.upper
+    ), f"PA != LU for {matrix}: P={plu.permutation} L={plu.lower} U={plu.upper}"
+
+
+@pytest.mark.parametrize("matrix", fraction_matrix_values)
+def test_plu_solve_matches_solve_linear_system(matrix: Matrix[Fraction[int]]):
+    plu = PLUDecomposition(matrix)
+    right_hand_sides = [
+        Vector.new_vector([i + 1 for i in range(matrix.shape[0])], rational),
+        matrix.transpose()[0],
+    ]
+    for b in right_hand_sides:
+        expected = solve_linear_system(matrix, b)
+        result = plu.solve(b)
+        assert (
+            result == expected
+        ), f"Solving {matrix} x = {b} failed. Expected: {expected}. Actual: {result}"
+    results = plu.solve_many(Matrix.new_matrix(right_hand_sides).transpose())
+    assert results == [
+        plu.solve(b) for b in right_hand_sides
+    ], f"solve_many doesn't match solve for {matrix}"
+
+
+@pytest.mark.parametrize("matrix", fraction_matrix_values)
+def test_solve_linear_systems_matches_single_solves(matrix: Matrix[Fraction[int]]):
+    right_hand_sides = [
+        Vector.new_vector([i + 1 for i in range(matrix.shape[0])], rational),
+        matrix.transpose()[-1],
+        Vector.new_vector([0 for i in range(matrix.shape[0])], rational),
+    ]
+    solutions, null_space = solve_linear_systems(
+        matrix, Matrix.new_matrix(right_hand_sides).transpose()
+    )
+    for b, solution in zip(right_hand_sides, solutions):
+        expected = solve_linear_system(matrix, b)
+        assert (
+            solution == expected
+        ), f"Solving {matrix} x = {b} failed. Expected: {expected}. Actual: {solution}"
+    expected_null_space = MatrixSubspaces(matrix).null_space
+    assert (
+        null_space == expected_null_space
+    ), f"Null space of {matrix} is wrong. Expected: {expected_null_space}. Actual: {null_space}"
+
+
+@pytest.mark.parametrize("matrix", fraction_matrix_values)
+def test_multi_modular_matches_gauss_jordan(matrix: Matrix[Fraction[int]]):
+    multi_modular = MultiModular(matrix)
+    gauss_jordan = GaussJordan(matrix)
+    assert (
+        multi_modular.determinant == gauss_jordan.determinant
+    ), f"Determinant of {matrix} is wrong. Expected: {gauss_jordan.determinant}. Actual: {multi_modular.determinant}"
+    assert multi_modular.rank == len(
+        gauss_jordan._pivot_columns
+    ), f"Rank of {matrix} is wrong: {multi_modular.rank}"
+    b = Vector.new_vector([i + 1 for i in range(matrix.shape[0])], rational)
+    expected = solve_linear_system(matrix, b)
+    result = multi_modular.solve(b)
+    assert (
+        result == expected
+    ), f"Solving {matrix} x = {b} failed. Expected: {expected}. Actual: {result}"
+
+
+@pytest.mark.parametrize("matrix", fraction_matrix_values)
+def test_dixon_matches_gauss_jordan(matrix: Matrix[Fraction[int]], monkeypatch):
+    monkeypatch.setattr(solve_systems, "DIXON_THRESHOLD", None)
+    b: Vector[Fraction[int]] = Vector.new_vector(
+        [Fraction(i + 1, i + 2) for i in range(matrix.shape[0])]
+    )
+    expected = solve_linear_system(matrix, b)
+    result = Dixon(matrix).solve(b)
+    if matrix.shape[0] != matrix.shape[1] or GaussJordan(matrix).determinant == 0:
+        assert result is None, f"Dixon solved the singular system {matrix} x = {b}"
+    else:
+        assert (
+            result == expected
+        ), f"Solving {matrix} x = {b} failed. Expected: {expected}. Actual: {result}"
+
+
+def test_dixon_solves_large_systems(monkeypatch):
+    n = 12
+    entries = [
+        [Fraction((7 * i * i + 3 * j + 1) % 23 - 11, (i + j) % 5 + 1) for j in range(n)]
+        for i in range(n)
+    ]
+    matrix = Matrix.new_matrix(entries)
+    b = Vector.new_vector([Fraction(10**12 + i, 3 + i) for i in range(n)])
+    solution = solve_linear_system(matrix, b)
+    assert matrix @ solution == b, f"Dixon didn't solve {matrix} x = {b}: {solution}"
+    monkeypatch.setattr(solve_systems, "DIXON_THRESHOLD", None)
+    assert solution == solve_linear_system(
+        matrix, b
+    ), f"Dixon and Gauss-Jordan solutions of {matrix} x = {b} differ"
+    singular = Matrix.new_matrix(entries[:-1] + [entries[0]])
+    assert Dixon(singular).solve(b) is None, f"Dixon solved the singular {singular}"
+
+
+def test_multi_modular_large_entries():
+    matrix = Matrix.new_matrix(
+        [
+            [Fraction(10**20 + 7, 3), Fraction(-(10**18), 7), Fraction(5)],
+            [Fraction(2, 10**15 + 1), Fraction(3**40), Fraction(-1, 2)],
+            [Fraction(7**30), Fraction(1, 11), Fraction(13, 17)],
+        ]
+    )
+    expected = GaussJordan(matrix).determinant
+    result = MultiModular(matrix).determinant
+    assert (
+        result == expected
+    ), f"Determinant of {matrix} is wrong. Expected: {expected}. Actual: {result}"
+    integer_matrix = integer_matrix_values[-1]
+    assert (
+        MultiModular(integer_matrix).determinant == Bareiss(integer_matrix).determinant
+    ), f"Determinant of {integer_matrix} doesn't match Bareiss"
+
+
+@pytest.mark.parametrize("matrix", fraction_matrix_values)
+def test_sparse_subspaces_match_matrix_subspaces(matrix: Matrix[Fraction[int]]):
+    sparse_matrix = SparseMatrix.from_matrix(matrix)
+    sparse_subspaces = SparseSubspaces(sparse_matrix)
+    matrix_subspaces = MatrixSubspaces(matrix)
+    assert (
+        sparse_subspaces.rank == matrix_subspaces.rank
+    ), f"Rank of {matrix} is wrong. Expected: {matrix_subspaces.rank}. Actual: {sparse_subspaces.rank}"
+    assert (
+        sparse_subspaces.nullity == matrix_subspaces.nullity
+    ), f"Nullity of {matrix} is wrong. Expected: {matrix_subspaces.nullity}. Actual: {sparse_subspaces.nullity}"
+    zero = Vector.new_vector([0 for i in range(matrix.shape[0])], rational)
+    for vector in sparse_subspaces.null_space:
+        assert matrix @ vector == zero, f"{vector} isn't in the null space of {matrix}"
+    assert (
+        MatrixSubspaces(
+            Matrix.new_matrix(sparse_subspaces.column_space).transpose()
+        ).rank
+        == matrix_subspaces.rank
+    ), f"Column space basis of {matrix} isn't independent"
+
+
+def test_sparse_subspaces_limit_fill_in():
+    size = 30
+    # an "arrow" matrix: eliminating the dense first row/column first fills everything in
+    entries = [(0, j, 1) for j in range(size)] + [(i, 0, 1) for i in range(size)]
+    entries += [(i, i, 2) for i in range(1, size)]
+    sparse_matrix = SparseMatrix.new_sparse_matrix(
+        (size, size), entries, 1, Fraction[int]
+    )
+    sparse_subspaces = SparseSubspaces(sparse_matrix)
+    assert sparse_subspaces.rank == size, f"Arrow matrix should have full rank"
+    reduced_rows = sparse_subspaces._pivots_and_reduced_rows[1]
+    assert (
+        sum(len(row) for row in reduced_rows) == size
+    ), f"Reducing an arrow matrix shouldn't create fill-in"
+
+
+@pytest.mark.parametrize("shape", [(5, 7, 3), (8, 8, 8), (9, 6, 11)])
+def test_strassen_matches_blocked_multiplication(shape):
+    n, k, m = shape
+    left = [[Fraction(i * k + j - 3, j + 1) for j in range(k)] for i in range(n)]
+    right = [[Fraction(i - 2 * j, i + j + 1) for j in range(m)] for i in range(k)]
+    zero = Fraction(0)
+    expected = matrix_multiplication.blocked_multiply(left, right, zero, block_size=2)
+    result = matrix_multiplication.strassen_multiply(
+        left, right, zero, strassen_threshold=2, block_size=2
+    )
+    assert result == expected, f"Strassen multiplication is wrong for shape {shape}"
+    naive = Matrix.new_matrix(
+        [
+            [sum((left[i][p] * right[p][j] for p in range(k)), zero) for j in range(m)]
+            for i in range(n)
+        ]
+    )
+    assert (
+        Matrix.new_matrix(left) @ Matrix.new_matrix(right) == naive
+    ), f"Matrix multiplication is wrong for shape {shape}"
+
+
+numpy_matrix_values: List[Matrix] = [
+    Matrix.new_matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 10.0]]),
+    Matrix.new_matrix([[0.0, 1.5, -2.0], [0.0, 3.0, 4.25]]),
+    Matrix.new_matrix([[2.0, 1.0], [4.0, 2.0], [1.0, 3.0]]),
+    Matrix.new_matrix(
+        [
+            [ComplexNumber(1.0, 1.0), ComplexNumber(-1.0, 0.0)],
+            [ComplexNumber(0.0, 1.0), ComplexNumber(2.0, -3.0)],
+        ]
+    ),
+]
+
+
+@pytest.mark.parametrize("matrix", numpy_matrix_values)
+def test_numpy_buffer_matches_python_buffer(matrix: Matrix):
+    numpy_buffer = new_row_operation_buffer(matrix)
+    assert isinstance(
+        numpy_buffer, NumpyRowOperationBuffer
+    ), f"Matrix[{matrix.field}] should use the numpy backend"
+    python_buffer = RowOperationBuffer.from_matrix(matrix)
+    for buffer in (numpy_buffer, python_buffer):
+        pivot_columns = buffer.forward_eliminate()
+        buffer.backward_eliminate(pivot_columns)
+        buffer.normalize_pivots(pivot_columns)
+    for result, expected in [
+        (numpy_buffer.to_matrix(), python_buffer.to_matrix()),
+        (numpy_buffer.transformation_matrix(), python_buffer.transformation_matrix()),
+    ]:
+        assert result.field == matrix.field, f"Backend changed the field: {result}"
+        for result_row, expected_row in zip(result, expected):
+            for x, y in zip(result_row, expected_row):
+                assert isclose(
+                    _distance(x, y), 0.0, abs_tol=1e-9
+                ), f"numpy and python reductions of {matrix} differ: {result} | {expected}"
+
+
+def _distance(x, y) -> float:
+    difference = x - y
+    if isinstance(difference, ComplexNumber):
+        return abs(complex(difference.real, difference.imaginary))
+    return abs(difference)
+
+
+@pytest.mark.parametrize("modulus", [2, 7, 2147483647])
+def test_prime_field_gauss_jordan(modulus: int):
+    field: Callable[[Any], PrimeFieldElement] = prime_field(modulus)
+    entries = [[3, 1, 4, 1], [5, 9, 2, 6], [5, 3, 5, 8], [9, 7, 9, 3]]
+    matrix = Matrix.new_matrix(entries, field)
+    numpy_buffer = new_row_operation_buffer(matrix)
+    assert isinstance(
+        numpy_buffer, PrimeFieldRowOperationBuffer
+    ), f"GF({modulus}) should use the numpy backend"
+    python_buffer = RowOperationBuffer.from_matrix(matrix)
+    for buffer in (numpy_buffer, python_buffer):
+        pivot_columns = buffer.forward_eliminate()
+        buffer.backward_eliminate(pivot_columns)
+        buffer.normalize_pivots(pivot_columns)
+    assert (
+        numpy_buffer.to_matrix() == python_buffer.to_matrix()
+    ), f"numpy and python reductions over GF({modulus}) differ"
+    assert (
+        numpy_buffer.transformation_matrix() == python_buffer.transformation_matrix()
+    ), f"numpy and python transformations over GF({modulus}) differ"
+
+    gauss_jordan = GaussJordan(matrix)
+    assert (
+        gauss_jordan.pseudo_inverse @ matrix == gauss_jordan.reduced_row_echelon_form
+    ), f"E @ A doesn't match the reduced row echelon form over GF({modulus})"
+    expected_determinant = PrimeFieldElement(
+        Bareiss(Matrix.new_matrix(entries)).determinant, modulus
+    )
+    assert (
+        gauss_jordan.determinant == expected_determinant
+    ), f"Determinant over GF({modulus}) is wrong: {gauss_jordan.determinant}"
+
+
+@pytest.mark.parametrize("modulus", [2147483659, 2305843009213693951])
+def test_large_prime_field_linear_algebra(modulus: int):
+    field: Callable[[Any], PrimeFieldElement] = prime_field(modulus)
+    entries = [[3, 1, 4, 1], [5, 9, 2, 6], [5, 3, 5, 8], [9, 7, 9, 3]]
+    matrix = Matrix.new_matrix(entries, field)
+    assert (
+        type(new_row_operation_buffer(matrix)) is RowOperationBuffer
+    ), f"GF({modulus}) is too large for the numpy backend"
+    integer_matrix: Matrix = Matrix.new_matrix(entries)
+    assert matrix @ matrix == Matrix.new_matrix(
+        [list(row) for row in integer_matrix @ integer_matrix], field
+    ), f"Matrix product over GF({modulus}) is wrong"
+    expected_determinant = PrimeFieldElement(
+        Bareiss(integer_matrix).determinant, modulus
+    )
+    assert (
+        GaussJordan(matrix).determinant == expected_determinant
+    ), f"Determinant over GF({modulus}) is wrong"
+    assert MatrixSubspaces(matrix).rank == 4, f"Rank over GF({modulus}) is wrong"
+
+
+@pytest.mark.parametrize("modulus", [3, 65537, 2147483647])
+def test_row_reduce_modulo_backends_agree(modulus: int):
+    rows = [[(7 * i + 3 * j * j - 11) ** 3 for j in range(9)] for i in range(6)]
+    for reduced in (False, True):
+        expected = modular_arithmetic.row_reduce_modulo(rows, modulus, reduced)
+        result = modular_arithmetic._row_reduce_modulo_numpy(rows, modulus, reduced)
+        assert (
+            result == expected
+        ), f"numpy reduction modulo {modulus} doesn't match the python reduction"
+
+
+binary_matrix_values = [
+    [[1, 0, 1], [0, 1, 1], [1, 1, 0]],
+    [[1, 1, 0, 1], [0, 0, 1, 1], [1, 1, 1, 0]],
+    [[0, 0], [0, 0]],
+    [[1, 0], [1, 1], [0, 1], [1, 0]],
+    [[0, 1, 1, 0, 1], [0, 1, 0, 1, 1]],
+]
+
+
+@pytest.mark.parametrize("entries", binary_matrix_values)
+def test_binary_subspaces_match_matrix_subspaces(entries):
+    binary_matrix = BinaryMatrix.new_binary_matrix(entries)
+    matrix = binary_matrix.to_matrix()
+    row_count, column_count = binary_matrix.shape
+    binary_subspaces = BinarySubspaces(binary_matrix)
+    subspaces = MatrixSubspaces(matrix)
+    assert [
+        unpack_vector(v, row_count) for v in binary_subspaces.column_space
+    ] == subspaces.column_space, f"Column spaces differ: {entries}"
+    assert [
+        unpack_vector(v, column_count) for v in binary_subspaces.null_space
+    ] == subspaces.null_space, f"Null spaces differ: {entries}"
+
+    for b in range(2**row_count):
+        solution = solve_binary_system(binary_matrix, b)
+        expected = solve_linear_system(matrix, unpack_vector(b, row_count))
+        if expected is None:
+            assert solution is None, f"{solution:b} can't solve {entries} x = {b:b}"
+        else:
+            assert (
+                unpack_vector(solution, column_count) == expected
+            ), f"Solutions of {entries} x = {b:b} differ"
+        assert in_binary_span(binary_subspaces.column_space, b) == (
+            expected is not None
+        ), f"Span membership of {b:b} is wrong for {entries}"
+
+
+@pytest.mark.parametrize("characteristic,degree", [(2, 4), (3, 2), (2, 8)])
+def test_galois_field_linear_algebra(characteristic: int, degree: int):
+    field = galois_field(characteristic, degree)
+    element: Callable[[Any], GaloisFieldElement] = field
+    values = [[3, 1, 4, 1], [5, 0, 2, 6], [5, 3, 5, 8], [1, 4, 6, 7]]
+    matrix = Matrix.new_matrix(
+        [[value % field.order for value in row] for row in values], element
+    )
+    gauss_jordan = GaussJordan(matrix)
+    assert (
+        gauss_jordan.pseudo_inverse @ matrix == gauss_jordan.reduced_row_echelon_form
+    ), f"E @ A doesn't match the reduced row echelon form over {field}"
+
+    singular_matrix: Matrix[GaloisFieldElement] = Matrix.new_matrix(
+        list(matrix.rows[:3]) + [(matrix[0] + matrix[1]).entries]
+    )
+    subspaces = MatrixSubspaces(singular_matrix)
+    assert subspaces.rank + subspaces.nullity == 4, f"Rank-nullity fails over {field}"
+    assert (
+        GaussJordan(singular_matrix).determinant == field.zero
+    ), f"Singular matrix has a nonzero determinant over {field}"
+    for vector in subspaces.null_space:
+        assert singular_matrix @ vector == Vector.new_vector(
+            [field.zero] * 4
+        ), f"{vector} is not in the null space over {field}"
+
+
+def test_galois_field_copy_and_pickle():
+    field = galois_field(2, 4)
+    assert (
+        galois_field(2, 4, [1, 1, 0, 0, 1]) is field
+    ), "A list polynomial isn't cached"
+    assert galois_field(2, 2, [1, 1, 1]) is galois_field(2, 2), "Fields aren't shared"
+    matrix = Matrix.new_matrix([[3, 1], [4, 15]], field)
+    assert copy.copy(field) is field, "copy made a new field"
+    assert copy.deepcopy(field) is field, "deepcopy made a new field"
+    assert pickle.loads(pickle.dumps(field)) is field, "pickle made a new field"
+    assert copy.deepcopy(matrix) == matrix, f"deepcopy changed {matrix}"
+    assert pickle.loads(pickle.dumps(matrix)) == matrix, f"pickle changed {matrix}"
+
+
+def test_decomposition_cache_shares_results():
+    limits = decomposition_cache.max_entries, decomposition_cache.max_weight
+    decomposition_cache.clear()
+    try:
+        entries = [[2, 1, 7], [1, 3, 5], [4, 1, 0]]
+        matrix = Matrix.new_matrix(entries, Fraction[int])
+        equal_matrix = Matrix.new_matrix(entries, Fraction[int])
+        reduced = GaussJordan(matrix).reduced_row_echelon_form
+        info = decomposition_cache.info()
+        assert info.hits == 0 and info.misses > 0, f"Unexpected statistics: {info}"
+        assert (
+            GaussJordan(equal_matrix).reduced_row_echelon_form is reduced
+        ), "An equal matrix didn't reuse the cached reduction"
+        assert (
+            decomposition_cache.info().hits == 1
+        ), f"Expected one hit: {decomposition_cache.info()}"
+
+        assert matrix_key(Matrix.new_matrix(entries, prime_field(5))) != matrix_key(
+            Matrix.new_matrix(entries, prime_field(7))
+        ), "Matrices over different fields share a key"
+        with validation_level(ValidationLevel.OFF):
+            mixed_matrix = Matrix.new_matrix_unchecked([[1, Fraction(1)]])
+        assert matrix_key(mixed_matrix) is None, "A matrix of mixed types has a key"
+
+        subspaces = MatrixSubspaces(equal_matrix)
+        subspaces.null_space.append(None)
+        assert (
+            MatrixSubspaces(matrix).null_space == []
+        ), "Mutating a null space changed the cached one"
+
+        decomposition_cache.resize(max_entries=2, max_weight=limits[1])
+        for k in range(4):
+            GaussJordan(
+                Matrix.new_matrix([[k + 1, 1], [0, 1]], Fraction[int])
+            ).determinant
+        info = decomposition_cache.info()
+        assert info.entries <= 2 and info.evictions > 0, f"Nothing evicted: {info}"
+        decomposition_cache.resize(max_entries=limits[0], max_weight=8)
+        assert decomposition_cache.info().weight <= 8, "The weight limit is ignored"
+    finally:
+        decomposition_cache.resize(*limits)
+        decomposition_cache.clear()
+
+
+def test_incremental_basis_matches_matrix_subspaces(parameter_fraction_matrix):
+    columns = list(parameter_fraction_matrix.transpose().rows)
+    dimension = parameter_fraction_matrix.shape[0]
+    incremental_basis = IncrementalBasis(dimension=dimension)
+    for k, column in enumerate(columns):
+        previous_rank = incremental_basis.rank
+        expected_rank = MatrixSubspaces(Matrix.new_matrix(columns[: k + 1])).rank
+        assert incremental_basis.add(column) == (
+            expected_rank > previous_rank
+        ), f"Adding {column} reported the wrong rank change"
+        assert (
+            incremental_basis.rank == expected_rank
+        ), f"Wrong rank after adding {column}"
+        assert column in incremental_basis, f"{column} was added but isn't contained"
+
+    for entries in itertools.product([0, 1, 2], repeat=dimension):
+        v = Vector.new_vector(entries, Fraction[int])
+        expected = solve_linear_system(parameter_fraction_matrix, v) is not None
+        assert (
+            incremental_basis.contains(v) == expected
+        ), f"Span membership of {v} is wrong"
+        coordinates = incremental_basis.coordinates(v)
+        if not expected:
+            assert coordinates is None, f"{v} isn't in the span but has coordinates"
+            continue
+        combination = functools.reduce(
+            lambda a, b: a + b,
+            [c * vector for c, vector in zip(coordinates, incremental_basis.basis)],
+        )
+        assert combination == v, f"The coordinates of {v} don't reproduce it"
+
+
+def _assert_matches_new_decomposition(updated: GaussJordan, description: str):
+    expected = GaussJordan(updated.base_matrix)
+    assert (
+        updated.reduced_row_echelon_form == expected.reduced_row_echelon_form
+    ), f"Reduced row echelon form is wrong after {description}"
+    assert (
+        updated.pseudo_inverse @ updated.base_matrix == updated.reduced_row_echelon_form
+    ), f"E @ A doesn't match the reduced row echelon form after {description}"
+    assert (
+        updated.determinant == expected.determinant
+    ), f"Determinant is wrong after {description}"
+
+
+def test_rank_one_updates(parameter_fraction_matrix):
+    matrix = parameter_fraction_matrix
+    row_count, column_count = matrix.shape
+    gauss_jordan = GaussJordan(matrix)
+    u = Vector.new_vector(range(1, row_count + 1), Fraction[int])
+    v = Vector.new_vector([(-1) ** k for k in range(column_count)], Fraction[int])
+    updated = gauss_jordan.rank_one_update(u, v)
+    assert updated.base_matrix == matrix + Matrix.new_matrix(
+        [[x * y for y in v] for x in u]
+    ), f"rank_one_update changed the wrong entries of {matrix}"
+    _assert_matches_new_decomposition(updated, f"a rank one update of {matrix}")
+
+    for i in range(row_count):
+        row = Vector.new_vector([i + k for k in range(column_count)], Fraction[int])
+        updated = gauss_jordan.replace_row(i, row)
+        assert updated.base_matrix[i] == row, f"Row {i} wasn't replaced in {matrix}"
+        _assert_matches_new_decomposition(updated, f"replacing row {i} of {matrix}")
+    updated = gauss_jordan.replace_column(0, u)
+    _assert_matches_new_decomposition(updated, f"replacing column 0 of {matrix}")
+    updated = gauss_jordan.replace_entry(-1, -1, Fraction(5))
+    assert updated.base_matrix[-1][-1] == Fraction(
+        5
+    ), f"Entry wasn't replaced in {matrix}"
+    _assert_matches_new_decomposition(updated, f"replacing an entry of {matrix}")
+
+
+def test_append_and_delete_rows(parameter_fraction_matrix):
+    matrix = parameter_fraction_matrix
+    row_count, column_count = matrix.shape
+    gauss_jordan = GaussJordan(matrix)
+    new_rows = [
+        Vector.new_vector([1] * column_count, Fraction[int]),
+        matrix[0] + matrix[-1],
+        Vector.new_vector([0] * (column_count - 1) + [3], Fraction[int]),
+    ]
+    for row in new_rows:
+        updated = gauss_jordan.append_row(row)
+        assert updated.base_matrix[-1] == row, f"{row} wasn't appended to {matrix}"
+        _assert_matches_new_decomposition(updated, f"appending {row} to {matrix}")
+    for i in range(row_count):
+        if row_count == 1:
+            break
+        updated = gauss_jordan.delete_row(i)
+        assert updated.base_matrix.shape == (row_count - 1, column_count)
+        _assert_matches_new_decomposition(updated, f"deleting row {i} of {matrix}")
+        restored = updated.append_row(matrix[i])
+        _assert_matches_new_decomposition(
+            restored, f"deleting and appending row {i} of {matrix}"
+        )
+
+
+def test_gauss_jordan_only_tracks_transformation_on_demand(parameter_fraction_matrix):
+    lazy = GaussJordan(parameter_fraction_matrix)
+    results = (
+        lazy.rank,
+        lazy.determinant,
+        lazy.row_echelon_form,
+        lazy.reduced_row_echelon_form,
+    )
+    assert not any(
+        "transformation" in name for name in vars(lazy)
+    ), f"Reading results without E tracked E: {parameter_fraction_matrix}"
+
+    tracked = GaussJordan(parameter_fraction_matrix)
+    tracked.pseudo_inverse
+    assert results == (
+        tracked.rank,
+        tracked.determinant,
+        tracked.row_echelon_form,
+        tracked.reduced_row_echelon_form,
+    ), f"Results with and without E differ: {parameter_fraction_matrix}"
+    assert (
+        lazy.pseudo_inverse @ parameter_fraction_matrix == lazy.reduced_row_echelon_form
+    ), f"E @ A doesn't match the reduced row echelon form: {parameter_fraction_matrix}"
+
+
+@pytest.mark.parametrize(
+    "x, y, factor",
+    [
+        (
+            [Fraction(1, 2), Fraction(-2, 3), Fraction(0), Fraction(5, 6)],
+            [Fraction(3, 4), Fraction(0), Fraction(7, 9), Fraction(-1, 6)],
+            Fraction(-3, 5),
+        ),
+        (
+            [PrimeFieldElement(k, 7) for k in [3, 1, 4, 1, 5]],
+            [PrimeFieldElement(k, 7) for k in [9, 2, 6, 5, 3]],
+            PrimeFieldElement(5, 7),
+        ),
+        ([0.5, -1.25, 3.0], [2.0, 0.1, -0.7], 1.5),
+        (
+            [ComplexNumber(1.0, 2.0), ComplexNumber(-0.5, 0.0)],
+            [ComplexNumber(0.0, -1.0), ComplexNumber(3.0, 4.0)],
+            ComplexNumber(2.0, -1.0),
+        ),
+    ],
+)
+def test_kernels_match_generic_kernels(x, y, factor):
+    kernels = kernels_for(type(factor))
+    assert (
+        kernels is not GENERIC_KERNELS
+    ), f"No kernels are registered for {type(factor)}"
+    results = [
+        ("dot", [kernels.dot(x, y)], [GENERIC_KERNELS.dot(x, y)]),
+        ("sum", [kernels.sum(x)], [GENERIC_KERNELS.sum(x)]),
+        ("axpy", kernels.axpy(factor, x, y), GENERIC_KERNELS.axpy(factor, x, y)),
+        ("scale", kernels.scale(factor, x), GENERIC_KERNELS.scale(factor, x)),
+    ]
+    for name, result, expected in results:
+        assert len(result) == len(expected) and all(
+            type(a) is type(b) and _agree(a, b) for a, b in zip(result, expected)
+        ), f"{name} kernel for {type(factor)} differs from the generic one: {result} | {expected}"
+    vector_x, vector_y = Vector.new_vector(x), Vector.new_vector(y)
+    assert all(
+        _agree(a, b)
+        for a, b in zip(vector_y + vector_x * factor, kernels.axpy(factor, x, y))
+    ), f"Vector arithmetic doesn't match the axpy kernel: {x} | {y}"
+
+
+def _agree(x, y) -> bool:
+    # floating point kernels may round differently from the generic ones
+    if isinstance(x, (float, ComplexNumber)):
+        return isclose(_distance(x, y), 0.0, abs_tol=1e-12)
+    return x == y
+
+
+def test_berlekamp_massey():
+    field = prime_field(7)
+    fibonacci = [field(0), field(1)]
+    for _ in range(8):
+        fibonacci.append(fibonacci[-1] + fibonacci[-2])
+    # s_(i+2) = s_(i+1) + s_i, i.e. f(λ) = λ^2 - λ - 1
+    assert berlekamp_massey(fibonacci) == [
+        field(6),
+        field(6),
+        field(1),
+    ], f"Wrong recurrence for the Fibonacci sequence mod 7"
+
+
+@pytest.mark.parametrize("modulus", [2, 101, 2147483647])
+def test_wiedemann_matches_solve_linear_system(modulus: int):
+    field: Callable[[Any], PrimeFieldElement] = prime_field(modulus)
+    size = 12
+    # unit diagonal and a few entries below it: nonsingular over every field
+    entries = [(i, i, 1) for i in range(size)]
+    entries += [(i, (5 * i + 1) % i, 3 * i + 2) for i in range(1, size)]
+    entries += [(i, i - 2, i) for i in range(2, size, 3)]
+    sparse_matrix = SparseMatrix.new_sparse_matrix((size, size), entries, 0, field)
+    matrix = sparse_matrix.to_matrix()
+    b = Vector.new_vector([(i * i + 3) % modulus for i in range(size)], field)
+    expected = solve_linear_system(matrix, b)
+    wiedemann_solvers = [
+        Wiedemann.from_matrix(matrix, seed=1),
+        Wiedemann.from_matrix(sparse_matrix, seed=2),
+        Wiedemann(
+            apply=lambda v: sparse_matrix @ v, dimension=size, zero=field(0), seed=3
+        ),
+    ]
+    for wiedemann in wiedemann_solvers:
+        assert (
+            wiedemann.solve(b) == expected
+        ), f"Wiedemann and Gauss-Jordan disagree over GF({modulus})"
+        assert (
+            wiedemann.null_space == []
+        ), f"Nonsingular matrix has a null space over GF({modulus})"
+
+
+@pytest.mark.parametrize("modulus", [3, 65521])
+def test_wiedemann_singular_systems(modulus: int):
+    field: Callable[[Any], PrimeFieldElement] = prime_field(modulus)
+    values = [[2, 1, 0, 1], [1, 1, 1, 0], [0, 2, 1, 4], [3, 2, 1, 1]]
+    # the last row is the sum of the first two
+    values.append([a + b for a, b in zip(values[0], values[1])])
+    values = [row + [i] for i, row in enumerate(values)]
+    matrix = Matrix.new_matrix(values, field)
+    wiedemann = Wiedemann.from_matrix(matrix, seed=5)
+    zero = Vector.new_vector([0] * 5, field)
+    [vector] = wiedemann.null_space
+    assert vector != zero, f"Null space vector is zero over GF({modulus})"
+    assert matrix @ vector == zero, f"{vector} is not in the null space"
+
+    inconsistent = Vector.new_vector([0, 0, 0, 0, 1], field)
+    assert (
+        wiedemann.solve(inconsistent) is None
+    ), f"Inconsistent system solved over GF({modulus})"
+    b = matrix @ Vector.new_vector([1, 0, 2, 0, 1], field)
+    solution, null_space = wiedemann.completely_solve(b)
+    assert (
+        solution is not None and matrix @ solution == b
+    ), f"{solution} doesn't solve A x = {b}"
+    assert null_space == [vector], f"completely_solve has a different null space"
+
+
+@pytest.mark.parametrize("modulus", [2, 5, 65521])
+def test_wiedemann_nilpotent_component(modulus: int):
+    field: Callable[[Any], PrimeFieldElement] = prime_field(modulus)
+    # A shifts e_(i+1) to e_i, so it is nilpotent and every b has a nilpotent component
+    matrix = Matrix.new_matrix(
+        [[1 if j == i + 1 else 0 for j in range(4)] for i in range(4)], field
+    )
+    consistent = Vector.new_vector([1, 0, 3, 0], field)
+    inconsistent = Vector.new_vector([0, 0, 0, 1], field)
+    wiedemann = Wiedemann.from_matrix(matrix, seed=7)
+    solution = wiedemann.solve(consistent)
+    assert (
+        solution is not None and matrix @ solution == consistent
+    ), f"{solution} doesn't solve A x = {consistent} over GF({modulus})"
+    assert (
+        wiedemann.solve(inconsistent) is None
+    ), f"Inconsistent system solved over GF({modulus})"
+
+    black_box = Wiedemann(apply=matrix.__matmul__, dimension=4, zero=field(0))
+    for b in [consistent, inconsistent]:
+        with pytest.raises(InconclusiveSystemError):
+            black_box.solve(b)
+
+
+def test_wiedemann_galois_field():
+    field = galois_field(2, 3)
+    values = [[3, 1, 4, 1], [5, 0, 2, 6], [5, 3, 5, 7], [1, 4, 6, 7]]
+    matrix = Matrix.new_matrix(values, field)
+    b = Vector.new_vector([1, 2, 3, 4], field)
+    solution = Wiedemann.from_matrix(matrix, seed=0).solve(b)
+    assert solution == solve_linear_system(
+        matrix, b
+    ), f"Wiedemann and Gauss-Jordan disagree over {field}"